@@ -11,20 +11,55 @@ import threading
 import queue
 import os
 import time
-import pickle
 import glob
 import signal
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.calibration_store import CalibrationData, save_calibration, calibration_store, CALIBRATION_FILE
+from aruco_mission.calibration_corners import (extract_corners, extract_charuco_corners, CORNER_CACHE_FILE,
+                                               CHARUCO_BOARD, charuco_board, detect_charuco, charuco_object_points,
+                                               chessboard_precheck)
+from aruco_mission.incremental_calibration import IncrementalCalibrator
+
+class CaptureSession:
+    def __init__(self, calibrator, required_images, capture_interval=2.0):
+        """Önizleme ve tespit thread'leri arasında paylaşılan çekim durumu"""
+        self.calibrator = calibrator
+        self.required_images = required_images
+        self.capture_interval = capture_interval
+        self.captured_images = []
+        self.shot_index = 0  # Dosya adı sayacı (atılan görünümler listeden çıkar)
+        self.last_capture_time = 0
+        self.detection = None  # (zaman, köşeler, ID'ler, pozisyon bilgisi) - son tespit
+        self.detection_ms = 0.0
+    
+    @property
+    def done(self):
+        return len(self.captured_images) >= self.required_images or self.calibrator.converged
+
 
 class AutoCameraCalibration:
-    def __init__(self):
-        """Otomatik kamera kalibrasyonu sistemi - DICT_4X4_50 için"""
+    def __init__(self, pattern="chessboard"):
+        """Otomatik kamera kalibrasyonu sistemi - DICT_4X4_50 için
+        
+        pattern: "chessboard" (9x6 satranç tahtası) veya "charuco" (kısmi görünümleri de kabul eder)
+        """
         print("🤖 Otomatik Kamera Kalibrasyonu Sistemi")
         print("🎯 ArUco DICT_4X4_50 için optimize edildi")
         
+        if pattern not in ("chessboard", "charuco"):
+            raise ValueError(f"Bilinmeyen kalibrasyon deseni: {pattern}")
+        self.pattern = pattern
+        self.pattern_title = "ChArUco tahtası" if pattern == "charuco" else "Satranç tahtası"
+        self.pattern_name = "CHARUCO TAHTASI" if pattern == "charuco" else "SATRANÇ TAHTASI"  # Ekran yazısı
+        
         # Satranç tahtası ayarları
         self.chessboard_size = (9, 6)  # İç köşe sayısı
         self.square_size = 0.025  # Her karenin boyutu (2.5cm)
         
+        # ChArUco tahtası ayarları (DICT_4X4_50 marker'ları ile): (kare sayısı), kare ve marker kenarı (m)
+        self.charuco_board_spec = CHARUCO_BOARD
+        
         # ArUco ayarları - DICT_4X4_50
         self.aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
         print("📋 ArUco Sözlük: DICT_4X4_50 (4x4 bit, 50 marker)")
@@ -37,16 +72,24 @@ class AutoCameraCalibration:
         self.process = None
         self.running = False
         self.frame_queue = queue.Queue(maxsize=5)
+        self.detection_queue = queue.Queue(maxsize=1)  # Tespit thread'ine en son frame
         
         # Satranç tahtası tespiti için
         self.detection_criteria = cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER
         self.detection_params = (30, 0.001)
+        self.corner_workers = None  # Köşe çıkarma süreç sayısı (None = çekirdek sayısı)
+        
+        # Artımlı kalibrasyon: ilk kalibrasyon için görünüm sayısı, en fazla çekim
+        self.min_views = 10
+        self.max_views = 30
+        self.session_calibrator = None  # Son çekim oturumunun artımlı kalibratörü
         
         # 3D nokta koordinatları
         self.objp = np.zeros((self.chessboard_size[0] * self.chessboard_size[1], 3), np.float32)
         self.objp[:, :2] = np.mgrid[0:self.chessboard_size[0], 0:self.chessboard_size[1]].T.reshape(-1, 2)
         self.objp *= self.square_size
         
+        print(f"📋 Kalibrasyon deseni: {self.pattern_title}")
         print("✅ Kalibrasyon sistemi hazır!")
     
     def create_test_aruco_markers(self):
@@ -111,6 +154,41 @@ class AutoCameraCalibration:
         print("📋 Bu dosyayı yazdırın ve düz bir yüzeye yapıştırın")
         return filename
     
+    def create_charuco_pattern(self):
+        """ChArUco tahtası deseni oluştur (DICT_4X4_50)"""
+        print("\n🏁 ChArUco Tahtası Deseni Oluşturuluyor...")
+        
+        (squares_x, squares_y), square_length, marker_length = self.charuco_board_spec
+        board_image = charuco_board(self.charuco_board_spec).generateImage(
+            (squares_x * 100, squares_y * 100), marginSize=50
+        )
+        
+        filename = f'charuco_{squares_x}x{squares_y}.png'
+        cv2.imwrite(filename, board_image)
+        
+        print(f"✅ ChArUco tahtası kaydedildi: {filename}")
+        print(f"📋 Yazdırdıktan sonra kare kenarı {square_length * 100:.1f}cm, "
+              f"marker kenarı {marker_length * 100:.1f}cm olmalı")
+        return filename
+    
+    def detect_pattern(self, gray):
+        """Desen köşeleri: (köşeler, ChArUco köşe ID'leri veya None); bulunamazsa (None, None)
+        
+        Satranç tahtası: önce küçültülmüş görüntüde hızlı kontrol (veya satranç köşesi sayısı), geçerse tam çözünürlükte tespit
+        """
+        if self.pattern == "charuco":
+            return detect_charuco(gray, self.charuco_board_spec)
+        if not chessboard_precheck(gray, self.chessboard_size):
+            return None, None
+        ret, corners = cv2.findChessboardCorners(gray, self.chessboard_size, None)
+        return (corners, None) if ret else (None, None)
+    
+    def view_object_points(self, ids):
+        """Görünümün 3D noktaları; satranç tahtasında None (tüm tahta)"""
+        if ids is None:
+            return None
+        return charuco_object_points(ids, self.charuco_board_spec)
+    
     def start_camera_stream(self, width=640, height=480, fps=15):
         """Kamera stream başlat (kalibrasyon için daha düşük FPS)"""
         print(f"\n📹 Kalibrasyon Kamerası Başlatılıyor:")
@@ -200,8 +278,113 @@ class AutoCameraCalibration:
             if os.path.exists(pipe_path):
                 os.remove(pipe_path)
     
+    def analyze_board_position(self, corners, ids, frame_shape):
+        """Tahtanın görüntüdeki yeri, mesafesi ve eğimi (kullanıcı yönlendirmesi için)"""
+        corner_positions = corners.reshape(-1, 2)
+        center_x = np.mean(corner_positions[:, 0])
+        center_y = np.mean(corner_positions[:, 1])
+        
+        # Kameraya göre pozisyon
+        frame_center_x = frame_shape[1] / 2
+        frame_center_y = frame_shape[0] / 2
+        
+        # Pozisyon kategorisi
+        pos_x = "MERKEZ"
+        if center_x < frame_center_x * 0.7:
+            pos_x = "SOL"
+        elif center_x > frame_center_x * 1.3:
+            pos_x = "SAĞ"
+            
+        pos_y = "MERKEZ" 
+        if center_y < frame_center_y * 0.7:
+            pos_y = "ÜST"
+        elif center_y > frame_center_y * 1.3:
+            pos_y = "ALT"
+        
+        # Mesafe tahmini (köşe alanından)
+        corner_area = cv2.contourArea(corner_positions if ids is None
+                                      else cv2.convexHull(corner_positions))
+        if corner_area > 50000:
+            distance = "YAKIN"
+        elif corner_area > 20000:
+            distance = "ORTA"
+        else:
+            distance = "UZAK"
+        
+        # Eğim analizi (perspektif)
+        corner_rect = cv2.minAreaRect(corner_positions)
+        angle = abs(corner_rect[2])
+        if angle > 30:
+            tilt = "ÇOK EĞİK"
+        elif angle > 15:
+            tilt = "EĞİK"
+        else:
+            tilt = "DÜZ"
+        
+        return pos_x, pos_y, distance, tilt
+    
+    def capture_view(self, session, frame, gray, corners, ids, position):
+        """Tespit edilen görünümü kaydet ve artımlı kalibrasyona ekle (tespit thread'inde)"""
+        # Alt-piksel hassasiyeti (ChArUco köşeleri detectBoard'da zaten iyileştirilir)
+        if ids is None:
+            corners = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), 
+                                       (self.detection_criteria, *self.detection_params))
+        
+        # Fotoğrafı kaydet
+        image_path = os.path.join(self.calibration_folder, f'calibration_{session.shot_index:02d}.jpg')
+        cv2.imwrite(image_path, frame)
+        session.shot_index += 1
+        session.last_capture_time = time.time()
+        
+        pos_x, pos_y, distance, tilt = position
+        print(f"   📸 Fotoğraf {len(session.captured_images) + 1}/{session.required_images}: "
+              f"{pos_x}-{pos_y}, {distance}, {tilt}")
+        
+        # Artımlı kalibrasyon: aykırı görünümlerin fotoğrafları silinir
+        calibrator = session.calibrator
+        calibrator.add_view(corners, key=image_path, object_points=self.view_object_points(ids))
+        session.captured_images = [view.key for view in calibrator.views]
+        for rejected_path, _ in calibrator.rejected:
+            if os.path.exists(rejected_path):
+                os.remove(rejected_path)
+        if calibrator.rms is not None:
+            print(f"      📐 RMS: {calibrator.rms:.3f} px, "
+                  f"görünüm hatası: {calibrator.view_errors.get(image_path, float('nan')):.3f} px")
+        if calibrator.converged:
+            print("   ✅ Kalibrasyon oturdu - çekim tamamlandı")
+    
+    def detection_thread(self, session):
+        """Desen tespiti + otomatik çekim thread'i: önizleme bu thread'i beklemez"""
+        while self.running and not session.done:
+            try:
+                frame = self.detection_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            try:
+                start_time = time.time()
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                corners, ids = self.detect_pattern(gray)
+                session.detection_ms = (time.time() - start_time) * 1000
+                
+                if corners is None:
+                    session.detection = (start_time, None, None, None)
+                    continue
+                
+                position = self.analyze_board_position(corners, ids, frame.shape)
+                session.detection = (start_time, corners, ids, position)
+                
+                # Otomatik çekim zamanı geldi mi?
+                if start_time - session.last_capture_time > session.capture_interval:
+                    self.capture_view(session, frame, gray, corners, ids, position)
+            except Exception as e:
+                print(f"   ⚠️  Tespit hatası: {e}")
+    
     def auto_capture_calibration_images(self):
-        """Otomatik kalibrasyon fotoğrafları çek"""
+        """Otomatik kalibrasyon fotoğrafları çek
+        
+        Önizleme kamera hızında çalışır; tespit ve kalibrasyon ayrı thread'de en son frame üzerinde
+        """
         print(f"\n📸 Otomatik Kalibrasyon Fotoğrafları:")
         print("🎯 İDEAL KALİBRASYON İÇİN:")
         print("📋 Satranç tahtasını EĞİK tutun (dümdüz DEĞİL!)")
@@ -230,93 +413,58 @@ class AutoCameraCalibration:
         # OpenCV penceresi
         cv2.namedWindow('Kalibrasyon - Satranç Tahtası', cv2.WINDOW_AUTOSIZE)
         
-        captured_images = []
-        last_capture_time = 0
-        capture_interval = 2.0  # 2 saniyede bir otomatik çekim
-        required_images = 20
+        calibrator = IncrementalCalibrator(self.objp if self.pattern == "chessboard" else None,
+                                           (640, 480), min_views=self.min_views)
+        session = CaptureSession(calibrator, self.max_views, capture_interval=2.0)
+        self.session_calibrator = calibrator
+        required_images = session.required_images
+        
+        # Tespit thread'i (önizlemeden bağımsız)
+        detect_thread = threading.Thread(target=self.detection_thread, args=(session,))
+        detect_thread.daemon = True
+        detect_thread.start()
         
-        print(f"\n🎯 Hedef: {required_images} farklı açıdan fotoğraf")
+        print(f"\n🎯 Hedef: en az {self.min_views}, en fazla {required_images} farklı açıdan fotoğraf")
+        print("📋 Kalibrasyon oturunca çekim otomatik biter")
         print("🔄 Otomatik çekim başladı...")
         
         try:
-            while len(captured_images) < required_images:
+            while not session.done:
                 try:
                     frame = self.frame_queue.get(timeout=0.1)
                     current_time = time.time()
                     
-                    # Frame kopyası
+                    # En son frame'i tespite ver (tespit meşgulse eski frame atılır)
+                    try:
+                        self.detection_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self.detection_queue.put(frame)
+                    
+                    # Frame kopyası (tespit thread'i orijinali okuyor)
                     display_frame = frame.copy()
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
                     
-                    # Satranç tahtası tespit et
-                    ret, corners = cv2.findChessboardCorners(gray, self.chessboard_size, None)
+                    # Son tespit sonucu (birkaç frame eski olabilir)
+                    detection = session.detection
+                    ret = (detection is not None and detection[1] is not None
+                           and current_time - detection[0] < 0.5)
                     
                     if ret:
-                        # Köşeleri çiz
-                        cv2.drawChessboardCorners(display_frame, self.chessboard_size, corners, ret)
-                        
-                        # Pozisyon analizi
-                        corner_positions = corners.reshape(-1, 2)
-                        center_x = np.mean(corner_positions[:, 0])
-                        center_y = np.mean(corner_positions[:, 1])
-                        
-                        # Kameraya göre pozisyon
-                        frame_center_x = display_frame.shape[1] / 2
-                        frame_center_y = display_frame.shape[0] / 2
+                        _, corners, ids, (pos_x, pos_y, distance, tilt) = detection
                         
-                        # Pozisyon kategorisi
-                        pos_x = "MERKEZ"
-                        if center_x < frame_center_x * 0.7:
-                            pos_x = "SOL"
-                        elif center_x > frame_center_x * 1.3:
-                            pos_x = "SAĞ"
-                            
-                        pos_y = "MERKEZ" 
-                        if center_y < frame_center_y * 0.7:
-                            pos_y = "ÜST"
-                        elif center_y > frame_center_y * 1.3:
-                            pos_y = "ALT"
-                        
-                        # Mesafe tahmini (köşe alanından)
-                        corner_area = cv2.contourArea(corner_positions)
-                        if corner_area > 50000:
-                            distance = "YAKIN"
-                        elif corner_area > 20000:
-                            distance = "ORTA"
-                        else:
-                            distance = "UZAK"
-                        
-                        # Eğim analizi (perspektif)
-                        corner_rect = cv2.minAreaRect(corner_positions)
-                        angle = abs(corner_rect[2])
-                        if angle > 30:
-                            tilt = "ÇOK EĞİK"
-                        elif angle > 15:
-                            tilt = "EĞİK"
+                        # Köşeleri çiz
+                        if ids is None:
+                            cv2.drawChessboardCorners(display_frame, self.chessboard_size, corners, ret)
                         else:
-                            tilt = "DÜZ"
+                            cv2.aruco.drawDetectedCornersCharuco(display_frame, corners, ids)
                         
-                        # Otomatik çekim zamanı geldi mi?
-                        if current_time - last_capture_time > capture_interval:
-                            # Alt-piksel hassasiyeti
-                            corners2 = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), 
-                                                      (self.detection_criteria, *self.detection_params))
-                            
-                            # Fotoğrafı kaydet
-                            image_path = os.path.join(self.calibration_folder, f'calibration_{len(captured_images):02d}.jpg')
-                            cv2.imwrite(image_path, frame)
-                            captured_images.append(image_path)
-                            last_capture_time = current_time
-                            
-                            position_info = f"{pos_x}-{pos_y}, {distance}, {tilt}"
-                            print(f"   📸 Fotoğraf {len(captured_images)}/{required_images}: {position_info}")
-                            
-                            # Görsel geri bildirim
-                            cv2.putText(display_frame, f"ÇEKILDI! {len(captured_images)}/{required_images}", 
+                        # Görsel geri bildirim
+                        if current_time - session.last_capture_time < 0.5:
+                            cv2.putText(display_frame, f"ÇEKILDI! {len(session.captured_images)}/{required_images}", 
                                       (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 3)
                         
                         # Tespit durumu ve pozisyon bilgisi
-                        cv2.putText(display_frame, "SATRANÇ TAHTASI BULUNDU", 
+                        cv2.putText(display_frame, f"{self.pattern_name} BULUNDU", 
                                   (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
                         
                         # Pozisyon bilgisi
@@ -336,17 +484,22 @@ class AutoCameraCalibration:
                                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
                     else:
                         # Tespit yok
-                        cv2.putText(display_frame, "SATRANÇ TAHTASI ARAMASINDA...", 
+                        cv2.putText(display_frame, f"{self.pattern_name} ARAMASINDA...", 
                                   (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
                     
                     # İlerleme göster
-                    progress_text = f"Fotoğraf: {len(captured_images)}/{required_images}"
+                    progress_text = f"Fotoğraf: {len(session.captured_images)}/{required_images}"
+                    if calibrator.rms is not None:
+                        progress_text += f" | RMS: {calibrator.rms:.3f}px"
                     cv2.putText(display_frame, progress_text, 
                               (10, display_frame.shape[0] - 20), 
                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+                    cv2.putText(display_frame, f"Tespit: {session.detection_ms:.0f}ms", 
+                              (display_frame.shape[1] - 150, 30), 
+                              cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
                     
                     # Kalan süre
-                    time_until_next = max(0, capture_interval - (current_time - last_capture_time))
+                    time_until_next = max(0, session.capture_interval - (current_time - session.last_capture_time))
                     if ret and time_until_next > 0:
                         cv2.putText(display_frame, f"Sonraki çekim: {time_until_next:.1f}s", 
                                   (10, display_frame.shape[0] - 50), 
@@ -381,71 +534,81 @@ class AutoCameraCalibration:
         finally:
             cv2.destroyAllWindows()
             self.stop_stream()
+            # Süren kalibrasyonun bitmesini bekle (fotoğraf listesi tutarlı olsun)
+            detect_thread.join(timeout=3)
         
+        captured_images = session.captured_images
         print(f"\n✅ {len(captured_images)} fotoğraf çekildi!")
         return captured_images
     
+    
     def calibrate_from_captured_images(self, image_paths):
         """Çekilen fotoğraflardan kalibrasyou yap"""
-        if len(image_paths) < 10:
-            print(f"⚠️  Sadece {len(image_paths)} fotoğraf! En az 10 gerekli")
+        if len(image_paths) < self.min_views:
+            print(f"⚠️  Sadece {len(image_paths)} fotoğraf! En az {self.min_views} gerekli")
             return None, None
         
         print(f"\n🔧 {len(image_paths)} fotoğraf ile kalibrasyon yapılıyor...")
         
-        objpoints = []  # 3D noktalar
-        imgpoints = []  # 2D noktalar
-        
-        valid_images = 0
-        for image_path in image_paths:
-            img = cv2.imread(image_path)
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            
-            # Satranç tahtası köşelerini bul
-            ret, corners = cv2.findChessboardCorners(gray, self.chessboard_size, None)
-            
-            if ret:
-                valid_images += 1
-                objpoints.append(self.objp)
-                
-                # Alt-piksel hassasiyeti
-                corners2 = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), 
-                                          (self.detection_criteria, *self.detection_params))
-                imgpoints.append(corners2)
-        
-        print(f"📊 {valid_images}/{len(image_paths)} fotoğraf kullanılabilir")
-        
-        if valid_images < 10:
+        # Köşe çıkarma süreç havuzunda; daha önce işlenen fotoğraflar önbellekten gelir
+        start_time = time.time()
+        cache_path = os.path.join(self.calibration_folder, CORNER_CACHE_FILE)
+        if self.pattern == "charuco":
+            results, processed = extract_charuco_corners(
+                image_paths, self.charuco_board_spec, workers=self.corner_workers, cache_path=cache_path
+            )
+        else:
+            results, processed = extract_corners(
+                image_paths, self.chessboard_size, (self.detection_criteria, *self.detection_params),
+                workers=self.corner_workers, cache_path=cache_path
+            )
+            results = [(path, corners, None, size) for path, corners, size in results]
+        print(f"⚡ Köşe çıkarma: {time.time() - start_time:.2f}s "
+              f"({processed} yeni, {len(image_paths) - processed} önbellekten)")
+        
+        valid_images = [result for result in results if result[1] is not None]
+        img_shape = valid_images[0][3] if valid_images else None
+        calibrator = IncrementalCalibrator(self.objp if self.pattern == "chessboard" else None,
+                                           img_shape or (640, 480), min_views=self.min_views)
+        for image_path, corners, ids, image_size in valid_images:
+            if image_size != img_shape:
+                print(f"⚠️  {image_path} farklı çözünürlükte ({image_size}), atlandı")
+                continue
+            calibrator.add_view(corners, key=image_path, recalibrate=False,
+                                object_points=self.view_object_points(ids))
+        
+        print(f"📊 {len(calibrator.views)}/{len(image_paths)} fotoğraf kullanılabilir")
+        
+        if len(calibrator.views) < self.min_views:
             print("❌ Yeterli geçerli fotoğraf yok!")
             return None, None
         
-        # Kamera kalibrasyonu
-        img_shape = gray.shape[::-1]
-        ret, camera_matrix, dist_coeffs, rvecs, tvecs = cv2.calibrateCamera(
-            objpoints, imgpoints, img_shape, None, None
-        )
+        # Kamera kalibrasyonu (aykırı görünümler atılarak)
+        if calibrator.calibrate() is None:
+            print("❌ Kalibrasyon başarısız!")
+            return None, None
+        return self.save_calibrator_result(calibrator)
+    
+    def save_calibrator_result(self, calibrator):
+        """Kalibratörün sonucunu (matris, distorsiyon, RMS) yeniden hesaplamadan kaydet"""
+        ret, camera_matrix, dist_coeffs = calibrator.rms, calibrator.camera_matrix, calibrator.dist_coeffs
+        img_shape = calibrator.image_size
         
         if ret:
+            print(f"📊 RMS: {ret:.3f} px ({len(calibrator.views)} görünüm, {len(calibrator.rejected)} atıldı)")
+            for image_path, error in sorted(calibrator.view_errors.items(), key=lambda item: -item[1])[:3]:
+                print(f"   En yüksek görünüm hatası: {os.path.basename(image_path)} {error:.3f} px")
             print("✅ Kalibrasyon başarılı!")
             print(f"📐 Kamera Matrisi:")
             print(camera_matrix)
             print(f"🔍 Distorsiyon Katsayıları:")
             print(dist_coeffs)
             
-            # Kalibrasyonu kaydet
-            calibration_data = {
-                'camera_matrix': camera_matrix,
-                'dist_coeffs': dist_coeffs,
-                'rvecs': rvecs,
-                'tvecs': tvecs,
-                'image_shape': img_shape,
-                'calibration_error': ret
-            }
-            
-            with open('camera_calibration.pkl', 'wb') as f:
-                pickle.dump(calibration_data, f)
+            # Kalibrasyonu kaydet (sürümlü .npz, çözünürlük bilgisiyle)
+            save_calibration(CALIBRATION_FILE, CalibrationData(camera_matrix, dist_coeffs, img_shape, ret))
+            calibration_store.invalidate()
             
-            print("💾 Kalibrasyon kaydedildi: camera_calibration.pkl")
+            print(f"💾 Kalibrasyon kaydedildi: {CALIBRATION_FILE}")
             
             # realtime_camera_viewer.py'ye entegrasyon kodu göster
             self.show_integration_code(camera_matrix, dist_coeffs)
@@ -482,11 +645,12 @@ class AutoCameraCalibration:
                     pass
         
         # Queue temizle
-        while not self.frame_queue.empty():
-            try:
-                self.frame_queue.get_nowait()
-            except queue.Empty:
-                break
+        for frame_queue in (self.frame_queue, self.detection_queue):
+            while not frame_queue.empty():
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    break
 
 
 def main():
@@ -494,17 +658,21 @@ def main():
     print("🎯 ArUco DICT_4X4_50 için Optimize")
     print("=" * 50)
     
-    calibrator = AutoCameraCalibration()
+    # ChArUco modu: python3 auto_camera_calibration.py --charuco
+    calibrator = AutoCameraCalibration("charuco" if "--charuco" in sys.argv[1:] else "chessboard")
     
     print("\n🎯 Adımlar:")
-    print("1️⃣ Satranç tahtası deseni oluştur")
+    print(f"1️⃣ {calibrator.pattern_title} deseni oluştur")
     print("2️⃣ DICT_4X4_50 test marker'ları oluştur")
     print("3️⃣ Otomatik kalibrasyon fotoğrafları çek")
     print("4️⃣ Kalibrasyonu hesapla")
     print("5️⃣ realtime_camera_viewer.py otomatik güncelle")
     
-    # Satranç tahtası oluştur
-    chessboard_file = calibrator.create_chessboard_pattern()
+    # Kalibrasyon deseni oluştur
+    if calibrator.pattern == "charuco":
+        chessboard_file = calibrator.create_charuco_pattern()
+    else:
+        chessboard_file = calibrator.create_chessboard_pattern()
     
     # ArUco test marker'ları oluştur
     marker_files = calibrator.create_test_aruco_markers()
@@ -520,20 +688,26 @@ def main():
     # Otomatik fotoğraf çekimi
     image_paths = calibrator.auto_capture_calibration_images()
     
-    if len(image_paths) >= 10:
-        # Kalibrasyonu hesapla
+    session_calibrator = calibrator.session_calibrator
+    if session_calibrator is not None and session_calibrator.converged:
+        # Çekim sırasında oturan kalibrasyon doğrudan kaydedilir (köşe çıkarma ve toplu kalibrasyon tekrarlanmaz)
+        print("\n✅ Çekim sırasında kalibrasyon oturdu - sonuç doğrudan kaydediliyor")
+        camera_matrix, dist_coeffs = calibrator.save_calibrator_result(session_calibrator)
+    elif len(image_paths) >= calibrator.min_views:
+        # Oturum oturmadı (ESC veya en fazla çekim): fotoğraflardan toplu kalibrasyon
         camera_matrix, dist_coeffs = calibrator.calibrate_from_captured_images(image_paths)
-        
-        if camera_matrix is not None:
-            print("\n🎉 Kalibrasyon tamamlandı!")
-            
-            # realtime_camera_viewer.py'yi otomatik güncelle
-            update_realtime_viewer_for_4x4_50(camera_matrix, dist_coeffs)
-            
-        else:
-            print("\n❌ Kalibrasyon başarısız!")
     else:
         print(f"\n⚠️  Yeterli fotoğraf alınamadı: {len(image_paths)}")
+        return
+    
+    if camera_matrix is not None:
+        print("\n🎉 Kalibrasyon tamamlandı!")
+        
+        # realtime_camera_viewer.py'yi otomatik güncelle
+        update_realtime_viewer_for_4x4_50(camera_matrix, dist_coeffs)
+        
+    else:
+        print("\n❌ Kalibrasyon başarısız!")
 
 
 def update_realtime_viewer_for_4x4_50(camera_matrix, dist_coeffs):
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Kalibrasyon Fotoğraflarından Paralel Satranç Tahtası / ChArUco Köşe Çıkarma
+findChessboardCorners + cornerSubPix (veya CharucoDetector) süreç havuzunda çalışır
+Sonuçlar dosya içeriğinin hash'iyle önbelleklenir: yeni fotoğraf eklenince sadece o işlenir
+ChArUco tahtası kısmen görünse de köşe verir (köşe ID'leriyle)
+"""
+
+import concurrent.futures
+import functools
+import hashlib
+import json
+import multiprocessing
+import os
+import cv2
+import numpy as np
+
+CORNER_CACHE_FILE = ".corner_cache.json"
+CACHE_VERSION = 1
+
+# ChArUco tahtası: (kare sayısı x, y), kare kenarı (m), marker kenarı (m) - DICT_4X4_50 ile
+CHARUCO_BOARD = ((7, 5), 0.03, 0.022)
+CHARUCO_MIN_CORNERS = 6  # Görünüm için en az köşe (calibrateCamera en az 4 ister)
+PRECHECK_WIDTH = 320  # Canlı ön kontrol genişliği (piksel)
+X_CORNER_CONTRAST = 60.0  # Satranç köşesi yanıt eşiği (gri seviye); bulanık doku/gürültü altında kalır
+
+
+def image_hash(path):
+    """Dosya içeriğinin SHA-1'i (isim/tarih değişse de aynı fotoğraf aynı anahtar)"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def checkerboard_corner_count(gray, contrast=X_CORNER_CONTRAST, radius=2):
+    """Satranç köşesine (X) benzeyen nokta sayısı: çapraz çeyreklerin ortalama farkı, yerel maksimumlar
+
+    Düz kenarlarda yanıt 0; kare kenarı ~2 pikselden büyük tahtalarda köşe başına bir tepe
+    """
+    kernel = np.full((2 * radius, 2 * radius), 1.0 / radius ** 2, dtype=np.float32)
+    kernel[:radius, radius:] *= -1
+    kernel[radius:, :radius] *= -1
+    response = np.abs(cv2.filter2D(gray.astype(np.float32), -1, kernel))
+    peaks = (response == cv2.dilate(response, np.ones((5, 5), np.uint8))) & (response > contrast)
+    return int(np.count_nonzero(peaks))
+
+
+def chessboard_precheck(gray, chessboard_size, width=PRECHECK_WIDTH):
+    """Tam tespite değer mi: tahta yoksa tam çözünürlük findChessboardCorners'tan çok daha hızlı False döner
+
+    Küçültülmüş görüntüde CALIB_CB_FAST_CHECK; küçük/uzak veya bulanık tahtayı kaçırabildiği için
+    başarısız olursa iç köşe sayısının yarısı kadar satranç köşesi görülen frame de kabul edilir
+    (tahta görünmeyen frame'de tam tespit yüzlerce ms sürebilir)
+    """
+    if gray.shape[1] > width:
+        scale = width / gray.shape[1]
+        gray = cv2.resize(gray, (width, int(round(gray.shape[0] * scale))), interpolation=cv2.INTER_AREA)
+    found, _ = cv2.findChessboardCorners(gray, chessboard_size, flags=cv2.CALIB_CB_FAST_CHECK)
+    if found:
+        return True
+    return checkerboard_corner_count(gray) >= chessboard_size[0] * chessboard_size[1] // 2
+
+
+def find_chessboard_corners(path, chessboard_size, criteria):
+    """Tek fotoğraf: (köşeler Nx1x2 float32 veya None, (genişlik, yükseklik)) - havuz işçisi"""
+    gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        return None, None
+    image_size = (gray.shape[1], gray.shape[0])
+
+    found, corners = cv2.findChessboardCorners(gray, chessboard_size, None)
+    if not found:
+        return None, image_size
+
+    # Alt-piksel hassasiyeti
+    corners = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
+    return corners, image_size
+
+
+@functools.lru_cache(maxsize=4)
+def charuco_board(board_spec=CHARUCO_BOARD):
+    """board_spec -> cv2.aruco.CharucoBoard (süreç başına bir kez; board nesnesi pickle edilemez)"""
+    squares, square_length, marker_length = board_spec
+    dictionary = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+    return cv2.aruco.CharucoBoard(squares, square_length, marker_length, dictionary)
+
+
+@functools.lru_cache(maxsize=4)
+def charuco_detector(board_spec=CHARUCO_BOARD):
+    return cv2.aruco.CharucoDetector(charuco_board(board_spec))
+
+
+def detect_charuco(gray, board_spec=CHARUCO_BOARD, min_corners=CHARUCO_MIN_CORNERS):
+    """Gri görüntüde ChArUco köşeleri: (köşeler Nx1x2, köşe ID'leri Nx1) veya (None, None)"""
+    corners, ids, _, _ = charuco_detector(board_spec).detectBoard(gray)
+    if ids is None or len(ids) < min_corners:
+        return None, None
+    # Tek sıra/sütun üzerindeki köşeler homografi vermez (kalibrasyonu bozar)
+    columns = board_spec[0][0] - 1
+    rows, cols = np.divmod(ids.reshape(-1), columns)
+    if len(np.unique(rows)) < 2 or len(np.unique(cols)) < 2:
+        return None, None
+    return corners, ids
+
+
+def charuco_object_points(ids, board_spec=CHARUCO_BOARD):
+    """Köşe ID'leri -> tahta 3D noktaları (Nx3 float32)"""
+    board_corners = charuco_board(board_spec).getChessboardCorners()
+    return board_corners[np.asarray(ids).reshape(-1)].astype(np.float32)
+
+
+def find_charuco_corners(path, board_spec=CHARUCO_BOARD, min_corners=CHARUCO_MIN_CORNERS):
+    """Tek fotoğraf: (köşeler veya None, ID'ler veya None, (genişlik, yükseklik)) - havuz işçisi"""
+    gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        return None, None, None
+    corners, ids = detect_charuco(gray, board_spec, min_corners)
+    return corners, ids, (gray.shape[1], gray.shape[0])
+
+
+def _init_worker():
+    # İşçi başına tek OpenCV thread'i: çekirdekler süreçler arasında paylaşılır
+    cv2.setNumThreads(1)
+
+
+class CornerCache:
+    def __init__(self, path):
+        """Hash -> köşe sonucu; JSON dosyada saklanır (pickle yok)"""
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.entries = data["entries"]
+            except (ValueError, KeyError, OSError):
+                self.entries = {}
+
+    @staticmethod
+    def key(content_hash, chessboard_size, criteria):
+        # Tahta boyutu veya subpix ayarı değişirse eski sonuçlar kullanılmaz
+        return f"{content_hash}:{chessboard_size[0]}x{chessboard_size[1]}:{criteria[1]}:{criteria[2]}"
+
+    @staticmethod
+    def charuco_key(content_hash, board_spec, min_corners):
+        (squares_x, squares_y), square_length, marker_length = board_spec
+        return f"{content_hash}:charuco:{squares_x}x{squares_y}:{square_length}:{marker_length}:{min_corners}"
+
+    def get(self, key):
+        """(köşeler veya None, image_size) ya da önbellekte yoksa KeyError"""
+        entry = self.entries[key]
+        corners = entry["corners"]
+        corners = np.array(corners, dtype=np.float32).reshape(-1, 1, 2) if corners is not None else None
+        image_size = tuple(entry["image_size"]) if entry["image_size"] else None
+        return corners, image_size
+
+    def get_ids(self, key):
+        """ChArUco köşe ID'leri (Nx1 int32) veya None"""
+        ids = self.entries[key].get("ids")
+        return np.array(ids, dtype=np.int32).reshape(-1, 1) if ids is not None else None
+
+    def put(self, key, corners, image_size, ids=None):
+        self.entries[key] = {
+            "corners": corners.reshape(-1, 2).tolist() if corners is not None else None,
+            "image_size": list(image_size) if image_size else None,
+        }
+        if ids is not None:
+            self.entries[key]["ids"] = np.asarray(ids).reshape(-1).tolist()
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        with open(self.path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f)
+        self.dirty = False
+
+
+def extract_corners(image_paths, chessboard_size, criteria, workers=None, cache_path=None):
+    """Tüm fotoğraflar için köşeler; önbellekte olmayanlar süreç havuzunda işlenir
+
+    workers: Havuz boyutu (None = çekirdek sayısı, 1 = seri)
+    cache_path: Köşe önbelleği dosyası (None = önbellek yok)
+    Returns: (sonuçlar [(path, köşeler veya None, image_size)], yeni işlenen fotoğraf sayısı)
+    """
+    cache = CornerCache(cache_path) if cache_path else None
+    results = {}
+    pending = {}  # path -> önbellek anahtarı
+
+    for path in image_paths:
+        if cache is None:
+            pending[path] = None
+            continue
+        key = CornerCache.key(image_hash(path), chessboard_size, criteria)
+        try:
+            results[path] = cache.get(key)
+        except KeyError:
+            pending[path] = key
+
+    if pending:
+        computed = _run_pool(find_chessboard_corners, pending, (chessboard_size, criteria), workers)
+        for path, (corners, image_size) in computed.items():
+            results[path] = (corners, image_size)
+            # Okunamayan dosya önbelleğe yazılmaz (sonra düzelebilir)
+            if cache is not None and image_size is not None:
+                cache.put(pending[path], corners, image_size)
+
+    if cache is not None:
+        cache.save()
+
+    return [(path, *results[path]) for path in image_paths], len(pending)
+
+
+def extract_charuco_corners(image_paths, board_spec=CHARUCO_BOARD, min_corners=CHARUCO_MIN_CORNERS,
+                            workers=None, cache_path=None):
+    """Tüm fotoğraflar için ChArUco köşeleri (kısmi görünümler dahil)
+
+    Returns: (sonuçlar [(path, köşeler veya None, ID'ler veya None, image_size)], yeni işlenen fotoğraf sayısı)
+    """
+    cache = CornerCache(cache_path) if cache_path else None
+    results = {}
+    pending = {}
+
+    for path in image_paths:
+        if cache is None:
+            pending[path] = None
+            continue
+        key = CornerCache.charuco_key(image_hash(path), board_spec, min_corners)
+        try:
+            corners, image_size = cache.get(key)
+            results[path] = (corners, cache.get_ids(key), image_size)
+        except KeyError:
+            pending[path] = key
+
+    if pending:
+        computed = _run_pool(find_charuco_corners, pending, (board_spec, min_corners), workers)
+        for path, (corners, ids, image_size) in computed.items():
+            results[path] = (corners, ids, image_size)
+            if cache is not None and image_size is not None:
+                cache.put(pending[path], corners, image_size, ids)
+
+    if cache is not None:
+        cache.save()
+
+    return [(path, *results[path]) for path in image_paths], len(pending)
+
+
+def _run_pool(function, paths, args, workers):
+    """function(path, *args) her fotoğraf için; workers=1 ise seri"""
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(paths))
+    if workers == 1:
+        return {path: function(path, *args) for path in paths}
+
+    # spawn: kamera thread'i açık olan süreci fork etmekten kaçın
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker
+    ) as pool:
+        futures = {path: pool.submit(function, path, *args) for path in paths}
+        return {path: future.result() for path, future in futures.items()}
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Kamera Kalibrasyon Deposu
+Süreç başına bir kez yüklenir, (kamera, çözünürlük) başına önbelleklenir
+Dosya biçimi: sürümlü .npz (diziler) + içinde JSON metadata - pickle yok
+Akış çözünürlüğü kalibrasyondan farklıysa kamera matrisi otomatik ölçeklenir
+
+Kullanım (eski pickle dosyasını dönüştür):
+    python3 aruco_mission/calibration_store.py camera_calibration.pkl
+"""
+
+import json
+import os
+import threading
+import time
+import numpy as np
+
+FORMAT_VERSION = 1
+CALIBRATION_FILE = "camera_calibration.npz"
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class CalibrationData:
+    def __init__(self, camera_matrix, dist_coeffs, image_size, calibration_error=None,
+                 camera_id="default", is_default=False):
+        """Tek çözünürlük için intrinsics
+
+        image_size: (genişlik, yükseklik) - kalibrasyonun yapıldığı çözünürlük
+        is_default: Dosya bulunamadı, varsayılan (tahmini) değerler
+        """
+        self.camera_matrix = np.asarray(camera_matrix, dtype=np.float64).reshape(3, 3)
+        self.dist_coeffs = np.asarray(dist_coeffs, dtype=np.float64).reshape(1, -1)
+        self.image_size = (int(image_size[0]), int(image_size[1]))
+        self.calibration_error = calibration_error
+        self.camera_id = camera_id
+        self.is_default = is_default
+
+    def scaled_to(self, width, height):
+        """Başka çözünürlük için kamera matrisi (aynı sensör alanı, farklı ölçek varsayımı)
+
+        Distorsiyon katsayıları normalize koordinatlarda olduğu için değişmez
+        """
+        if (width, height) == self.image_size:
+            return self
+        sx = width / self.image_size[0]
+        sy = height / self.image_size[1]
+        if abs(sx - sy) > 0.01:
+            print(f"⚠️  Kalibrasyon en-boy oranı farklı ({self.image_size[0]}x{self.image_size[1]} -> "
+                  f"{width}x{height}): sensör kırpılıyorsa yeniden kalibre edin")
+
+        camera_matrix = self.camera_matrix.copy()
+        camera_matrix[0, 0] *= sx
+        camera_matrix[0, 1] *= sx
+        camera_matrix[1, 1] *= sy
+        # Piksel merkezleri hizalanarak ölçekle
+        camera_matrix[0, 2] = (camera_matrix[0, 2] + 0.5) * sx - 0.5
+        camera_matrix[1, 2] = (camera_matrix[1, 2] + 0.5) * sy - 0.5
+        return CalibrationData(camera_matrix, self.dist_coeffs, (width, height),
+                               self.calibration_error, self.camera_id, self.is_default)
+
+
+def default_calibration():
+    """Kalibrasyon dosyası yoksa kullanılan tahmini 640x480 intrinsics"""
+    camera_matrix = np.array([
+        [500.0, 0.0, 320.0],    # fx=500, cx=320 (640/2)
+        [0.0, 500.0, 240.0],    # fy=500, cy=240 (480/2)
+        [0.0, 0.0, 1.0]
+    ])
+    dist_coeffs = np.array([0.1, -0.2, 0.0, 0.0, 0.0])
+    return CalibrationData(camera_matrix, dist_coeffs, (640, 480), is_default=True)
+
+
+def save_calibration(path, calibration):
+    """Kalibrasyonu sürümlü .npz olarak yaz"""
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "camera_id": calibration.camera_id,
+        "calibration_error": calibration.calibration_error,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    # np.savez uzantı yoksa .npz ekler; dosya nesnesiyle yol aynen korunur
+    with open(path, "wb") as f:
+        np.savez(
+            f,
+            camera_matrix=calibration.camera_matrix,
+            dist_coeffs=calibration.dist_coeffs,
+            image_size=np.array(calibration.image_size, dtype=np.int32),
+            metadata=np.array(json.dumps(metadata)),
+        )
+
+
+def load_calibration(path):
+    """.npz kalibrasyon dosyasını oku (pickle kapalı)"""
+    with np.load(path, allow_pickle=False) as data:
+        metadata = json.loads(str(data["metadata"]))
+        if metadata.get("format_version", 0) > FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen kalibrasyon sürümü: {metadata['format_version']}")
+        return CalibrationData(
+            data["camera_matrix"], data["dist_coeffs"], tuple(data["image_size"]),
+            metadata.get("calibration_error"), metadata.get("camera_id", "default")
+        )
+
+
+def convert_legacy_pickle(pickle_path, npz_path=None):
+    """Eski camera_calibration.pkl dosyasını .npz'ye çevir (sadece güvenilen dosyalar için)"""
+    import pickle
+    with open(pickle_path, "rb") as f:
+        legacy = pickle.load(f)
+    calibration = CalibrationData(
+        legacy["camera_matrix"], legacy["dist_coeffs"], legacy.get("image_shape", (640, 480)),
+        legacy.get("calibration_error")
+    )
+    npz_path = npz_path or os.path.join(os.path.dirname(pickle_path), CALIBRATION_FILE)
+    save_calibration(npz_path, calibration)
+    return npz_path
+
+
+class CalibrationStore:
+    def __init__(self, search_paths=None):
+        """Dosyaları bir kez okur; (kamera, çözünürlük) sonuçlarını saklar
+
+        search_paths: Kalibrasyon dosyası aranan yollar (sırayla), varsayılan: çalışma klasörü, aruco_mission/
+        """
+        self.search_paths = search_paths or [
+            CALIBRATION_FILE,
+            os.path.join(MODULE_DIR, CALIBRATION_FILE),
+        ]
+        self.lock = threading.Lock()
+        self.files = {}   # camera_id -> CalibrationData (dosyadaki çözünürlük)
+        self.scaled = {}  # (camera_id, w, h) -> CalibrationData
+
+    def find_file(self, camera_id):
+        """Kamera için kalibrasyon dosyası (kamera özel dosya önce), yoksa None"""
+        for path in self.search_paths:
+            if camera_id != "default":
+                root, ext = os.path.splitext(path)
+                camera_path = f"{root}_{camera_id}{ext}"
+                if os.path.exists(camera_path):
+                    return camera_path
+            if os.path.exists(path):
+                return path
+        return None
+
+    def base_calibration(self, camera_id):
+        calibration = self.files.get(camera_id)
+        if calibration is None:
+            path = self.find_file(camera_id)
+            if path is None:
+                print(f"⚠️  {CALIBRATION_FILE} bulunamadı - varsayılan intrinsics kullanılıyor "
+                      f"(pose mesafeleri tahmini!)")
+                calibration = default_calibration()
+            else:
+                try:
+                    calibration = load_calibration(path)
+                except Exception as e:
+                    print(f"❌ Kalibrasyon okunamadı ({path}): {e} - varsayılan intrinsics kullanılıyor")
+                    calibration = default_calibration()
+            self.files[camera_id] = calibration
+        return calibration
+
+    def get(self, width=640, height=480, camera_id="default"):
+        """Akış çözünürlüğüne ölçeklenmiş kalibrasyon (önbellekten)"""
+        key = (camera_id, width, height)
+        calibration = self.scaled.get(key)
+        if calibration is None:
+            with self.lock:
+                calibration = self.scaled.get(key)
+                if calibration is None:
+                    calibration = self.base_calibration(camera_id).scaled_to(width, height)
+                    self.scaled[key] = calibration
+        return calibration
+
+    def invalidate(self):
+        """Yeni kalibrasyon kaydedildi: dosyalar tekrar okunsun"""
+        with self.lock:
+            self.files.clear()
+            self.scaled.clear()
+
+
+# Süreç genelinde tek depo
+calibration_store = CalibrationStore()
+
+
+def get_calibration(width=640, height=480, camera_id="default"):
+    """Süreç genelindeki depodan kalibrasyon"""
+    return calibration_store.get(width, height, camera_id)
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 2:
+        print("Kullanım: python3 calibration_store.py <camera_calibration.pkl>")
+        sys.exit(1)
+    print(f"💾 Dönüştürüldü: {convert_legacy_pickle(sys.argv[1])}")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tespit Olaylarını asyncio'ya İtme (polling yok)
+Kamera thread'i her pose'u loop.call_soon_threadsafe ile misyonun event loop'una iletir
+Misyon: await wait_found(), await next_pose(), async for pose in poses()
+"""
+
+import asyncio
+
+
+class PoseEvent:
+    __slots__ = ("frame_id", "timestamp", "x", "y", "z", "is_centered")
+
+    def __init__(self, frame_id, timestamp, x, y, z, is_centered):
+        """Tek pose olayı: frame_id, yakalama anı (time.monotonic), ortalanmış pozisyon"""
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.z = z
+        self.is_centered = is_centered
+
+
+class DetectionEventBridge:
+    def __init__(self):
+        """Kamera thread'i -> asyncio köprüsü; bekleyenler sadece loop thread'inde değişir"""
+        self.loop = None
+        self.waiters = {}     # next_pose() future'ı -> kayıt anındaki yayın sırası
+        self.queues = {}      # poses() iteratörlerinin kuyrukları -> kayıt anındaki yayın sırası
+        self.latest = None    # Son pose (wait_found hemen dönebilsin)
+        self.published = 0    # Yayın sırası: bekleyene sadece kayıttan sonra yayınlanan pose gider
+
+    def bind(self, loop=None):
+        """Olayların iletileceği event loop (verilmezse çalışan loop)"""
+        self.loop = loop or asyncio.get_running_loop()
+
+    def publish(self, event):
+        """Kamera thread'inden çağrılır; loop bağlı değilse sadece son olayı saklar"""
+        self.latest = event
+        self.published += 1
+        loop = self.loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._deliver, event, self.published)
+        except RuntimeError:
+            # Loop kapandı (misyon bitti)
+            self.loop = None
+
+    def clear_latest(self):
+        """Marker kaybedildi: eski pose wait_found'a tekrar verilmesin"""
+        self.latest = None
+
+    def _deliver(self, event, sequence):
+        """Loop thread'inde: bekleyen future'ları çöz, iteratör kuyruklarına koy
+
+        sequence: Olayın yayın sırası; bekleyen kaydolmadan önce yayınlanmış (eski) olaylar ona verilmez
+        """
+        for future, registered in list(self.waiters.items()):
+            if sequence > registered:
+                del self.waiters[future]
+                if not future.done():
+                    future.set_result(event)
+        for pose_queue, registered in self.queues.items():
+            if sequence <= registered:
+                continue
+            # Sadece en yeni pose önemli: tüketici yavaşsa eskisini at
+            if pose_queue.full():
+                pose_queue.get_nowait()
+            pose_queue.put_nowait(event)
+
+    async def next_pose(self, timeout=None):
+        """Bir sonraki pose olayı; timeout dolarsa None"""
+        if self.loop is None:
+            self.bind()
+        future = self.loop.create_future()
+        self.waiters[future] = self.published
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self.waiters.pop(future, None)
+
+    async def poses(self, timeout=None):
+        """Pose olayları akışı; timeout içinde pose gelmezse None verir (marker kayıp)"""
+        if self.loop is None:
+            self.bind()
+        pose_queue = asyncio.Queue(maxsize=1)
+        self.queues[pose_queue] = self.published
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(pose_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self.queues.pop(pose_queue, None)
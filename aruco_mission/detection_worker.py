@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Ayrı Süreçte ArUco Tespiti (GIL'den bağımsız)
+Yakalama + tespit + pose alt süreçte çalışır; misyon sürecine sadece kompakt sonuç döner
+Overlay gerekiyorsa gri frame'ler multiprocessing.shared_memory halka slotlarıyla paylaşılır
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+import numpy as np
+import cv2
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_source import FrameSource, create_frame_source
+from aruco_mission.marker_detection import MarkerDetectionEngine
+
+
+class DetectionResult:
+    __slots__ = ("frame_id", "slot", "capture_time", "detect_start", "detect_end", "pose_end",
+                 "corners", "rvec", "tvec", "marker_id", "position")
+
+    def __init__(self, frame_id, slot, capture_time, detect_start, detect_end, pose_end=None,
+                 corners=None, rvec=None, tvec=None, marker_id=None, position=None):
+        """Alt süreçten dönen tek frame sonucu (birkaç yüz bayt)
+
+        slot: Frame'in paylaşılan bellekteki slot'u, paylaşım yoksa -1
+        corners: Hedef marker köşeleri (4x2), hedef yoksa None
+        rvec, tvec: Pose (3,), pose yoksa None
+        marker_id: Pose'un alındığı iniş pedi marker'ı
+        position: Ped merkezinin pozisyonu (x, y, z), pose yoksa None
+        """
+        self.frame_id = frame_id
+        self.slot = slot
+        self.capture_time = capture_time
+        self.detect_start = detect_start
+        self.detect_end = detect_end
+        self.pose_end = pose_end
+        self.corners = corners
+        self.rvec = rvec
+        self.tvec = tvec
+        self.marker_id = marker_id
+        self.position = position
+
+    def __reduce__(self):
+        return DetectionResult, tuple(getattr(self, name) for name in self.__slots__)
+
+
+class SharedFrameRing:
+    def __init__(self, width, height, slots=4, name=None):
+        """Paylaşılan bellekte gri frame halkası: [slots x int64 frame_id] + [slots x H x W]
+
+        name: None ise yeni blok oluşturulur (sahibi bu süreç), verilirse mevcut bloğa bağlanır
+        """
+        self.width = width
+        self.height = height
+        self.slots = slots
+        header_size = 8 * slots
+        size = header_size + slots * width * height
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        self.name = self.shm.name
+
+        # Slot'ta hangi frame var (-1: yazılıyor / boş)
+        self.frame_ids = np.ndarray((slots,), dtype=np.int64, buffer=self.shm.buf)
+        self.frames = np.ndarray((slots, height, width), dtype=np.uint8, buffer=self.shm.buf, offset=header_size)
+        if self.owner:
+            self.frame_ids[:] = -1
+
+    def write(self, frame_id, gray):
+        """Frame'i sıradaki slot'a kopyala, slot numarasını döndür (boyut uymazsa -1)"""
+        if gray.shape != (self.height, self.width):
+            return -1
+        slot = frame_id % self.slots
+        self.frame_ids[slot] = -1  # Okuyucu yarım yazılmış slot'u kullanmasın
+        np.copyto(self.frames[slot], gray)
+        self.frame_ids[slot] = frame_id
+        return slot
+
+    def read(self, slot, frame_id, out=None):
+        """Slot'taki frame'i kopyala; bu arada üzerine yazıldıysa None"""
+        if slot < 0 or self.frame_ids[slot] != frame_id:
+            return None
+        if out is None:
+            out = self.frames[slot].copy()
+        else:
+            np.copyto(out, self.frames[slot])
+        if self.frame_ids[slot] != frame_id:
+            return None
+        return out
+
+    def close(self):
+        # numpy görünümleri bırakılmadan shm kapatılamaz
+        self.frame_ids = None
+        self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def detection_worker_main(source_kind, source_kwargs, engine_kwargs, ring_name, width, height, slots,
+                          share_frames, results, commands, stop_event):
+    """Alt süreç: kaynağı aç, her frame için tespit yap, kompakt sonucu kuyruğa koy"""
+    ring = SharedFrameRing(width, height, slots, name=ring_name) if share_frames else None
+    source = create_frame_source(source_kind, **source_kwargs)
+    engine = MarkerDetectionEngine(source, **engine_kwargs)
+
+    try:
+        if not source.open():
+            results.put("failed")
+            return
+
+        while not stop_event.is_set():
+            # Misyondan gelen faz değişiklikleri
+            try:
+                while True:
+                    phase, pyramid_levels = commands.get_nowait()
+                    engine.set_detection_phase(phase, pyramid_levels)
+            except queue.Empty:
+                pass
+
+            frame = source.read(timeout=0.1)
+            if frame is None:
+                if source.finished:
+                    break
+                continue
+
+            detection = engine.process_frame(frame.gray, time.time(), frame.timestamp)
+            slot = ring.write(detection['frame_id'], frame.gray) if ring else -1
+
+            result = DetectionResult(detection['frame_id'], slot, detection['timestamp'],
+                                     detection['detect_start'], detection['detect_end'])
+            if detection['corners']:
+                result.corners = detection['corners'][0].reshape(4, 2)
+                result.marker_id = detection['marker_id']
+                if detection['tvecs'] is not None:
+                    result.pose_end = detection['pose_end']
+                    result.rvec = detection['rvecs'][0].reshape(3)
+                    result.tvec = detection['tvecs'][0].reshape(3)
+                    result.position = detection['position']
+
+            # Kuyruk doluysa (misyon hiç okumuyor) sonuç atılır; misyon okurken birikenleri kendisi atlar
+            try:
+                results.put_nowait(result)
+            except queue.Full:
+                pass
+    finally:
+        source.close()
+        if ring:
+            ring.close()
+        # Misyon süreci kuyruğu artık okumuyorsa çıkışta bekleme
+        results.cancel_join_thread()
+        try:
+            results.put_nowait("finished")
+        except queue.Full:
+            pass
+
+
+class ProcessDetectionEngine(MarkerDetectionEngine):
+    def __init__(self, source_kind="libcamera", source_kwargs=None, target_marker_id=42, roi_tracking=True,
+                 width=640, height=480, slots=4, window_name='ArUco Kamera', landing_pad=None):
+        """MarkerDetectionEngine ile aynı arayüz; ağır iş alt süreçte, filtreler burada
+
+        source_kind/source_kwargs: create_frame_source argümanları (alt süreçte oluşturulur)
+        width, height: Paylaşılan frame boyutu (overlay için)
+        """
+        super().__init__(FrameSource(width, height), target_marker_id=target_marker_id,
+                         roi_tracking=roi_tracking, window_name=window_name, landing_pad=landing_pad)
+        self.source_kind = source_kind
+        self.source_kwargs = source_kwargs or {}
+        # Alt süreç aynı tespit profilini kullansın (dosya tekrar aranmaz)
+        self.engine_kwargs = {"target_marker_id": self.target_marker_id, "roi_tracking": roi_tracking,
+                              "detector_profile": self.detector_profile, "landing_pad": self.landing_pad}
+        self.slots = slots
+
+        # spawn: asyncio/MAVSDK thread'leri olan süreci fork etmekten kaçın
+        self.context = multiprocessing.get_context("spawn")
+        self.process = None
+        self.ring = None
+        self.results = None
+        self.commands = None
+        self.stop_event = None
+        # stop_camera hem tüketici thread'inden hem mission cleanup'tan çağrılır
+        self.shutdown_lock = threading.Lock()
+        self.consumer_thread = None
+
+    def start_worker(self, share_frames):
+        """Tespit sürecini başlat"""
+        self.results = self.context.Queue(maxsize=64)
+        self.commands = self.context.Queue()
+        self.stop_event = self.context.Event()
+        # Faz önceden seçildiyse alt sürece ilk komut olarak gitsin
+        self.commands.put((self.detection_phase, self.coarse_search.pyramid_levels))
+
+        if share_frames:
+            self.ring = SharedFrameRing(self.frame_source.width, self.frame_source.height, self.slots)
+
+        self.process = self.context.Process(
+            target=detection_worker_main,
+            args=(self.source_kind, self.source_kwargs, self.engine_kwargs,
+                  self.ring.name if self.ring else None,
+                  self.frame_source.width, self.frame_source.height, self.slots,
+                  share_frames, self.results, self.commands, self.stop_event),
+            daemon=True
+        )
+        self.process.start()
+
+    def set_detection_phase(self, phase, pyramid_levels=None):
+        super().set_detection_phase(phase, pyramid_levels)
+        if self.commands is not None:
+            self.commands.put((phase, pyramid_levels))
+
+    @staticmethod
+    def latest_result(results, result):
+        """Kuyrukta biriken daha yeni sonuçlara atla: kontrol döngüsü eski pose ile beslenmesin
+
+        Returns: (en yeni sonuç, atlanan sonuç sayısı, alt süreç mesajı "failed"/"finished" veya None)
+        """
+        skipped = 0
+        while True:
+            try:
+                newer = results.get_nowait()
+            except queue.Empty:
+                return result, skipped, None
+            if isinstance(newer, str):
+                return result, skipped, newer
+            result = newer
+            skipped += 1
+
+    def apply_result(self, result):
+        """Alt süreç sonucuyla pozisyon filtresi, Kalman ve gecikme kaydını güncelle"""
+        self.frame_count += 1
+        if result.corners is None:
+            self.reset_position_tracking()
+            return
+
+        self.detection_count += 1
+        self.last_detection_time = time.time()
+        if result.position is not None:
+            self.update_position(*result.position, result.capture_time)
+            self.is_found = True
+            self.pose_ready(result.frame_id, result.capture_time,
+                            result.detect_start, result.detect_end, result.pose_end)
+
+    def show_camera_with_detection(self, headless=False, overlay_fps=15):
+        """Sonuç tüketme döngüsü (mission thread'inde); tespit alt süreçte"""
+        self.consumer_thread = threading.current_thread()
+        self.start_worker(share_frames=not headless)
+        # stop_camera başka thread'den çağrılıp alanları sıfırlayabilir
+        process, results, ring = self.process, self.results, self.ring
+        if not headless:
+            cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
+            gray_frame = np.empty((self.frame_source.height, self.frame_source.width), dtype=np.uint8)
+
+        self.start_time = time.time()
+        self.frame_count = 0
+        self.detection_count = 0
+        self.last_detection_time = 0
+
+        overlay_interval = 1.0 / overlay_fps if overlay_fps else 0.0
+        last_overlay_time = 0
+
+        self.running = True
+        try:
+            while self.running:
+                try:
+                    result = results.get(timeout=0.1)
+                except queue.Empty:
+                    if not process.is_alive():
+                        break
+                    continue
+                if result == "failed":
+                    print("❌ Tespit süreci frame kaynağını açamadı")
+                    break
+                if result == "finished":
+                    break
+
+                # Tüketici geride kaldıysa (overlay, GIL) sadece en yeni sonuç uygulanır
+                result, skipped, status = self.latest_result(results, result)
+                self.frame_count += skipped
+                self.apply_result(result)
+                if status is not None:
+                    break
+
+                current_time = time.time()
+                if headless or current_time - last_overlay_time < overlay_interval:
+                    continue
+
+                # Frame bu arada üzerine yazıldıysa bu overlay atlanır
+                gray = ring.read(result.slot, result.frame_id, gray_frame)
+                if gray is None:
+                    continue
+                last_overlay_time = current_time
+
+                detection = {'ids': None, 'corners': [], 'rvecs': None, 'tvecs': None}
+                if result.corners is not None:
+                    detection['marker_id'] = result.marker_id
+                    detection['ids'] = np.array([[result.marker_id]])
+                    detection['corners'] = [result.corners.reshape(1, 4, 2)]
+                    if result.tvec is not None:
+                        detection['rvecs'] = result.rvec.reshape(1, 1, 3)
+                        detection['tvecs'] = result.tvec.reshape(1, 1, 3)
+
+                display_frame = self.draw_overlay(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR), detection, current_time)
+                cv2.imshow(self.window_name, display_frame)
+                if cv2.waitKey(1) & 0xFF == 27:
+                    break
+        finally:
+            self.stop_camera()
+            if not headless:
+                cv2.destroyAllWindows()
+
+    def stop_camera(self):
+        """Alt süreci durdur ve paylaşılan belleği serbest bırak (tüketici thread'i veya mission cleanup)"""
+        self.running = False
+        consumer = self.consumer_thread
+        current = threading.current_thread()
+        if consumer is not None and consumer is not current:
+            # Tüketici döngüsü en geç results.get zaman aşımında çıkar ve kendi finally'sinde durdurur
+            consumer.join(timeout=5)
+
+        # Alanlar kilit altında alınır: her birini sadece bir çağıran durdurur
+        with self.shutdown_lock:
+            process, stop_event = self.process, self.stop_event
+            self.process = None
+            ring = None
+            # ring.read sırasında bellek serbest kalmasın: halkayı tüketici bittiyse veya tüketicinin kendisi kapatır
+            if consumer is None or consumer is current or not consumer.is_alive():
+                ring, self.ring = self.ring, None
+
+        if process is not None:
+            stop_event.set()
+            process.join(timeout=3)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        if ring is not None:
+            ring.close()
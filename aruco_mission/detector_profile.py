@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+ArUco DetectorParameters Profili
+Tespit parametreleri koda gömülü değil, JSON profilden okunur (detector_tuner.py yazar)
+Dosya yoksa eski sabit değerler kullanılır
+"""
+
+import json
+import os
+import cv2
+
+PROFILE_VERSION = 1
+DETECTOR_PROFILE_FILE = "detector_profile.json"
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Her adaptif eşik penceresi tam frame'de bir eşikleme + kontur geçişi demek
+DEFAULT_PROFILE = {
+    "adaptiveThreshWinSizeMin": 3,
+    "adaptiveThreshWinSizeMax": 23,
+    "adaptiveThreshWinSizeStep": 10,
+    "minMarkerPerimeterRate": 0.03,
+    "maxMarkerPerimeterRate": 4.0,
+}
+
+
+def threshold_windows(profile):
+    """Profilin adaptif eşik pencere boyutları (her biri bir tam frame geçişi)"""
+    return list(range(profile["adaptiveThreshWinSizeMin"], profile["adaptiveThreshWinSizeMax"] + 1,
+                      profile["adaptiveThreshWinSizeStep"]))
+
+
+def create_detector_parameters(profile=None):
+    """Profil -> cv2.aruco.DetectorParameters (profilde olmayanlar OpenCV varsayılanı)"""
+    params = cv2.aruco.DetectorParameters()
+    for name, value in (profile or DEFAULT_PROFILE).items():
+        if not hasattr(params, name):
+            raise ValueError(f"Bilinmeyen DetectorParameters alanı: {name}")
+        setattr(params, name, value)
+    return params
+
+
+def save_detector_profile(path, profile, metrics=None):
+    """Profili (ve seçildiği ölçümleri) JSON olarak yaz"""
+    data = {"version": PROFILE_VERSION, "profile": profile}
+    if metrics:
+        data["metrics"] = metrics
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_detector_profile(path=None):
+    """Profil sözlüğü; yol verilmezse çalışma klasörü, sonra aruco_mission/ aranır
+
+    Dosya yoksa veya okunamazsa DEFAULT_PROFILE
+    """
+    paths = [path] if path else [DETECTOR_PROFILE_FILE, os.path.join(MODULE_DIR, DETECTOR_PROFILE_FILE)]
+    for candidate in paths:
+        if not os.path.exists(candidate):
+            continue
+        try:
+            with open(candidate) as f:
+                data = json.load(f)
+            if data.get("version", 0) > PROFILE_VERSION:
+                raise ValueError(f"Desteklenmeyen profil sürümü: {data['version']}")
+            profile = dict(DEFAULT_PROFILE)
+            profile.update(data["profile"])
+            create_detector_parameters(profile)  # Alan adlarını doğrula
+            print(f"🎛️  Tespit profili: {candidate} ({len(threshold_windows(profile))} eşik penceresi)")
+            return profile
+        except Exception as e:
+            print(f"❌ Tespit profili okunamadı ({candidate}): {e} - varsayılan parametreler kullanılıyor")
+            return dict(DEFAULT_PROFILE)
+    return dict(DEFAULT_PROFILE)
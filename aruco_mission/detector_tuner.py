@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+ArUco DetectorParameters Ayarlayıcı
+Kaydedilmiş, etiketli frame'ler üzerinde parametre uzayını tarar
+Tespit oranı - ms/frame Pareto cephesini raporlar, seçilen profili detector_profile.json'a yazar
+(MarkerDetectionEngine açılışta bu dosyayı okur)
+
+Etiketler: frame sırasına göre görünen marker ID'leri, JSON {"version": 1, "ids": [[42], [], ...]}
+Etiket yoksa --bootstrap-labels yoğun (yavaş) bir profille ilk etiketleri üretir; gözden geçirin
+
+Kullanım:
+    python3 aruco_mission/detector_tuner.py kayit_klasoru/ --bootstrap-labels
+    python3 aruco_mission/detector_tuner.py kayit_klasoru/
+    python3 aruco_mission/detector_tuner.py ucus.yuv --width 640 --height 480 --min-rate 0.98
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import cv2
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_source import create_frame_source
+from aruco_mission.detector_profile import (DEFAULT_PROFILE, DETECTOR_PROFILE_FILE, create_detector_parameters,
+                                            save_detector_profile, threshold_windows)
+
+LABELS_FILE = "labels.json"
+LABELS_VERSION = 1
+
+# Taranan değerler; adaptif eşik pencereleri tespit süresinin ana kalemi
+SEARCH_SPACE = {
+    "adaptiveThreshWinSizeMin": (3, 5, 7),
+    "adaptiveThreshWinSizeMax": (7, 13, 23, 33),
+    "adaptiveThreshWinSizeStep": (4, 10, 20),
+    "minMarkerPerimeterRate": (0.02, 0.03, 0.05, 0.08),
+}
+
+# Etiket üretimi için yoğun profil: çok pencere, küçük marker'lar dahil (yavaş ama kapsamlı)
+BOOTSTRAP_PROFILE = dict(DEFAULT_PROFILE, adaptiveThreshWinSizeMin=3, adaptiveThreshWinSizeMax=53,
+                         adaptiveThreshWinSizeStep=4, minMarkerPerimeterRate=0.01)
+
+
+def load_frames(source_kind, limit=None, **source_kwargs):
+    """Kaynaktaki frame'leri gri olarak belleğe al (zamanlama disk okumasını içermesin)"""
+    source = create_frame_source(source_kind, **source_kwargs)
+    if not source.open():
+        raise ValueError(f"Frame kaynağı açılamadı: {source_kind} {source_kwargs}")
+    frames = []
+    try:
+        while limit is None or len(frames) < limit:
+            frame = source.read()
+            if frame is None:
+                if source.finished:
+                    break
+                continue
+            # Halka buffer'lı kaynaklar slot'u tekrar kullanır: kopya al
+            frames.append(frame.gray.copy())
+    finally:
+        source.close()
+    return frames
+
+
+def load_labels(path):
+    """Frame başına beklenen marker ID kümeleri"""
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version", 0) > LABELS_VERSION:
+        raise ValueError(f"Desteklenmeyen etiket sürümü: {data['version']}")
+    return [set(ids) for ids in data["ids"]]
+
+
+def save_labels(path, labels):
+    with open(path, "w") as f:
+        json.dump({"version": LABELS_VERSION, "ids": [sorted(ids) for ids in labels]}, f)
+
+
+def detect_ids(detector, gray):
+    _, ids, _ = detector.detectMarkers(gray)
+    return set() if ids is None else set(int(marker_id) for marker_id in ids.reshape(-1))
+
+
+def create_detector(profile):
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+    return cv2.aruco.ArucoDetector(aruco_dict, create_detector_parameters(profile))
+
+
+def bootstrap_labels(frames, profile=BOOTSTRAP_PROFILE):
+    """Yoğun profille ilk etiketler (elle düzeltilebilir)"""
+    detector = create_detector(profile)
+    return [detect_ids(detector, gray) for gray in frames]
+
+
+def candidate_profiles(search_space=SEARCH_SPACE, base=DEFAULT_PROFILE):
+    """Arama uzayındaki geçerli profiller; aynı pencere kümesini veren kombinasyonlar tekrar edilmez"""
+    names = list(search_space)
+    seen = set()
+    for values in itertools.product(*(search_space[name] for name in names)):
+        profile = dict(base)
+        profile.update(zip(names, values))
+        if profile["adaptiveThreshWinSizeMax"] < profile["adaptiveThreshWinSizeMin"]:
+            continue
+        windows = tuple(threshold_windows(profile))
+        # Üst sınır pencere listesine göre normalize edilir (23 ile 25 aynı pencereleri verebilir)
+        profile["adaptiveThreshWinSizeMax"] = windows[-1]
+        key = tuple(sorted(profile.items()))
+        if key in seen:
+            continue
+        seen.add(key)
+        yield profile
+
+
+def evaluate_profile(profile, frames, labels, repeat=3):
+    """Profilin tespit oranı, yanlış tespit sayısı ve ms/frame'i (repeat turun en hızlısı)"""
+    detector = create_detector(profile)
+    expected = sum(len(ids) for ids in labels)
+    detected = 0
+    false_positives = 0
+    for gray, label in zip(frames, labels):
+        ids = detect_ids(detector, gray)
+        detected += len(ids & label)
+        false_positives += len(ids - label)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for gray in frames:
+            detector.detectMarkers(gray)
+        best = min(best, time.perf_counter() - start)
+
+    return {
+        "profile": profile,
+        "windows": len(threshold_windows(profile)),
+        "detection_rate": detected / expected if expected else 1.0,
+        "false_positives": false_positives,
+        "ms_per_frame": 1000.0 * best / max(len(frames), 1),
+    }
+
+
+def pareto_front(results):
+    """Tespit oranında ve hızda başka bir sonuç tarafından geçilmeyenler (hıza göre sıralı)"""
+    front = []
+    for result in sorted(results, key=lambda r: (r["ms_per_frame"], -r["detection_rate"])):
+        # Daha hızlı olanların hepsinden kesin daha yüksek oran gerekli
+        if not front or result["detection_rate"] > front[-1]["detection_rate"]:
+            front.append(result)
+    return front
+
+
+def choose_profile(front, min_rate):
+    """min_rate'i sağlayan en hızlı profil; hiçbiri sağlamıyorsa en yüksek oranlı"""
+    for result in front:
+        if result["detection_rate"] >= min_rate:
+            return result
+    return front[-1]
+
+
+def tune(frames, labels, search_space=SEARCH_SPACE, repeat=3, min_rate=None, progress=None):
+    """Tüm adayları ölç
+
+    min_rate: Seçim için en düşük tespit oranı (None: mevcut varsayılan profilin oranı - daha kötü olmasın)
+    Returns: (baseline, results, front, chosen)
+    """
+    if len(labels) < len(frames):
+        frames = frames[:len(labels)]
+    baseline = evaluate_profile(dict(DEFAULT_PROFILE), frames, labels, repeat)
+
+    results = []
+    candidates = list(candidate_profiles(search_space))
+    for i, profile in enumerate(candidates):
+        results.append(evaluate_profile(profile, frames, labels, repeat))
+        if progress:
+            progress(i + 1, len(candidates))
+
+    # Varsayılandan fazla yanlış tespit yapan profiller seçilemez
+    allowed = [r for r in results if r["false_positives"] <= baseline["false_positives"]] or [baseline]
+    front = pareto_front(allowed)
+    chosen = choose_profile(front, baseline["detection_rate"] if min_rate is None else min_rate)
+    return baseline, results, front, chosen
+
+
+def format_result(result):
+    profile = result["profile"]
+    return (f"{result['detection_rate'] * 100:>7.1f}%{result['ms_per_frame']:>9.2f}{result['windows']:>5}"
+            f"{result['false_positives']:>5}   win {profile['adaptiveThreshWinSizeMin']}-"
+            f"{profile['adaptiveThreshWinSizeMax']}/{profile['adaptiveThreshWinSizeStep']}"
+            f"  minPer {profile['minMarkerPerimeterRate']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ArUco DetectorParameters ayarlayıcı")
+    parser.add_argument("source", help="Resim klasörü veya ham YUV420 kaydı (.yuv)")
+    parser.add_argument("--width", type=int, default=640, help="YUV kaydı genişliği")
+    parser.add_argument("--height", type=int, default=480, help="YUV kaydı yüksekliği")
+    parser.add_argument("--labels", help=f"Etiket dosyası (varsayılan: klasörde {LABELS_FILE}, .yuv yanında .labels.json)")
+    parser.add_argument("--bootstrap-labels", action="store_true", help="Yoğun profille etiket dosyası üret ve çık")
+    parser.add_argument("--limit", type=int, help="En fazla frame sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Zamanlama tekrarı (en hızlısı alınır)")
+    parser.add_argument("--min-rate", type=float, help="Seçim için en düşük tespit oranı (varsayılan: mevcut profilin oranı)")
+    parser.add_argument("--output", default=DETECTOR_PROFILE_FILE, help="Yazılacak profil dosyası")
+    args = parser.parse_args()
+
+    if os.path.isdir(args.source):
+        frames = load_frames("images", args.limit, directory=args.source)
+        labels_path = args.labels or os.path.join(args.source, LABELS_FILE)
+    else:
+        frames = load_frames("yuv", args.limit, path=args.source, width=args.width, height=args.height)
+        labels_path = args.labels or os.path.splitext(args.source)[0] + ".labels.json"
+    print(f"🎞️  {len(frames)} frame yüklendi")
+
+    if args.bootstrap_labels:
+        labels = bootstrap_labels(frames)
+        save_labels(labels_path, labels)
+        print(f"🏷️  Etiketler yazıldı: {labels_path} ({sum(1 for ids in labels if ids)} frame'de marker var)")
+        print("📋 Dosyayı gözden geçirip ayarlayıcıyı tekrar çalıştırın")
+        return
+
+    if not os.path.exists(labels_path):
+        print(f"❌ Etiket dosyası yok: {labels_path} (--bootstrap-labels ile üretin)")
+        sys.exit(1)
+    labels = load_labels(labels_path)
+
+    def progress(done, total):
+        print(f"\r🔍 {done}/{total} profil", end="", flush=True)
+
+    baseline, results, front, chosen = tune(frames, labels, repeat=args.repeat, min_rate=args.min_rate,
+                                            progress=progress)
+
+    header = f"{'oran':>8}{'ms/frame':>9}{'pnc':>5}{'yanlış':>7} profil"
+    print(f"\n\n📊 Mevcut profil\n{header}\n{format_result(baseline)}")
+    print(f"\n📈 Pareto cephesi ({len(front)}/{len(results)} profil)\n{header}")
+    for result in front:
+        marker = "  ◀ seçilen" if result is chosen else ""
+        print(format_result(result) + marker)
+
+    metrics = {key: chosen[key] for key in ("detection_rate", "false_positives", "ms_per_frame")}
+    metrics.update(frames=len(labels), baseline_ms_per_frame=baseline["ms_per_frame"],
+                   baseline_detection_rate=baseline["detection_rate"])
+    save_detector_profile(args.output, chosen["profile"], metrics)
+    print(f"\n💾 Profil yazıldı: {args.output} "
+          f"({baseline['ms_per_frame']:.2f} -> {chosen['ms_per_frame']:.2f} ms/frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Libcamera FIFO için Sıfır Kopyalı Frame Okuyucu
+Önceden ayrılmış YUV420 (I420) buffer halkası + readinto
+"""
+
+import queue
+import numpy as np
+
+
+class YUVFrameRing:
+    def __init__(self, width=640, height=480, slots=4, managed=False):
+        """Sabit sayıda önceden ayrılmış I420 buffer'ı tekrar kullanır
+
+        managed: False ise slot'lar sırayla dolaşılır (tek thread'li okuyucu, frame bir sonraki okumaya kadar geçerli)
+                 True ise sadece boş slot'lara yazılır; frame'in slot'u release() ile geri verilene kadar üzerine yazılmaz
+        """
+        self.width = width
+        self.height = height
+        self.frame_size = width * height * 3 // 2  # YUV420
+        self.slots = slots
+
+        # Tüm buffer'lar sadece burada ayrılır, okuma sırasında yeni dizi oluşmaz
+        self.buffers = [np.empty((height * 3 // 2, width), dtype=np.uint8) for _ in range(slots)]
+        self.views = [memoryview(buffer.reshape(-1)) for buffer in self.buffers]
+        self.allocations = slots
+
+        self.index = 0
+        self.frame_count = 0
+
+        # Boş slot indeksleri (okuyucu ve tüketici thread'leri arasında paylaşılır)
+        self.free_slots = None
+        if managed:
+            self.free_slots = queue.Queue()
+            for index in range(slots):
+                self.free_slots.put(index)
+
+    def read_frame(self, pipe):
+        """Sıradaki slot'a bir frame oku, slot'un kendisini (kopyasız) döndür
+
+        pipe: readinto destekleyen ikili dosya (tercihen buffering=0 ile açılmış FIFO)
+        Returns: (H*3/2, W) uint8 YUV dizisi veya akış bittiyse None
+        """
+        if self.free_slots is not None:
+            # Boş slot yoksa tüketicilerden biri release edene kadar bekle
+            index = self.free_slots.get()
+        else:
+            index = self.index
+            self.index = (self.index + 1) % self.slots
+        view = self.views[index]
+
+        # FIFO kısmi okuma döndürebilir, slot dolana kadar devam et
+        filled = pipe.readinto(view)
+        while filled and filled < self.frame_size:
+            count = pipe.readinto(view[filled:])
+            if not count:
+                filled = 0
+                break
+            filled += count
+        if not filled:
+            if self.free_slots is not None:
+                self.free_slots.put(index)
+            return None
+
+        self.frame_count += 1
+        return self.buffers[index]
+
+    def release(self, frame):
+        """managed modda frame'in slot'unu tekrar yazılabilir yap"""
+        if self.free_slots is None or frame is None:
+            return
+        for index, buffer in enumerate(self.buffers):
+            if buffer is frame:
+                self.free_slots.put(index)
+                return
+        raise ValueError("frame does not belong to this ring")
+
+    def luma(self, frame):
+        """I420 frame'in Y (parlaklık) düzlemi - kopyasız gri görüntü"""
+        return frame[:self.height]
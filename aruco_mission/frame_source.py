@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Frame Kaynakları - Tespit motorundan bağımsız görüntü alma katmanı
+libcamera FIFO, V4L2/VideoCapture, resim klasörü, video ve ham YUV kayıt dosyası
+"""
+
+import cv2
+import numpy as np
+import time
+import subprocess
+import threading
+import queue
+import os
+import signal
+import glob
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_reader import YUVFrameRing
+
+
+class Frame:
+    def __init__(self, gray, bgr=None, yuv=None, bgr_buffer=None, timestamp=None):
+        """Tek frame: tespit için gri görüntü, overlay için BGR (gerekirse tembel dönüşüm)
+
+        timestamp: Yakalama anı (time.monotonic), verilmezse oluşturulma anı
+        """
+        self.gray = gray
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+        self.yuv = yuv
+        self._bgr = bgr
+        self._bgr_buffer = bgr_buffer
+
+    def to_bgr(self):
+        """Overlay için BGR görüntü (YUV kaynaklarda sadece ilk çağrıda dönüştürülür)"""
+        if self._bgr is None:
+            if self.yuv is not None:
+                self._bgr = cv2.cvtColor(self.yuv, cv2.COLOR_YUV2BGR_I420, dst=self._bgr_buffer)
+            else:
+                self._bgr = cv2.cvtColor(self.gray, cv2.COLOR_GRAY2BGR, dst=self._bgr_buffer)
+        return self._bgr
+
+
+class FrameSource:
+    """Frame kaynağı arayüzü: open() -> read() ... -> close()"""
+
+    def __init__(self, width=640, height=480):
+        self.width = width
+        self.height = height
+        # Kaynak tükendi mi (dosya sonu, kamera koptu)
+        self.finished = False
+
+    def open(self):
+        """Kaynağı başlat, başarılıysa True"""
+        raise NotImplementedError
+
+    def read(self, timeout=0.1):
+        """Sıradaki Frame; zaman aşımında None (finished=True ise kaynak bitti)"""
+        raise NotImplementedError
+
+    def close(self):
+        """Kaynağı durdur ve kaynakları serbest bırak"""
+        pass
+
+
+class LibcameraFifoSource(FrameSource):
+    def __init__(self, width=640, height=480, fps=30, luma=True,
+                 pipe_path="/tmp/camera_viewer_pipe", queue_size=5, record_path=None):
+        """libcamera-vid YUV420 çıktısını FIFO üzerinden sıfır kopyayla okur
+
+        luma: True ise tespit doğrudan Y düzleminde (BGR->GRAY dönüşümü yok)
+        record_path: Verilirse ham YUV frame'ler bu dosyaya da yazılır (RawYUVFileSource ile tekrar oynatılır)
+        """
+        super().__init__(width, height)
+        self.fps = fps
+        self.luma = luma
+        self.pipe_path = pipe_path
+        self.record_path = record_path
+
+        # Stream variables
+        self.process = None
+        self.running = False
+        self.frame_queue = queue.Queue(maxsize=queue_size)
+
+        # Sıfır kopyalı okuma: queue'daki + işlenen + yazılan frame'ler için yeterli slot
+        # Slot'lar sadece queue'dan düşürülünce veya tüketici sonraki frame'i alınca boşalır
+        self.frame_ring = None
+        self.frame_ring_slots = self.frame_queue.maxsize + 2
+        self.consumer_frame = None  # Tüketicinin elindeki (henüz bırakılmamış) YUV slot'u
+
+        # BGR dönüşümü için tek seferlik hedef buffer
+        self.bgr_frame = np.empty((height, width, 3), dtype=np.uint8)
+        self.gray_frame = np.empty((height, width), dtype=np.uint8)
+
+    def start_camera_stream(self):
+        """Libcamera stream başlat"""
+        # Eski pipe'ı temizle
+        if os.path.exists(self.pipe_path):
+            os.remove(self.pipe_path)
+
+        # FIFO oluştur
+        os.mkfifo(self.pipe_path)
+
+        # Libcamera komutu
+        cmd = [
+            'libcamera-vid',
+            '--width', str(self.width),
+            '--height', str(self.height),
+            '--framerate', str(self.fps),
+            '--timeout', '0',
+            '--nopreview',
+            '--codec', 'yuv420',
+            '--output', self.pipe_path,
+            '--flush'
+        ]
+
+        try:
+            self.process = subprocess.Popen(cmd,
+                                          stdout=subprocess.PIPE,
+                                          stderr=subprocess.PIPE,
+                                          preexec_fn=os.setsid)
+
+            time.sleep(2)
+
+            if self.process.poll() is None:
+                return self.pipe_path
+            else:
+                return None
+
+        except Exception as e:
+            return None
+
+    def read_frames_thread(self, pipe_path):
+        """Frame okuma thread'i"""
+        print("📸 Frame okuma başladı")
+
+        # Önceden ayrılmış YUV buffer halkası (frame başına yeni dizi yok)
+        self.frame_ring = YUVFrameRing(self.width, self.height, slots=self.frame_ring_slots, managed=True)
+
+        record_file = open(self.record_path, 'wb') if self.record_path else None
+
+        try:
+            # buffering=0: veri doğrudan slot'a okunur, ara buffer kopyası olmaz
+            with open(pipe_path, 'rb', buffering=0) as pipe:
+                while self.running:
+                    try:
+                        yuv_frame = self.frame_ring.read_frame(pipe)
+                        # Yakalama anı: frame FIFO'dan tamamen okunduğu an
+                        capture_time = time.monotonic()
+
+                        if yuv_frame is None:
+                            # Akış kapandı (libcamera-vid durdu)
+                            self.finished = True
+                            break
+
+                        # Uçuş kaydı (slot doğrudan yazılır, kopya yok)
+                        if record_file:
+                            record_file.write(yuv_frame)
+
+                        # Queue'ya ekle (son frame'i tut) - slot kopyalanmadan paylaşılır
+                        if not self.frame_queue.full():
+                            self.frame_queue.put((yuv_frame, capture_time))
+                        else:
+                            try:
+                                dropped_frame, _ = self.frame_queue.get_nowait()
+                                self.frame_ring.release(dropped_frame)
+                            except queue.Empty:
+                                pass
+                            self.frame_queue.put((yuv_frame, capture_time))
+
+                    except Exception as e:
+                        if self.running:
+                            print(f"   ⚠️  Frame hatası: {e}")
+                        break
+
+        except Exception as e:
+            print(f"   ❌ Pipe hatası: {e}")
+
+        finally:
+            if record_file:
+                record_file.close()
+            if os.path.exists(pipe_path):
+                os.remove(pipe_path)
+
+    def open(self):
+        """Stream ve frame okuma thread'ini başlat"""
+        pipe_path = self.start_camera_stream()
+        if not pipe_path:
+            return False
+
+        self.running = True
+        self.finished = False
+        self.consumer_frame = None  # Okuma thread'i yeni halka oluşturur
+        read_thread = threading.Thread(
+            target=self.read_frames_thread,
+            args=(pipe_path,)
+        )
+        read_thread.daemon = True
+        read_thread.start()
+        return True
+
+    def read(self, timeout=0.1):
+        try:
+            yuv_frame, capture_time = self.frame_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        # Önceki frame ile işimiz bitti: slot'u okuyucuya geri ver
+        self.frame_ring.release(self.consumer_frame)
+        self.consumer_frame = yuv_frame
+
+        if self.luma:
+            # I420'nin Y düzlemi zaten gri görüntü - dönüşüm yok
+            return Frame(self.frame_ring.luma(yuv_frame), yuv=yuv_frame, bgr_buffer=self.bgr_frame,
+                         timestamp=capture_time)
+
+        frame = Frame(None, yuv=yuv_frame, bgr_buffer=self.bgr_frame, timestamp=capture_time)
+        frame.gray = cv2.cvtColor(frame.to_bgr(), cv2.COLOR_BGR2GRAY, dst=self.gray_frame)
+        return frame
+
+    def close(self):
+        """Stream'i durdur"""
+        self.running = False
+
+        if self.process:
+            try:
+                os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
+                self.process.wait(timeout=3)
+            except:
+                try:
+                    os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
+                except:
+                    pass
+
+        # Queue temizle: slot'ları halkaya geri ver (boş slot bekleyen okuma thread'i uyansın)
+        while not self.frame_queue.empty():
+            try:
+                dropped_frame, _ = self.frame_queue.get_nowait()
+            except queue.Empty:
+                break
+            if self.frame_ring is not None:
+                self.frame_ring.release(dropped_frame)
+        if self.frame_ring is not None:
+            self.frame_ring.release(self.consumer_frame)
+        self.consumer_frame = None
+
+
+class RawYUVFileSource(FrameSource):
+    def __init__(self, path, width=640, height=480, loop=False):
+        """FIFO'dan kaydedilmiş ham YUV420 (I420) dosyasını tekrar oynatır"""
+        super().__init__(width, height)
+        self.path = path
+        self.loop = loop
+        self.file = None
+        self.frame_ring = YUVFrameRing(width, height, slots=2)
+        self.bgr_frame = np.empty((height, width, 3), dtype=np.uint8)
+
+    def open(self):
+        if not os.path.exists(self.path):
+            return False
+        self.file = open(self.path, 'rb', buffering=0)
+        self.finished = False
+        return True
+
+    def read(self, timeout=0.1):
+        yuv_frame = self.frame_ring.read_frame(self.file)
+        if yuv_frame is None and self.loop:
+            # Başa sar (yarım kalan son frame atlanır)
+            self.file.seek(0)
+            yuv_frame = self.frame_ring.read_frame(self.file)
+        if yuv_frame is None:
+            self.finished = True
+            return None
+        return Frame(self.frame_ring.luma(yuv_frame), yuv=yuv_frame, bgr_buffer=self.bgr_frame)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class VideoCaptureSource(FrameSource):
+    def __init__(self, camera_index=0, width=640, height=480, fps=30):
+        """OpenCV VideoCapture (V4L2 webcam) kaynağı"""
+        super().__init__(width, height)
+        self.camera_index = camera_index
+        self.fps = fps
+        self.cap = None
+
+        # Her okumada tekrar kullanılan buffer'lar
+        self.bgr_frame = None
+        self.gray_frame = None
+        self.test_frame_pending = False  # open() içinde okunan ilk frame henüz verilmedi
+
+    def open_capture(self):
+        """VideoCapture nesnesini aç (alt sınıflar farklı hedef açabilir)"""
+        # OpenCV VideoCapture ile webcam bağlantısı
+        self.cap = cv2.VideoCapture(self.camera_index)
+
+        if not self.cap.isOpened():
+            # Farklı index'leri dene
+            for i in range(5):
+                self.cap = cv2.VideoCapture(i)
+                if self.cap.isOpened():
+                    self.camera_index = i
+                    break
+            else:
+                return False
+
+        # Kamera ayarları
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        return True
+
+    def open(self):
+        """Kamerayı başlat"""
+        self.finished = False
+        if not self.open_capture():
+            return False
+
+        # Test frame al
+        ret, self.bgr_frame = self.cap.read()
+        if not ret:
+            return False
+
+        self.height, self.width = self.bgr_frame.shape[:2]
+        self.gray_frame = np.empty((self.height, self.width), dtype=np.uint8)
+        self.test_frame_pending = True
+        return True
+
+    def read(self, timeout=0.1):
+        if self.test_frame_pending:
+            # Test frame'i de kullan (video dosyasında ilk frame kaybolmasın)
+            self.test_frame_pending = False
+        else:
+            # Aynı buffer'a oku (boyut değişmedikçe yeni dizi ayrılmaz)
+            ret, self.bgr_frame = self.cap.read(self.bgr_frame)
+            if not ret:
+                self.finished = True
+                return None
+
+        if self.bgr_frame.shape[:2] != self.gray_frame.shape:
+            self.gray_frame = np.empty(self.bgr_frame.shape[:2], dtype=np.uint8)
+        gray = cv2.cvtColor(self.bgr_frame, cv2.COLOR_BGR2GRAY, dst=self.gray_frame)
+        return Frame(gray, bgr=self.bgr_frame)
+
+    def close(self):
+        if self.cap:
+            self.cap.release()
+
+
+class VideoFileSource(VideoCaptureSource):
+    def __init__(self, path, loop=False):
+        """Video dosyası kaynağı (kayıtlı uçuş görüntüleri için)"""
+        super().__init__()
+        self.path = path
+        self.loop = loop
+
+    def open_capture(self):
+        self.cap = cv2.VideoCapture(self.path)
+        return self.cap.isOpened()
+
+    def read(self, timeout=0.1):
+        frame = super().read(timeout)
+        if frame is None and self.loop:
+            # Başa sar
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.finished = False
+            frame = super().read(timeout)
+        return frame
+
+
+class ImageDirectorySource(FrameSource):
+    def __init__(self, directory, patterns=("*.png", "*.jpg", "*.jpeg", "*.bmp"), loop=False):
+        """Klasördeki resimleri isim sırasıyla frame olarak verir
+
+        directory: Tek klasör ya da klasör listesi (sırayla birleştirilir)
+        """
+        super().__init__()
+        self.directories = [directory] if isinstance(directory, str) else list(directory)
+        self.patterns = patterns
+        self.loop = loop
+        self.image_paths = []
+        self.index = 0
+
+    def open(self):
+        self.image_paths = [
+            path for directory in self.directories
+            for path in sorted(
+                match for pattern in self.patterns
+                for match in glob.glob(os.path.join(directory, pattern))
+            )
+        ]
+        self.index = 0
+        self.finished = not self.image_paths
+        return bool(self.image_paths)
+
+    def read(self, timeout=0.1):
+        # Okunamayan dosyaları atla (en fazla bir tur)
+        for _ in range(len(self.image_paths)):
+            if self.index >= len(self.image_paths):
+                if not self.loop:
+                    break
+                self.index = 0
+            bgr = cv2.imread(self.image_paths[self.index])
+            self.index += 1
+            if bgr is None:
+                continue
+            self.height, self.width = bgr.shape[:2]
+            return Frame(cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY), bgr=bgr)
+
+        self.finished = True
+        return None
+
+
+def create_frame_source(kind, **kwargs):
+    """İsimle frame kaynağı oluştur: "libcamera", "webcam", "video", "images", "yuv" """
+    sources = {
+        "libcamera": LibcameraFifoSource,
+        "yuv": RawYUVFileSource,
+        "webcam": VideoCaptureSource,
+        "video": VideoFileSource,
+        "images": ImageDirectorySource,
+    }
+    if kind not in sources:
+        raise ValueError(f"Bilinmeyen frame kaynağı: {kind}")
+    return sources[kind](**kwargs)
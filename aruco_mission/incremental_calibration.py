@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Artımlı Kamera Kalibrasyonu
+Görünümler tek tek eklenir; her eklemede önceki sonuçtan başlayarak yeniden kalibre edilir
+Görünüm başına yeniden izdüşüm hatası izlenir, aykırı görünümler otomatik atılır
+Parametreler oturunca (converged) çekim erken bitirilebilir
+"""
+
+import cv2
+import numpy as np
+
+
+class CalibrationView:
+    __slots__ = ("key", "object_points", "image_points", "error")
+
+    def __init__(self, key, object_points, image_points):
+        """Tek kalibrasyon görünümü; key: fotoğraf yolu gibi kimlik"""
+        self.key = key
+        self.object_points = object_points
+        self.image_points = image_points
+        self.error = None  # Görünüm RMS yeniden izdüşüm hatası (piksel)
+
+
+class IncrementalCalibrator:
+    def __init__(self, object_points, image_size, min_views=10, max_view_error=1.0,
+                 outlier_factor=2.5, convergence_tol=0.005, convergence_window=3):
+        """Görünüm görünüm kalibrasyon
+
+        object_points: Tahta 3D noktaları (Nx3 float32); ChArUco'da görünüm başına verilir (None)
+        image_size: (genişlik, yükseklik)
+        min_views: İlk kalibrasyon için gereken görünüm sayısı
+        max_view_error: Bu hatanın (piksel) altındaki görünüm asla atılmaz
+        outlier_factor: Hata > outlier_factor * medyan olan görünüm aykırı sayılır
+        convergence_tol: fx, fy, cx, cy göreli değişim sınırı
+        convergence_window: Art arda kaç eklemede değişim sınır altında kalmalı
+        """
+        self.object_points = np.asarray(object_points, dtype=np.float32) if object_points is not None else None
+        self.image_size = (int(image_size[0]), int(image_size[1]))
+        self.min_views = min_views
+        self.max_view_error = max_view_error
+        self.outlier_factor = outlier_factor
+        self.convergence_tol = convergence_tol
+        self.convergence_window = convergence_window
+
+        self.views = []
+        self.rejected = []  # Atılan görünümler (key, hata)
+        self.camera_matrix = None
+        self.dist_coeffs = None
+        self.rms = None
+        self.stable_count = 0
+        self.calibration_count = 0
+
+    @property
+    def converged(self):
+        return self.stable_count >= self.convergence_window
+
+    @property
+    def view_errors(self):
+        return {view.key: view.error for view in self.views}
+
+    def add_view(self, image_points, key=None, recalibrate=True, object_points=None):
+        """Görünüm ekle; yeterli görünüm varsa yeniden kalibre et
+
+        object_points: Bu görünümün 3D noktaları (kısmi ChArUco görünümü), None ise tahtanın tamamı
+        Returns: Eklenen görünüm tutulduysa True, aykırı olarak atıldıysa False
+        """
+        key = key if key is not None else len(self.views) + len(self.rejected)
+        object_points = self.object_points if object_points is None else np.asarray(object_points, dtype=np.float32)
+        self.views.append(CalibrationView(key, object_points.reshape(-1, 1, 3),
+                                          np.asarray(image_points, dtype=np.float32).reshape(-1, 1, 2)))
+        if not recalibrate or len(self.views) < self.min_views:
+            return True
+
+        previous = self.intrinsics()
+        self.calibrate()
+        kept = any(view.key == key for view in self.views)
+
+        current = self.intrinsics()
+        if previous is not None and self.relative_change(previous, current) < self.convergence_tol:
+            self.stable_count += 1
+        else:
+            self.stable_count = 0
+        return kept
+
+    def intrinsics(self):
+        if self.camera_matrix is None:
+            return None
+        return np.array([self.camera_matrix[0, 0], self.camera_matrix[1, 1],
+                         self.camera_matrix[0, 2], self.camera_matrix[1, 2]])
+
+    @staticmethod
+    def relative_change(previous, current):
+        return float(np.max(np.abs(current - previous) / np.abs(previous)))
+
+    def run_calibration(self):
+        """Tek calibrateCamera çağrısı; önceki sonuç varsa başlangıç tahmini olarak kullanılır"""
+        flags = 0
+        camera_matrix, dist_coeffs = None, None
+        if self.camera_matrix is not None:
+            flags = cv2.CALIB_USE_INTRINSIC_GUESS
+            camera_matrix = self.camera_matrix.copy()
+            dist_coeffs = self.dist_coeffs.copy()
+
+        rms, camera_matrix, dist_coeffs, _, _, _, _, per_view = cv2.calibrateCameraExtended(
+            [view.object_points for view in self.views], [view.image_points for view in self.views],
+            self.image_size, camera_matrix, dist_coeffs, flags=flags
+        )
+        self.calibration_count += 1
+        for view, error in zip(self.views, per_view.reshape(-1)):
+            view.error = float(error)
+        return rms, camera_matrix, dist_coeffs
+
+    def calibrate(self):
+        """Kalibre et, en kötü aykırı görünümü atıp tekrarla (aykırı kalmayana kadar)
+
+        Returns: (rms, camera_matrix, dist_coeffs), yetersiz görünümde None
+        """
+        while len(self.views) >= self.min_views:
+            rms, camera_matrix, dist_coeffs = self.run_calibration()
+            self.rms, self.camera_matrix, self.dist_coeffs = rms, camera_matrix, dist_coeffs
+
+            errors = np.array([view.error for view in self.views])
+            limit = max(self.max_view_error, self.outlier_factor * float(np.median(errors)))
+            worst = int(np.argmax(errors))
+            if errors[worst] <= limit or len(self.views) == self.min_views:
+                return rms, camera_matrix, dist_coeffs
+
+            view = self.views.pop(worst)
+            self.rejected.append((view.key, view.error))
+            print(f"   🗑️  Aykırı görünüm atıldı: {view.key} ({view.error:.2f} px > {limit:.2f} px)")
+        return None
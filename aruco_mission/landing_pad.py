@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+İç İçe Marker'lı İniş Pedi
+Büyük dış marker yüksekten (8-10 m) görünür, küçük iç marker'lar alçakta hassas pose verir
+Her marker ID'sinin kendi boyutu ve ped merkezine göre konumu vardır
+Alçalırken yeterince büyük görünen en küçük marker'a geçilir
+
+Not: OpenCV iç marker'ı tanıyınca onu çevreleyen dış marker'ı elemektedir; geçiş bandında
+(iç marker henüz küçükken) iç marker bölgesi beyaza boyanıp dış marker tekrar aranır
+"""
+
+import cv2
+import numpy as np
+
+# Dış marker'ın boyutuna oranla iç marker'ın beyaz sessiz bölgesi (1 hücre, 4x4 + kenar = 6 hücre)
+QUIET_ZONE_RATE = 1.0 / 6.0
+
+
+class PadMarker:
+    __slots__ = ("marker_id", "size", "offset")
+
+    def __init__(self, marker_id, size, offset=(0.0, 0.0)):
+        """Pedin tek marker'ı
+
+        size: Marker kenarı (m, siyah kenarlık dahil)
+        offset: Marker merkezinin ped merkezine göre konumu (m, marker düzleminde x sağ, y yukarı)
+        """
+        self.marker_id = int(marker_id)
+        self.size = float(size)
+        self.offset = np.array([offset[0], offset[1], 0.0], dtype=np.float64)
+
+
+class LandingPad:
+    def __init__(self, markers, min_side_px=30.0):
+        """Marker'lar büyükten küçüğe sıralanır
+
+        min_side_px: Bir marker'a geçmek için görüntüdeki en küçük kenar uzunluğu (piksel)
+        """
+        self.markers = sorted(markers, key=lambda marker: -marker.size)
+        self.by_id = {marker.marker_id: marker for marker in self.markers}
+        if len(self.by_id) != len(self.markers):
+            raise ValueError("İniş pedinde aynı marker ID'si birden fazla")
+        self.min_side_px = min_side_px
+
+    @classmethod
+    def single(cls, marker_id, size):
+        """Tek marker'lı ped (eski davranış)"""
+        return cls([PadMarker(marker_id, size)])
+
+    @property
+    def ids(self):
+        return tuple(self.by_id)
+
+    @property
+    def nested(self):
+        return len(self.markers) > 1
+
+    @property
+    def outer(self):
+        return self.markers[0]
+
+    def find(self, ids):
+        """Tespit edilen ID dizisindeki ped marker'ları: [(indeks, PadMarker)] büyükten küçüğe"""
+        if ids is None:
+            return []
+        found = [(i, self.by_id[int(marker_id)]) for i, marker_id in enumerate(ids.reshape(-1))
+                 if int(marker_id) in self.by_id]
+        return sorted(found, key=lambda item: -item[1].size)
+
+    def select(self, corners, found):
+        """Pose için kullanılacak marker: yeterince büyük görünen en küçük, yoksa en büyük
+
+        Returns: (indeks, PadMarker, kenar piksel) veya None
+        """
+        best = None
+        for index, marker in found:
+            side = marker_side_px(corners[index])
+            if best is None or side >= self.min_side_px:
+                best = (index, marker, side)
+        return best
+
+    def larger_than(self, marker):
+        """Verilen marker'dan büyük ped marker'ları (büyükten küçüğe)"""
+        return [candidate for candidate in self.markers if candidate.size > marker.size]
+
+    def pad_position(self, marker, rvec, tvec):
+        """Marker pose'undan ped merkezinin kamera koordinatındaki konumu"""
+        if not marker.offset.any():
+            return tvec
+        rotation, _ = cv2.Rodrigues(np.asarray(rvec, dtype=np.float64).reshape(3))
+        return np.asarray(tvec, dtype=np.float64).reshape(3) - rotation @ marker.offset
+
+    def create_image(self, dictionary, pixels_per_meter=1000):
+        """Baskı için ped görüntüsü (iç marker'lar beyaz sessiz bölgeleriyle dış marker'ın içinde)"""
+        outer = self.outer
+        outer_px = int(round(outer.size * pixels_per_meter))
+        image = cv2.aruco.generateImageMarker(dictionary, outer.marker_id, outer_px)
+        for marker in self.markers[1:]:
+            side = int(round(marker.size * pixels_per_meter))
+            quiet = int(round(side * QUIET_ZONE_RATE))
+            inner = cv2.copyMakeBorder(cv2.aruco.generateImageMarker(dictionary, marker.marker_id, side),
+                                       quiet, quiet, quiet, quiet, cv2.BORDER_CONSTANT, value=255)
+            # Görüntüde y aşağı: offset'in y'si ters çevrilir
+            cx = outer_px // 2 + int(round(marker.offset[0] * pixels_per_meter))
+            cy = outer_px // 2 - int(round(marker.offset[1] * pixels_per_meter))
+            x0, y0 = cx - inner.shape[1] // 2, cy - inner.shape[0] // 2
+            image[y0:y0 + inner.shape[0], x0:x0 + inner.shape[1]] = inner
+        border = int(round(outer_px * QUIET_ZONE_RATE))
+        return cv2.copyMakeBorder(image, border, border, border, border, cv2.BORDER_CONSTANT, value=255)
+
+
+def marker_side_px(corners):
+    """Köşelerden ortalama kenar uzunluğu (piksel)"""
+    points = np.asarray(corners, dtype=np.float32).reshape(4, 2)
+    return float(np.linalg.norm(points - np.roll(points, 1, axis=0), axis=1).mean())
+
+
+def reveal_outer_marker(detector, gray, inner_corners, outer_id, size_ratio):
+    """İç marker'ı beyaza boyayıp çevresinde dış marker'ı ara
+
+    size_ratio: Dış marker boyutu / iç marker boyutu (ROI genişliği için)
+    Returns: Dış marker köşeleri (1x4x2, tam frame koordinatı) veya None
+    """
+    inner = np.asarray(inner_corners, dtype=np.float32).reshape(4, 2)
+    center = inner.mean(axis=0)
+    side = marker_side_px(inner)
+
+    # Dış marker iç marker'ı içerir: merkez etrafında dış marker + pay kadar bölge
+    half = side * size_ratio * 0.75 + 8
+    height, width = gray.shape[:2]
+    x0, y0 = int(max(0, center[0] - half)), int(max(0, center[1] - half))
+    x1, y1 = int(min(width, center[0] + half + 1)), int(min(height, center[1] + half + 1))
+
+    # Kamera buffer'ı değiştirilmez: sadece ROI kopyalanır
+    roi = gray[y0:y1, x0:x1].copy()
+    scale = 1.0 + 2.0 * QUIET_ZONE_RATE * 1.15
+    mask = (inner - center) * scale + center - np.array([x0, y0], dtype=np.float32)
+    cv2.fillConvexPoly(roi, np.round(mask).astype(np.int32), 255)
+
+    corners, ids, _ = detector.detectMarkers(roi)
+    if ids is None:
+        return None
+    for i, marker_id in enumerate(ids.reshape(-1)):
+        if marker_id == outer_id:
+            return corners[i] + np.array([x0, y0], dtype=np.float32)
+    return None
+
+
+# 8-10 m'den görünen 50 cm dış marker, içinde mevcut 5 cm hedef marker (ID 42)
+NESTED_LANDING_PAD = LandingPad([PadMarker(43, 0.50), PadMarker(42, 0.05)])
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Görüntü -> Setpoint Gecikme Ölçümü
+Her frame yakalama anıyla (time.monotonic) damgalanır; tespit, pose ve onu kullanan
+VelocityNedYaw komutu aynı frame_id ile ilişkilendirilir
+Canlı: sabit kutulu histogramlar (O(1) kayıt) | Uçuş sonrası: JSON rapor
+
+Kullanım (uçuş sonrası rapor):
+    python3 aruco_mission/latency_monitor.py latency_report_1700000000.json
+"""
+
+import collections
+import json
+import sys
+import numpy as np
+
+# Aşamalar (ms):
+#   queue      yakalama -> tespitin başlaması (FIFO/queue bekleme)
+#   detect     detectMarkers
+#   pose       pose + filtre güncellemesi
+#   vision     yakalama -> pozisyon hazır
+#   command    pozisyon hazır -> setpoint gönderildi
+#   end_to_end yakalama -> setpoint gönderildi
+FRAME_STAGES = ("queue", "detect", "pose", "vision")
+COMMAND_STAGES = ("command", "end_to_end")
+STAGES = FRAME_STAGES + COMMAND_STAGES
+
+
+class LatencyHistogram:
+    def __init__(self, bin_ms=1.0, max_ms=500.0):
+        """Sabit genişlikli kutular; son kutu max_ms üstünü toplar"""
+        self.bin_ms = bin_ms
+        self.max_ms = max_ms
+        self.counts = np.zeros(int(max_ms / bin_ms) + 1, dtype=np.int64)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_seen_ms = 0.0
+
+    def add(self, seconds):
+        """Süreyi (saniye) ilgili kutuya ekle"""
+        ms = seconds * 1000.0
+        index = min(int(ms / self.bin_ms), len(self.counts) - 1) if ms > 0 else 0
+        self.counts[index] += 1
+        self.total += 1
+        self.sum_ms += ms
+        if ms > self.max_seen_ms:
+            self.max_seen_ms = ms
+
+    def percentile(self, q):
+        """q (0-100) yüzdelik dilimi (ms, kutu üst sınırı), boşsa 0"""
+        if not self.total:
+            return 0.0
+        rank = q / 100.0 * self.total
+        index = int(np.searchsorted(np.cumsum(self.counts), max(rank, 1)))
+        if index == len(self.counts) - 1:
+            return self.max_seen_ms  # Taşma kutusu: üst sınırı yok
+        return min((index + 1) * self.bin_ms, self.max_seen_ms)
+
+    def mean(self):
+        return self.sum_ms / self.total if self.total else 0.0
+
+    def to_dict(self):
+        return {
+            "bin_ms": self.bin_ms,
+            "max_ms": self.max_ms,
+            "counts": self.counts.tolist(),
+            "total": self.total,
+            "sum_ms": self.sum_ms,
+            "max_seen_ms": self.max_seen_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["bin_ms"], data["max_ms"])
+        histogram.counts = np.asarray(data["counts"], dtype=np.int64)
+        histogram.total = data["total"]
+        histogram.sum_ms = data["sum_ms"]
+        histogram.max_seen_ms = data["max_seen_ms"]
+        return histogram
+
+
+class LatencyMonitor:
+    def __init__(self, max_events=100000):
+        """Aşama histogramları + uçuş sonrası için frame/komut olay kaydı
+
+        max_events: Saklanan en fazla olay (30 fps'de ~55 dakika), eskiler düşer
+        """
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+        # Olay kaydı: ("frame", frame_id, capture, detect_start, detect_end, pose_end)
+        #             ("command", frame_id, capture, pose_end, sent, label)
+        self.events = collections.deque(maxlen=max_events)
+
+    def record_frame(self, frame_id, capture_time, detect_start, detect_end, pose_end):
+        """Kamera thread'inden: hedefin pozisyonu üretilen frame'in aşama zamanları"""
+        self.histograms["queue"].add(detect_start - capture_time)
+        self.histograms["detect"].add(detect_end - detect_start)
+        self.histograms["pose"].add(pose_end - detect_end)
+        self.histograms["vision"].add(pose_end - capture_time)
+        self.events.append(("frame", frame_id, capture_time, detect_start, detect_end, pose_end))
+
+    def record_command(self, frame_id, capture_time, pose_end, sent_time, label=""):
+        """Misyondan: frame_id'li pozisyonla hesaplanan setpoint gönderildi"""
+        self.histograms["command"].add(sent_time - pose_end)
+        self.histograms["end_to_end"].add(sent_time - capture_time)
+        self.events.append(("command", frame_id, capture_time, pose_end, sent_time, label))
+
+    def summary(self):
+        """Aşama başına {count, p50, p95, p99, mean, max} (ms)"""
+        return {
+            stage: {
+                "count": histogram.total,
+                "p50": histogram.percentile(50),
+                "p95": histogram.percentile(95),
+                "p99": histogram.percentile(99),
+                "mean": histogram.mean(),
+                "max": histogram.max_seen_ms,
+            }
+            for stage, histogram in self.histograms.items()
+        }
+
+    def format_summary(self):
+        """Tablo halinde özet (canlı log ve rapor için)"""
+        lines = [f"{'stage':<12}{'count':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+        for stage, s in self.summary().items():
+            lines.append(f"{stage:<12}{s['count']:>8}{s['p50']:>9.1f}{s['p95']:>9.1f}{s['p99']:>9.1f}{s['max']:>9.1f}")
+        return "\n".join(lines)
+
+    def save(self, path):
+        """Histogramları ve olay kaydını JSON olarak yaz (uçuş sonrası analiz)"""
+        with open(path, "w") as f:
+            json.dump({
+                "histograms": {stage: h.to_dict() for stage, h in self.histograms.items()},
+                "events": list(self.events),
+            }, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        monitor = cls()
+        monitor.histograms = {stage: LatencyHistogram.from_dict(h) for stage, h in data["histograms"].items()}
+        monitor.events.extend(tuple(event) for event in data["events"])
+        return monitor
+
+
+def print_report(monitor, bar_width=40):
+    """Uçuş sonrası rapor: özet tablo + uçtan uca histogram"""
+    print(monitor.format_summary())
+
+    histogram = monitor.histograms["end_to_end"]
+    if not histogram.total:
+        print("\nSetpoint kaydı yok (pozisyon hiç komuta dönüşmedi)")
+        return
+
+    # 10 ms'lik kutularda uçtan uca dağılım (son grup eksikse sıfırla tamamlanır, taşma kutusu ayrı)
+    group = max(1, int(10 / histogram.bin_ms))
+    bins = histogram.counts[:-1]
+    counts = np.pad(bins, (0, -len(bins) % group)).reshape(-1, group).sum(axis=1)
+    overflow = histogram.counts[-1]
+    peak = max(counts.max(), overflow, 1)
+    print("\nend_to_end histogram")
+    for i, count in enumerate(counts):
+        if count:
+            low = i * group * histogram.bin_ms
+            print(f"{low:>6.0f}-{low + group * histogram.bin_ms:<4.0f} ms {'#' * int(bar_width * count / peak):<{bar_width}} {count}")
+    if overflow:
+        print(f"  >{histogram.max_ms:.0f} ms  {'#' * int(bar_width * overflow / peak):<{bar_width}} {overflow}")
+
+    # Aynı frame'i kullanan komut sayısı: >1 ise kontrol döngüsü kameradan hızlı
+    commands_per_frame = collections.Counter(event[1] for event in monitor.events if event[0] == "command")
+    if commands_per_frame:
+        reused = sum(1 for count in commands_per_frame.values() if count > 1)
+        print(f"\nSetpoint üreten frame: {len(commands_per_frame)}, birden fazla komutta kullanılan: {reused}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Kullanım: python3 latency_monitor.py <latency_report.json>")
+        sys.exit(1)
+    print_report(LatencyMonitor.load(sys.argv[1]))
@@ -0,0 +1,623 @@
+#!/usr/bin/env python3
+"""
+ArUco Tespit Motoru - DICT_4X4_50 - 3D Pozisyon Tespiti
+Tespit, pose, pozisyon buffer'ı ve overlay tek yerde; görüntü FrameSource'tan gelir
+"""
+
+import cv2
+import numpy as np
+import time
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_source import FrameSource
+from aruco_mission.position_filter import PositionFilter
+from aruco_mission.marker_kalman import MarkerKalmanFilter
+from aruco_mission.latency_monitor import LatencyMonitor
+from aruco_mission.detection_events import DetectionEventBridge, PoseEvent
+from aruco_mission.pose_engine import PoseEngine, rotation_vector_to_euler
+from aruco_mission.calibration_store import get_calibration
+from aruco_mission.detector_profile import load_detector_profile, create_detector_parameters
+from aruco_mission.marker_tracker import MarkerROITracker, CoarseMarkerSearch, SEARCH_PHASE, LANDING_PHASE
+from aruco_mission.landing_pad import LandingPad, reveal_outer_marker
+
+class MarkerDetectionEngine:
+    def __init__(self, frame_source: FrameSource, target_marker_id=42, roi_tracking=True,
+                 window_name='ArUco Kamera', buffer_size=10, center_threshold=0.025, stable_threshold=5,
+                 camera_id="default", detector_profile=None, landing_pad=None):
+        """Kaynaktan bağımsız ArUco tespit motoru - DICT_4X4_50
+        
+        detector_profile: DetectorParameters değerleri (None: detector_profile.json veya varsayılan)
+        landing_pad: İç içe marker'lı iniş pedi (None: tek target_marker_id, marker_size boyutunda)
+        """
+        
+        # Görüntü kaynağı (libcamera FIFO, webcam, video, resim klasörü)
+        self.frame_source = frame_source
+        self.window_name = window_name
+        self.running = False
+        
+        # ArUco detection status
+        self.is_found = False
+        self.is_centered = False
+        
+        # Position tracking
+        self.x_vec, self.y_vec, self.z_vec = 0.0, 0.0, 0.0
+        
+        # Precision landing parameters
+        # buffer_size: ortalamaya giren frame sayısı (O(1) halka buffer, büyütmek ucuz)
+        # center_threshold: 2.5cm merkez toleransı, stable_threshold: kaç frame sabit kalırsa merkezde
+        self.position_filter = PositionFilter(buffer_size, center_threshold, stable_threshold)
+        # Gecikmesiz kontrol için: hız tahmini + "şimdi"ye ileri tahmin
+        # (kısa kayıplarda sıfırlanmaz, max_gap'ten uzun kayıpta tahmin verilmez)
+        self.kalman = MarkerKalmanFilter()
+        
+        # Hedef marker ID'si
+        self.target_marker_id = target_marker_id
+        if self.target_marker_id >= 50:
+            self.target_marker_id = 42
+        
+        # ArUco setup - DICT_4X4_50
+        self.aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+        
+        # Tespit parametreleri profilden (detector_tuner.py ile ayarlanır)
+        self.detector_profile = detector_profile or load_detector_profile()
+        self.detector_params = create_detector_parameters(self.detector_profile)
+        
+        self.detector = cv2.aruco.ArucoDetector(self.aruco_dict, self.detector_params)
+        
+        # ArUco marker boyutu (metre cinsinden - gerçek boyutu)
+        self.marker_size = 0.05  # 5cm marker boyutu
+        
+        # İniş pedi: her ID kendi boyutuyla; alçalırken yeterince büyük görünen en küçük marker kullanılır
+        self.landing_pad = landing_pad or LandingPad.single(self.target_marker_id, self.marker_size)
+        self.active_marker_id = None
+        
+        # İlk tespitten sonra sadece tahmin edilen bölgede ara (kaçırırsa tam frame)
+        self.roi_tracking = roi_tracking
+        self.roi_tracker = MarkerROITracker(target_marker_id=self.target_marker_id, target_ids=self.landing_pad.ids)
+        
+        # Arama fazında küçük piramit seviyesinde tara, aday bulununca tam çözünürlüğe geç
+        # (büyük dış marker küçük seviyede de görünür)
+        self.detection_phase = LANDING_PHASE
+        self.coarse_search = CoarseMarkerSearch(target_marker_id=self.target_marker_id,
+                                                target_ids=self.landing_pad.ids)
+        
+        # 3D Pose estimation için kamera kalibrasyonu
+        self.camera_id = camera_id
+        self.setup_camera_calibration()
+        # solvePnP IPPE_SQUARE, köşe 3D noktaları önbellekte, önceki pose ile çözüm seçimi
+        self.pose_engine = PoseEngine(self.camera_matrix, self.dist_coeffs)
+        
+        # İstatistikler
+        self.start_time = time.time()
+        self.frame_count = 0
+        self.detection_count = 0
+        self.last_detection_time = 0
+        
+        # Gecikme ölçümü: yakalama -> tespit -> pose -> setpoint (frame_id ile ilişkilendirilir)
+        self.latency = LatencyMonitor()
+        self.last_pose_frame = None  # (frame_id, yakalama anı, pozisyon hazır anı)
+        
+        # Misyonun event loop'una pose olayları (polling yerine await)
+        self.events = DetectionEventBridge()
+    
+    def setup_camera_calibration(self, width=None, height=None):
+        """Kamera kalibrasyonunu depodan al (dosya süreç başına bir kez okunur, çözünürlüğe ölçeklenir)"""
+        width = width or self.frame_source.width
+        height = height or self.frame_source.height
+        self.calibration = get_calibration(width, height, self.camera_id)
+        self.camera_matrix = self.calibration.camera_matrix
+        self.dist_coeffs = self.calibration.dist_coeffs
+        self.calibration_shape = (height, width)
+    
+    def update_position(self, x, y, z, timestamp=None):
+        """ArUco pozisyonunu güncelle ve ortalama hesapla
+
+        timestamp: Frame'in yakalama anı (time.monotonic) - Kalman için
+        """
+        self.kalman.update(x, y, z, timestamp)
+        
+        # Halka buffer'a ekle, koşan toplamlardan ortalama al (buffer boyutundan bağımsız)
+        self.x_vec, self.y_vec, self.z_vec = self.position_filter.update(x, y, z)
+        self.is_centered = self.position_filter.is_centered
+    
+    def get_averaged_position(self):
+        """Ortalanmış pozisyonu döndür"""
+        return self.x_vec, self.y_vec, self.z_vec
+    
+    def get_predicted_position(self, now=None):
+        """Kalman ile şimdiki ana (yakalama + işleme gecikmesi telafi) tahmin edilen pozisyon
+        
+        Marker kayıpsa (filtre boş ya da son ölçüm max_gap'ten eski) None: eski tahminle yönlendirilmez
+        """
+        if now is None:
+            now = time.monotonic()
+        age = self.kalman.age(now)
+        if age is None or age > self.kalman.max_gap:
+            return None
+        position = self.kalman.predict(now)
+        return float(position[0]), float(position[1]), float(position[2])
+    
+    def get_velocity(self):
+        """Marker'ın kameraya göre hızı (m/s), Kalman tahmini"""
+        vx, vy, vz = self.kalman.velocity
+        return float(vx), float(vy), float(vz)
+    
+    def reset_position_tracking(self):
+        """Pozisyon takibini sıfırla"""
+        self.position_filter.reset()
+        self.pose_engine.reset()
+        self.is_centered = False
+        self.is_found = False
+        self.active_marker_id = None
+        self.roi_tracker.reset()
+        self.events.clear_latest()
+
+    def pose_ready(self, frame_id, capture_time, detect_start, detect_end, pose_end):
+        """Yeni pozisyon hazır: gecikmeyi kaydet ve bekleyen misyona haber ver"""
+        self.last_pose_frame = (frame_id, capture_time, pose_end)
+        self.latency.record_frame(frame_id, capture_time, detect_start, detect_end, pose_end)
+        self.events.publish(PoseEvent(frame_id, capture_time, self.x_vec, self.y_vec, self.z_vec, self.is_centered))
+    
+    async def wait_found(self, timeout=None):
+        """Hedef marker bulunana kadar bekle (ilk pose olayı); timeout dolarsa None"""
+        if self.events.loop is None:
+            self.events.bind()
+        if self.is_found and self.events.latest is not None:
+            return self.events.latest
+        return await self.events.next_pose(timeout)
+    
+    async def next_pose(self, timeout=None):
+        """Bir sonraki pose olayı (PoseEvent); timeout dolarsa None"""
+        return await self.events.next_pose(timeout)
+    
+    def poses(self, timeout=None):
+        """async for ile pose akışı; timeout içinde pose gelmezse None (marker kayıp)"""
+        return self.events.poses(timeout)
+    
+    def record_setpoint(self, label=""):
+        """Son pozisyonla hesaplanan setpoint gönderildi: uçtan uca gecikmeyi kaydet
+        
+        Misyon set_velocity_ned'den hemen sonra çağırır
+        """
+        if self.last_pose_frame is None:
+            return
+        frame_id, capture_time, pose_end = self.last_pose_frame
+        self.latency.record_command(frame_id, capture_time, pose_end, time.monotonic(), label)
+
+    def calibrate_camera_interactive(self):
+        """Interaktif kamera kalibrasyonu (opsiyonel)"""
+        pass
+    
+    def update_marker_size(self, size_in_meters):
+        """Marker boyutunu güncelle (metre cinsinden) - tek marker'lı pedde"""
+        self.marker_size = size_in_meters
+        if not self.landing_pad.nested:
+            self.landing_pad = LandingPad.single(self.target_marker_id, size_in_meters)
+    
+    def estimate_pose(self, corners, marker_size=None):
+        """ArUco marker'ın 3D pozisyonunu ve oryantasyonunu hesapla"""
+        if corners is None or len(corners) == 0:
+            return None, None
+        
+        # Pose estimation (ilk köşe seti takip edilen hedef)
+        return self.pose_engine.estimate_markers(corners, marker_size or self.marker_size)
+    
+    def select_pad_marker(self, gray, corners, ids):
+        """Pose için ped marker'ı: (köşeler 1x4x2, PadMarker) veya ped görünmüyorsa None
+        
+        Seçilen marker hâlâ küçükse ve daha büyüğü görünmüyorsa (OpenCV iç marker'ı tanıyınca
+        dış marker'ı eler) iç marker gizlenip dış marker yeniden aranır
+        """
+        found = self.landing_pad.find(ids)
+        if not found:
+            return None
+        index, marker, side = self.landing_pad.select(corners, found)
+        selected = corners[index]
+        
+        if side < self.landing_pad.min_side_px:
+            for larger in self.landing_pad.larger_than(marker):
+                outer_corners = reveal_outer_marker(self.detector, gray, selected, larger.marker_id,
+                                                    larger.size / marker.size)
+                if outer_corners is not None:
+                    return outer_corners, larger
+        return selected, marker
+    
+    def rotation_vector_to_euler(self, rvec):
+        """Rotation vector'ı Euler açılarına çevir (derece cinsinden) - sadece overlay'de çağrılır"""
+        return rotation_vector_to_euler(rvec)
+    
+    def draw_3d_axis(self, frame, rvec, tvec, camera_matrix, dist_coeffs, length=0.03):
+        """3D eksenleri çiz (X=Kırmızı, Y=Yeşil, Z=Mavi)"""
+        # 3D nokta tanımla (eksenlerin uç noktaları)
+        axis_points = np.array([
+            [0, 0, 0],           # Orijin
+            [length, 0, 0],      # X ekseni (Kırmızı)
+            [0, length, 0],      # Y ekseni (Yeşil) 
+            [0, 0, -length]      # Z ekseni (Mavi) - negatif çünkü kamera koordinat sistemi
+        ], dtype=np.float32)
+        
+        # 3D noktaları 2D'ye projekte et
+        axis_2d, _ = cv2.projectPoints(axis_points, rvec, tvec, camera_matrix, dist_coeffs)
+        axis_2d = axis_2d.astype(int)
+        
+        # Orijin noktası
+        origin = tuple(axis_2d[0].ravel())
+        x_point = tuple(axis_2d[1].ravel())
+        y_point = tuple(axis_2d[2].ravel())
+        z_point = tuple(axis_2d[3].ravel())
+        
+        # Eksenleri çiz
+        cv2.line(frame, origin, x_point, (0, 0, 255), 3)    # X ekseni - Kırmızı
+        cv2.line(frame, origin, y_point, (0, 255, 0), 3)    # Y ekseni - Yeşil
+        cv2.line(frame, origin, z_point, (255, 0, 0), 3)    # Z ekseni - Mavi
+        
+        # Eksen etiketleri
+        cv2.putText(frame, 'X', x_point, cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 2)
+        cv2.putText(frame, 'Y', y_point, cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        cv2.putText(frame, 'Z', z_point, cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+        
+        return frame
+    
+    def draw_crosshair(self, frame):
+        """Kamera ortasına crosshair çiz"""
+        height, width = frame.shape[:2]
+        center_x, center_y = width // 2, height // 2
+        
+        # Crosshair boyutları
+        line_length = 30
+        thickness = 2
+        
+        # Yatay çizgi
+        cv2.line(frame, 
+                (center_x - line_length, center_y), 
+                (center_x + line_length, center_y), 
+                (0, 255, 0), thickness)
+        
+        # Dikey çizgi
+        cv2.line(frame, 
+                (center_x, center_y - line_length), 
+                (center_x, center_y + line_length), 
+                (0, 255, 0), thickness)
+        
+        # Merkez nokta
+        cv2.circle(frame, (center_x, center_y), 3, (0, 255, 0), -1)
+        
+        # Crosshair etrafında çember (hedef alanı)
+        cv2.circle(frame, (center_x, center_y), 50, (0, 255, 0), 1)
+        
+        return frame
+    
+    def create_marker(self, marker_id=None):
+        """DICT_4X4_50 test marker oluştur"""
+        # Hedef marker ID'sini kullan
+        if marker_id is None:
+            marker_id = self.target_marker_id
+            
+        # ID kontrolü (DICT_4X4_50 için 0-49 arası)
+        if marker_id >= 50:
+            marker_id = 42
+        
+        marker = cv2.aruco.generateImageMarker(self.aruco_dict, marker_id, 200)
+        bordered = cv2.copyMakeBorder(marker, 50, 50, 50, 50, 
+                                    cv2.BORDER_CONSTANT, value=255)
+        
+        filename = f'target_marker_id_{marker_id}.png'
+        cv2.imwrite(filename, bordered)
+        return filename
+    
+    def set_detection_phase(self, phase, pyramid_levels=None):
+        """Tespit stratejisini misyon fazına göre değiştir ("search" / "landing")"""
+        if phase not in (SEARCH_PHASE, LANDING_PHASE):
+            raise ValueError(f"Geçersiz tespit fazı: {phase}")
+        self.detection_phase = phase
+        if pyramid_levels is not None:
+            self.coarse_search.pyramid_levels = pyramid_levels
+    
+    def detect_markers(self, gray):
+        """Aktif faz ve takip durumuna göre marker tespiti (köşeler tam frame koordinatında)"""
+        tracking = self.roi_tracking and self.roi_tracker.recent_corners
+        
+        # Arama fazı: hedef takipte değilse önce küçük seviyede aday ara
+        if self.detection_phase == SEARCH_PHASE and not tracking:
+            candidate = self.coarse_search.find_candidate(self.detector, gray)
+            if candidate is None:
+                return (), None, ()
+            # Aday bulundu: tam çözünürlükte aday bölgesinden başla
+            if self.roi_tracking:
+                self.roi_tracker.reset()
+                self.roi_tracker.update(candidate)
+        
+        if self.roi_tracking:
+            return self.roi_tracker.detect(self.detector, gray)
+        return self.detector.detectMarkers(gray)
+    
+    def process_frame(self, gray, current_time, timestamp=None):
+        """Tek frame'de sadece tespit + pose + pozisyon güncellemesi (çizim yok)
+        
+        timestamp: Frame'in yakalama anı (time.monotonic), None ise şimdi
+        """
+        self.frame_count += 1
+        frame_id = self.frame_count
+        if timestamp is None:
+            timestamp = time.monotonic()
+        
+        detect_start = time.monotonic()
+        corners, ids, rejected = self.detect_markers(gray)
+        detect_end = time.monotonic()
+        
+        detection = {
+            'frame_id': frame_id,
+            'timestamp': timestamp,
+            'detect_start': detect_start,
+            'detect_end': detect_end,
+            'pose_end': None,
+            'ids': ids,
+            'marker_id': None,
+            'position': None,
+            'corners': [],
+            'rvecs': None,
+            'tvecs': None
+        }
+        
+        # Sadece iniş pedi marker'ını filtrele
+        if ids is not None:
+            selection = self.select_pad_marker(gray, corners, ids)
+            
+            # Sadece ped marker'ı varsa işle
+            if selection is not None:
+                target_corners, marker = selection
+                filtered_corners = [target_corners]
+                
+                # Marker değişti: önceki marker'ın pose'u başlangıç tahmini olmasın
+                if marker.marker_id != self.active_marker_id:
+                    if self.active_marker_id is not None:
+                        print(f"🔁 İniş pedi marker'ı: ID {self.active_marker_id} -> ID {marker.marker_id}")
+                        self.pose_engine.reset()
+                    self.active_marker_id = marker.marker_id
+                
+                self.detection_count += 1
+                self.last_detection_time = current_time
+                
+                # Akış çözünürlüğü değiştiyse kalibrasyonu ölçekle (önbellekten, dosya okunmaz)
+                if gray.shape != self.calibration_shape:
+                    self.setup_camera_calibration(gray.shape[1], gray.shape[0])
+                    self.pose_engine.set_calibration(self.camera_matrix, self.dist_coeffs)
+                
+                # 3D Pose estimation (seçilen marker'ın kendi boyutuyla)
+                rvecs, tvecs = self.estimate_pose(filtered_corners, marker.size)
+                
+                if rvecs is not None and tvecs is not None:
+                    # Ped merkezinin pozisyonu (metre cinsinden)
+                    x, y, z = self.landing_pad.pad_position(marker, rvecs[0][0], tvecs[0][0])
+                    detection['position'] = (float(x), float(y), float(z))
+                    
+                    # Pozisyonu güncelle ve ortalama hesapla
+                    self.update_position(x, y, z, timestamp)
+                    self.is_found = True
+                    
+                    pose_end = time.monotonic()
+                    detection['pose_end'] = pose_end
+                    self.pose_ready(frame_id, timestamp, detect_start, detect_end, pose_end)
+                
+                detection['marker_id'] = marker.marker_id
+                detection['corners'] = filtered_corners
+                detection['rvecs'] = rvecs
+                detection['tvecs'] = tvecs
+                return detection
+        
+        # Hedef marker yok
+        self.reset_position_tracking()
+        return detection
+    
+    def draw_overlay(self, display_frame, detection, current_time):
+        """Tespit sonucunu, istatistikleri ve crosshair'i frame üzerine çiz"""
+        filtered_corners = detection['corners']
+        rvecs, tvecs = detection['rvecs'], detection['tvecs']
+        
+        if filtered_corners:
+            # ID 0 geçerli bir marker: sadece eksikse hedef ID kullanılır
+            marker_id = detection.get('marker_id')
+            if marker_id is None:
+                marker_id = self.target_marker_id
+            filtered_ids = np.array([[marker_id]] * len(filtered_corners))
+            
+            # Marker'ı çiz
+            cv2.aruco.drawDetectedMarkers(display_frame, filtered_corners, filtered_ids)
+            
+            # Hedef marker için bilgi
+            for i, corner_set in enumerate(filtered_corners):
+                
+                # Merkez hesapla
+                center = corner_set[0].mean(axis=0).astype(int)
+                cv2.putText(display_frame, f"ID {marker_id}", 
+                          (center[0]-20, center[1]-10), 
+                          cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+                
+                # 3D pozisyon bilgileri varsa
+                if rvecs is not None and tvecs is not None:
+                    rvec = rvecs[i][0]
+                    tvec = tvecs[i][0]
+                    
+                    # 3D eksenleri çiz
+                    self.draw_3d_axis(display_frame, rvec, tvec, 
+                                    self.camera_matrix, self.dist_coeffs)
+                    
+                    # Oryantasyon bilgileri (Euler açıları - derece)
+                    euler_angles = self.rotation_vector_to_euler(rvec)
+                    roll, pitch, yaw = euler_angles
+                    
+                    # Ortalanmış pozisyonu al
+                    avg_x, avg_y, avg_z = self.get_averaged_position()
+                    
+                    # Pozisyon yazısı (cm cinsinden göster)
+                    pos_text = f"Avg X:{avg_x*100:.1f}cm Y:{avg_y*100:.1f}cm Z:{avg_z*100:.1f}cm"
+                    cv2.putText(display_frame, pos_text, 
+                              (center[0]-100, center[1]-40), 
+                              cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
+                    
+                    # Merkez durumu
+                    center_status = "CENTERED" if self.is_centered else "CENTERING"
+                    center_color = (0, 255, 0) if self.is_centered else (0, 255, 255)
+                    cv2.putText(display_frame, center_status, 
+                              (center[0]-50, center[1]-55), 
+                              cv2.FONT_HERSHEY_SIMPLEX, 0.6, center_color, 2)
+                
+                # Hedef marker vurgusu
+                cv2.putText(display_frame, f"🎯 HEDEF: {marker_id}", 
+                          (center[0]-40, center[1]-10), 
+                          cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 3)
+                
+                # Özel hedef marker çerçevesi
+                cv2.circle(display_frame, tuple(center), 8, (0, 255, 0), -1)
+                cv2.circle(display_frame, tuple(center), 15, (0, 255, 0), 3)
+                
+            # Hedef tespit mesajı
+            status_text = "ARUCO_CENTERED" if self.is_centered else "ARUCO_FOUND"
+            status_color = (0, 255, 0) if self.is_centered else (0, 255, 255)
+            cv2.putText(display_frame, status_text, 
+                      (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, status_color, 3)
+        elif detection['ids'] is not None:
+            # Hedef marker yok
+            cv2.putText(display_frame, f"Searching...", 
+                      (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+        else:
+            # Hiç marker tespit edilmedi
+            cv2.putText(display_frame, f"Searching for ArUco ID: {self.target_marker_id}", 
+                      (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+        
+        # FPS ve istatistikler
+        elapsed = current_time - self.start_time
+        fps = self.frame_count / elapsed if elapsed > 0 else 0
+        
+        # Bilgi metinleri
+        info_text = [
+            f"FPS: {fps:.1f}",
+            f"Frame: {self.frame_count}",
+            f"Tespit: {self.detection_count}",
+            f"Süre: {elapsed:.1f}s"
+        ]
+        vision = self.latency.histograms["vision"]
+        if vision.total:
+            info_text.append(f"Gecikme p50/p95: {vision.percentile(50):.0f}/{vision.percentile(95):.0f} ms")
+        
+        # Bilgileri ekranda göster
+        for i, text in enumerate(info_text):
+            y_pos = display_frame.shape[0] - 25 * len(info_text) + (i * 25)
+            cv2.putText(display_frame, text, (10, y_pos), 
+                      cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            cv2.putText(display_frame, text, (10, y_pos), 
+                      cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
+        
+        # Son tespit zamanı
+        if self.detection_count > 0:
+            time_since_detection = current_time - self.last_detection_time
+            if time_since_detection < 2:  # 2 saniye içinde
+                cv2.putText(display_frame, "✅ HEDEF MARKER GÖRÜLÜYOR", 
+                          (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        
+        # Hedef marker bilgisi (sürekli göster)
+        cv2.putText(display_frame, f"Hedef ID: {self.target_marker_id}", 
+                  (10, display_frame.shape[0] - 130), 
+                  cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        cv2.putText(display_frame, f"Hedef ID: {self.target_marker_id}", 
+                  (10, display_frame.shape[0] - 130), 
+                  cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1)
+        
+        # Crosshair çiz (her zaman görünsün)
+        return self.draw_crosshair(display_frame)
+    
+    def show_camera_with_detection(self, headless=False, overlay_fps=15):
+        """Kamera görüntüsü ile birlikte ArUco tespiti
+        
+        headless: True ise pencere/çizim yok, sadece tespit + pose (uçuş bilgisayarı)
+        overlay_fps: Overlay çizim + imshow için üst sınır (None/0 = her frame)
+        """
+        
+        # Kaynağı başlat
+        if not self.frame_source.open():
+            return
+        
+        if not headless:
+            # OpenCV penceresi oluştur
+            cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
+        
+        # İstatistikler
+        self.start_time = time.time()
+        self.frame_count = 0
+        self.detection_count = 0
+        self.last_detection_time = 0
+        
+        # Overlay hız sınırı
+        overlay_interval = 1.0 / overlay_fps if overlay_fps else 0.0
+        last_overlay_time = 0
+        
+        self.running = True
+        try:
+            while self.running:
+                # Frame al
+                frame = self.frame_source.read(timeout=0.1)
+                
+                if frame is None:
+                    if self.frame_source.finished:
+                        break
+                    if headless:
+                        continue
+                    
+                    # Frame yoksa boş frame göster
+                    empty_frame = np.zeros((self.frame_source.height, self.frame_source.width, 3), dtype=np.uint8)
+                    cv2.putText(empty_frame, "Kamera bekleniyor...", 
+                              (180, 240), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+                    cv2.imshow(self.window_name, empty_frame)
+                    
+                    key = cv2.waitKey(30) & 0xFF
+                    if key == 27:
+                        break
+                    continue
+                
+                current_time = time.time()
+                
+                # ArUco tespit (gri görüntü kaynaktan hazır gelir)
+                detection = self.process_frame(frame.gray, current_time, frame.timestamp)
+                
+                # Headless: çizim, pencere ve BGR dönüşümü yok
+                if headless or current_time - last_overlay_time < overlay_interval:
+                    continue
+                last_overlay_time = current_time
+                
+                # Overlay için BGR sadece gösterim gerektiğinde oluşturulur
+                display_frame = self.draw_overlay(frame.to_bgr(), detection, current_time)
+                
+                # Çerçeve göster
+                cv2.imshow(self.window_name, display_frame)
+                
+                # Klavye kontrolü
+                key = cv2.waitKey(1) & 0xFF
+                
+                if key == 27:  # ESC
+                    break
+                elif key == ord('s') or key == ord('S'):  # Screenshot
+                    screenshot_path = f'screenshot_{int(current_time)}.jpg'
+                    cv2.imwrite(screenshot_path, display_frame)
+                elif key == ord(' '):  # SPACE - marker kaydet
+                    if detection['ids'] is not None:
+                        marker_path = f'detected_marker_{int(current_time)}.jpg'
+                        cv2.imwrite(marker_path, display_frame)
+        
+        except KeyboardInterrupt:
+            pass
+        
+        except Exception as e:
+            pass
+        
+        finally:
+            # Temizlik
+            self.running = False
+            if not headless:
+                cv2.destroyAllWindows()
+            self.frame_source.close()
+    
+    def stop_camera(self):
+        """Tespit döngüsünü ve kaynağı durdur (mission cleanup için)"""
+        self.running = False
+        self.frame_source.close()
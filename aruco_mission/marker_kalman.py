@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Marker Göreli Konumu için Sabit Hızlı Kalman Filtresi
+Durum: her eksende (konum, hız); frame zaman damgalarıyla (time.monotonic) çalışır
+predict(now) ile yakalama + işleme gecikmesi telafi edilir
+"""
+
+import time
+import numpy as np
+
+
+class MarkerKalmanFilter:
+    def __init__(self, process_noise=0.5, measurement_noise=0.0004, max_gap=0.5, max_prediction=0.25):
+        """Her eksen (x, y, z) bağımsız 2 durumlu [p, v] filtre, vektörize
+
+        process_noise: Beyaz gürültü ivme yoğunluğu q (m²/s³) - büyük = hızlı tepki
+        measurement_noise: Pose ölçüm varyansı r (m²) - 0.0004 ≈ 2cm std
+        max_gap: Bu süreden (s) uzun tespit boşluğunda filtre yeniden başlatılır
+        max_prediction: Son ölçümden en fazla bu kadar (s) ileri tahmin yapılır
+        """
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.max_gap = max_gap
+        self.max_prediction = max_prediction
+        self.reset()
+
+    def reset(self):
+        """Durumu sil, sonraki ölçüm filtreyi yeniden başlatır"""
+        self.position = np.zeros(3)
+        self.velocity = np.zeros(3)
+        # Eksen başına kovaryans: P = [[p_pp, p_pv], [p_pv, p_vv]]
+        self.p_pp = np.zeros(3)
+        self.p_pv = np.zeros(3)
+        self.p_vv = np.zeros(3)
+        self.timestamp = None
+        self.initialized = False
+
+    def _initialize(self, measurement, timestamp):
+        self.position = np.asarray(measurement, dtype=np.float64).copy()
+        self.velocity = np.zeros(3)
+        self.p_pp = np.full(3, self.measurement_noise)
+        self.p_pv = np.zeros(3)
+        self.p_vv = np.full(3, 1.0)  # Hız bilinmiyor: ~1 m/s belirsizlik
+        self.timestamp = timestamp
+        self.initialized = True
+
+    def update(self, x, y, z, timestamp=None):
+        """Yakalama zamanı `timestamp` olan ölçümle filtreyi güncelle
+
+        Returns: (konum, hız) - frame anındaki filtrelenmiş tahmin
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        measurement = (x, y, z)
+
+        if not self.initialized or timestamp - self.timestamp > self.max_gap:
+            self._initialize(measurement, timestamp)
+            return self.position, self.velocity
+
+        dt = timestamp - self.timestamp
+        if dt < 0:
+            # Sıra dışı (eski) frame: durumu geri saramayız, atla
+            return self.position, self.velocity
+
+        # Tahmin: x = F x, P = F P F' + Q (sabit hız, ayrık beyaz gürültü ivme)
+        q = self.process_noise
+        self.position = self.position + self.velocity * dt
+        p_pp = self.p_pp + dt * (2.0 * self.p_pv + dt * self.p_vv) + q * dt ** 3 / 3.0
+        p_pv = self.p_pv + dt * self.p_vv + q * dt ** 2 / 2.0
+        p_vv = self.p_vv + q * dt
+
+        # Düzeltme: sadece konum ölçülür (H = [1, 0])
+        innovation = np.asarray(measurement, dtype=np.float64) - self.position
+        s = p_pp + self.measurement_noise
+        k_p = p_pp / s
+        k_v = p_pv / s
+        self.position = self.position + k_p * innovation
+        self.velocity = self.velocity + k_v * innovation
+        self.p_pp = (1.0 - k_p) * p_pp
+        self.p_pv = (1.0 - k_p) * p_pv
+        self.p_vv = p_vv - k_v * p_pv
+
+        self.timestamp = timestamp
+        return self.position, self.velocity
+
+    def predict(self, now=None):
+        """`now` anındaki (varsayılan: şimdi) konum tahmini, filtre boşsa None
+
+        Ekstrapolasyon max_prediction ile sınırlı: eski veriyle uzağa kaçmaz
+        """
+        if not self.initialized:
+            return None
+        if now is None:
+            now = time.monotonic()
+        dt = min(max(now - self.timestamp, 0.0), self.max_prediction)
+        return self.position + self.velocity * dt
+
+    def age(self, now=None):
+        """Son ölçümden bu yana geçen süre (s), filtre boşsa None"""
+        if not self.initialized:
+            return None
+        if now is None:
+            now = time.monotonic()
+        return now - self.timestamp
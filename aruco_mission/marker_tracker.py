@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Hedef Marker ROI Takibi ve Kaba-İnce (Coarse-to-Fine) Arama
+İlk tespitten sonra sadece tahmin edilen bölgede (padded crop) arama yapar
+Arama fazında küçültülmüş görüntüde tarar, aday bulununca tam çözünürlüğe geçer
+"""
+
+import cv2
+import numpy as np
+
+# Misyon fazları
+SEARCH_PHASE = "search"    # Sadece hedef görüşte mi? (küçük piramit seviyesi)
+LANDING_PHASE = "landing"  # Hassas iniş (tam çözünürlük + pose)
+
+
+class MarkerROITracker:
+    def __init__(self, target_marker_id=42, padding=0.6, min_padding=24, history=3, target_ids=None):
+        """Son köşelerden marker'ın bir sonraki bounding box'ını tahmin eder
+
+        target_ids: İç içe ped için hedef ID'leri, tercih sırasıyla (None: sadece target_marker_id)
+        padding: Kutu boyutuna oranla her kenara eklenen pay
+        min_padding: Piksel cinsinden en az pay (küçük/uzak marker için)
+        history: Hız tahmini için saklanan son tespit sayısı
+        """
+        self.target_marker_id = target_marker_id
+        self.target_ids = tuple(target_ids) if target_ids else (target_marker_id,)
+        self.padding = padding
+        self.min_padding = min_padding
+        self.history = history
+
+        self.recent_corners = []  # Son tespitlerin köşeleri (4x2, tam frame koordinatı)
+
+        # İstatistikler
+        self.roi_hits = 0
+        self.roi_misses = 0
+        self.full_frame_searches = 0
+
+    def reset(self):
+        """Takibi bırak, sonraki frame tam frame aranır"""
+        self.recent_corners = []
+
+    def update(self, corners):
+        """Hedef marker'ın köşelerini geçmişe ekle"""
+        self.recent_corners.append(np.asarray(corners, dtype=np.float32).reshape(4, 2))
+        if len(self.recent_corners) > self.history:
+            self.recent_corners.pop(0)
+
+    def predict_roi(self, frame_shape):
+        """Sonraki frame için (x0, y0, x1, y1) arama bölgesi, takip yoksa None"""
+        if not self.recent_corners:
+            return None
+
+        last = self.recent_corners[-1]
+        x_min, y_min = last.min(axis=0)
+        x_max, y_max = last.max(axis=0)
+
+        # Sabit hız varsayımı: merkezin son frame'ler arası ortalama kayması
+        if len(self.recent_corners) >= 2:
+            shift = (last.mean(axis=0) - self.recent_corners[0].mean(axis=0)) / (len(self.recent_corners) - 1)
+            x_min, x_max = x_min + shift[0], x_max + shift[0]
+            y_min, y_max = y_min + shift[1], y_max + shift[1]
+        else:
+            shift = np.zeros(2, dtype=np.float32)
+
+        # Pay: kutu boyutu + hareket miktarı kadar genişlet
+        size = max(x_max - x_min, y_max - y_min)
+        pad = max(self.min_padding, self.padding * size + np.abs(shift).max())
+
+        height, width = frame_shape[:2]
+        x0 = int(max(0, x_min - pad))
+        y0 = int(max(0, y_min - pad))
+        x1 = int(min(width, x_max + pad + 1))
+        y1 = int(min(height, y_max + pad + 1))
+
+        if x1 - x0 < 16 or y1 - y0 < 16:
+            return None
+        return x0, y0, x1, y1
+
+    def detect(self, detector, gray):
+        """Önce tahmin edilen ROI'de, kaçırırsa tam frame'de detectMarkers çalıştır
+
+        Returns: (corners, ids, rejected) - köşeler her zaman tam frame koordinatında
+        """
+        roi = self.predict_roi(gray.shape)
+
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            # Crop bir görünüm (view), kopya yok
+            corners, ids, rejected = detector.detectMarkers(gray[y0:y1, x0:x1])
+            if ids is not None and any(target in ids for target in self.target_ids):
+                offset = np.array([x0, y0], dtype=np.float32)
+                corners = tuple(corner + offset for corner in corners)
+                rejected = tuple(candidate + offset for candidate in rejected)
+                self.roi_hits += 1
+                self._track(corners, ids)
+                return corners, ids, rejected
+            self.roi_misses += 1
+
+        # Tam frame arama (ilk tespit veya ROI kaçırdı)
+        self.full_frame_searches += 1
+        corners, ids, rejected = detector.detectMarkers(gray)
+        self._track(corners, ids)
+        return corners, ids, rejected
+
+    def _track(self, corners, ids):
+        """Hedef bulunduysa geçmişi güncelle, bulunamadıysa takibi bırak"""
+        index = find_target(ids, self.target_ids)
+        if index is None:
+            self.reset()
+            return
+        # Ped marker'ı değiştiyse eski kutudan hız tahmini yapılmaz
+        if self.recent_corners:
+            ratio = marker_area(corners[index]) / max(marker_area(self.recent_corners[-1]), 1.0)
+            if not 0.5 < ratio < 2.0:
+                self.reset()
+        self.update(corners[index])
+
+
+class CoarseMarkerSearch:
+    def __init__(self, target_marker_id=42, pyramid_levels=1, target_ids=None):
+        """Arama fazı için küçültülmüş görüntüde hedef marker adayı arar
+
+        pyramid_levels: Her seviye çözünürlüğü yarıya indirir (1 = 320x240, 2 = 160x120)
+        target_ids: İç içe ped için hedef ID'leri, tercih sırasıyla (None: sadece target_marker_id)
+        """
+        self.target_marker_id = target_marker_id
+        self.target_ids = tuple(target_ids) if target_ids else (target_marker_id,)
+        self.pyramid_levels = pyramid_levels
+        self.small_frame = None  # Küçültme için tek seferlik hedef buffer
+
+        # İstatistikler
+        self.coarse_searches = 0
+        self.candidate_hits = 0
+
+    def find_candidate(self, detector, gray):
+        """Küçük seviyede hedefi ara; bulunursa tam çözünürlük köşeleri (4x2), yoksa None"""
+        scale = 2 ** self.pyramid_levels
+        size = (gray.shape[1] // scale, gray.shape[0] // scale)
+        if self.small_frame is None or self.small_frame.shape[::-1] != size:
+            self.small_frame = np.empty((size[1], size[0]), dtype=np.uint8)
+
+        # INTER_AREA, 2^n küçültmede piramit seviyesiyle aynı ortalamayı verir
+        cv2.resize(gray, size, dst=self.small_frame, interpolation=cv2.INTER_AREA)
+        self.coarse_searches += 1
+
+        corners, ids, rejected = detector.detectMarkers(self.small_frame)
+        index = find_target(ids, self.target_ids)
+        if index is None:
+            return None
+
+        self.candidate_hits += 1
+        # Piksel merkezleri hizalanarak tam çözünürlüğe ölçekle
+        return (corners[index].reshape(4, 2) + 0.5) * scale - 0.5
+
+
+def find_target(ids, target_ids):
+    """target_ids sırasına göre ilk bulunan hedefin ids içindeki indeksi, yoksa None"""
+    if ids is None:
+        return None
+    flat = ids.flatten()
+    for target in target_ids:
+        matches = np.flatnonzero(flat == target)
+        if len(matches):
+            return int(matches[0])
+    return None
+
+
+def marker_area(corners):
+    return float(cv2.contourArea(np.asarray(corners, dtype=np.float32).reshape(4, 2)))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+solvePnP (SOLVEPNP_IPPE_SQUARE) ile Marker Pose Tahmini
+Marker köşe 3D noktaları boyut başına bir kez hesaplanır
+IPPE iki çözüm verir; önceki pose'a yakın olan seçilir (düzlemsel marker'da ters dönme olmaz)
+Euler açıları gibi türetilmiş değerler sadece okunduğunda hesaplanır
+"""
+
+import functools
+import cv2
+import numpy as np
+
+
+@functools.lru_cache(maxsize=16)
+def marker_object_points(marker_size):
+    """IPPE_SQUARE köşe sırası (sol üst, sağ üst, sağ alt, sol alt), marker merkezi orijin"""
+    half = marker_size / 2.0
+    points = np.array([
+        [-half, half, 0.0],
+        [half, half, 0.0],
+        [half, -half, 0.0],
+        [-half, -half, 0.0],
+    ], dtype=np.float32)
+    points.setflags(write=False)  # Önbellekteki dizi paylaşılıyor
+    return points
+
+
+def rotation_vector_to_euler(rvec):
+    """Rotation vector'ı Euler açılarına çevir (derece, X-Y-Z sırası)"""
+    rotation_matrix, _ = cv2.Rodrigues(np.asarray(rvec, dtype=np.float64).reshape(3))
+    sy = np.sqrt(rotation_matrix[0, 0] * rotation_matrix[0, 0] + rotation_matrix[1, 0] * rotation_matrix[1, 0])
+
+    if sy >= 1e-6:
+        x = np.arctan2(rotation_matrix[2, 1], rotation_matrix[2, 2])
+        y = np.arctan2(-rotation_matrix[2, 0], sy)
+        z = np.arctan2(rotation_matrix[1, 0], rotation_matrix[0, 0])
+    else:
+        x = np.arctan2(-rotation_matrix[1, 2], rotation_matrix[1, 1])
+        y = np.arctan2(-rotation_matrix[2, 0], sy)
+        z = 0
+    return np.degrees([x, y, z])
+
+
+class MarkerPose:
+    __slots__ = ("rvec", "tvec", "reprojection_error", "_euler")
+
+    def __init__(self, rvec, tvec, reprojection_error=0.0):
+        """Tek marker pose'u; euler ilk okunduğunda hesaplanır"""
+        self.rvec = rvec
+        self.tvec = tvec
+        self.reprojection_error = reprojection_error
+        self._euler = None
+
+    @property
+    def euler_degrees(self):
+        if self._euler is None:
+            self._euler = rotation_vector_to_euler(self.rvec)
+        return self._euler
+
+    @property
+    def distance(self):
+        return float(np.linalg.norm(self.tvec))
+
+
+class PoseEngine:
+    def __init__(self, camera_matrix, dist_coeffs, warm_start=True):
+        """Kalibrasyonla solvePnP pose motoru
+
+        warm_start: Önceki pose'u IPPE'nin iki çözümünden birini seçmek için kullan
+        """
+        self.camera_matrix = camera_matrix
+        self.dist_coeffs = dist_coeffs
+        self.warm_start = warm_start
+        self.previous_rvec = None
+
+    def set_calibration(self, camera_matrix, dist_coeffs):
+        """Kalibrasyon değişti (önceki pose geçersiz)"""
+        self.camera_matrix = camera_matrix
+        self.dist_coeffs = dist_coeffs
+        self.reset()
+
+    def reset(self):
+        """Takip koptu: sonraki tahmin önceki pose'a bakmadan seçilir"""
+        self.previous_rvec = None
+
+    def solve(self, corners, marker_size, previous_rvec=None):
+        """Tek marker köşeleri (4x2 veya 1x4x2) -> MarkerPose, başarısızsa None
+
+        previous_rvec: Verilirse IPPE'nin iki çözümünden bu yönelime yakın olanı seçilir
+        """
+        image_points = np.asarray(corners, dtype=np.float32).reshape(4, 2)
+        count, rvecs, tvecs, errors = cv2.solvePnPGeneric(
+            marker_object_points(marker_size), image_points,
+            self.camera_matrix, self.dist_coeffs, flags=cv2.SOLVEPNP_IPPE_SQUARE
+        )
+        if not count:
+            return None
+
+        errors = errors.reshape(-1)
+        best = 0
+        # Çözümler yeniden izdüşüm hatasında ayırt edilemiyorsa önceki yönelime yakın olanı seç
+        if count > 1 and previous_rvec is not None and errors[1] < 2.0 * errors[0] + 0.5:
+            distances = [np.linalg.norm(rvec.reshape(3) - previous_rvec) for rvec in rvecs[:2]]
+            best = int(np.argmin(distances))
+
+        return MarkerPose(rvecs[best].reshape(3), tvecs[best].reshape(3), float(errors[best]))
+
+    def estimate(self, corners, marker_size):
+        """Takip edilen marker'ın pose'u (warm start ile), başarısızsa None"""
+        pose = self.solve(corners, marker_size, self.previous_rvec if self.warm_start else None)
+        self.previous_rvec = pose.rvec if pose is not None else None
+        return pose
+
+    def estimate_markers(self, corners_list, marker_size):
+        """estimatePoseSingleMarkers ile aynı çıktı: (rvecs, tvecs) Nx1x3, boşsa (None, None)
+
+        Önceki pose sadece ilk marker için kullanılır (takip edilen hedef)
+        """
+        if corners_list is None or len(corners_list) == 0:
+            return None, None
+
+        rvecs = np.empty((len(corners_list), 1, 3), dtype=np.float64)
+        tvecs = np.empty((len(corners_list), 1, 3), dtype=np.float64)
+        for i, corners in enumerate(corners_list):
+            pose = self.estimate(corners, marker_size) if i == 0 else self.solve(corners, marker_size)
+            if pose is None:
+                return None, None
+            rvecs[i, 0] = pose.rvec
+            tvecs[i, 0] = pose.tvec
+        return rvecs, tvecs
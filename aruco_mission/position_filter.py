@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Marker Pozisyon Filtresi
+Sabit boyutlu halka buffer + koşan toplamlar: ekleme ve ortalama O(1)
+Merkez kararlılığı (center_threshold / stable_threshold) burada tutulur
+"""
+
+import math
+import numpy as np
+
+
+class PositionRingBuffer:
+    def __init__(self, size=10):
+        """Son `size` (x, y, z) ölçümünü önceden ayrılmış dizide saklar"""
+        if size < 1:
+            raise ValueError("Buffer boyutu en az 1 olmalı")
+        self.size = size
+        self.samples = np.zeros((size, 3), dtype=np.float64)
+        self.index = 0   # Sıradaki yazma konumu
+        self.count = 0   # Dolu slot sayısı
+        self.sum_x = self.sum_y = self.sum_z = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Buffer'ı boşalt (dizi yeniden ayrılmaz)"""
+        self.index = 0
+        self.count = 0
+        self.sum_x = self.sum_y = self.sum_z = 0.0
+
+    def append(self, x, y, z):
+        """Yeni ölçümü ekle, doluysa en eskisinin yerine yaz"""
+        slot = self.samples[self.index]
+        if self.count == self.size:
+            old_x, old_y, old_z = slot
+            self.sum_x -= old_x
+            self.sum_y -= old_y
+            self.sum_z -= old_z
+        else:
+            self.count += 1
+
+        slot[0], slot[1], slot[2] = x, y, z
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_z += z
+
+        self.index += 1
+        if self.index == self.size:
+            self.index = 0
+            # Her turda bir kez tam topla: ekle/çıkar yuvarlama hatası birikmesin (amortize O(1))
+            self.sum_x, self.sum_y, self.sum_z = (float(v) for v in self.samples.sum(axis=0))
+
+    def mean(self):
+        """Buffer ortalaması (x, y, z), boşsa None"""
+        if not self.count:
+            return None
+        return self.sum_x / self.count, self.sum_y / self.count, self.sum_z / self.count
+
+    def values(self):
+        """Dolu slotlar, eskiden yeniye sıralı (kopya)"""
+        if self.count < self.size:
+            return self.samples[:self.count].copy()
+        return np.roll(self.samples, -self.index, axis=0)
+
+
+class PositionFilter:
+    def __init__(self, buffer_size=10, center_threshold=0.025, stable_threshold=5):
+        """Ortalama pozisyon + merkezde kalma kararı
+
+        buffer_size: Ortalamaya giren frame sayısı
+        center_threshold: Merkez sayılan XY yarıçapı (metre)
+        stable_threshold: Merkezde sayılmak için art arda gereken frame sayısı
+        """
+        self.buffer = PositionRingBuffer(buffer_size)
+        self.center_threshold = center_threshold
+        self.stable_threshold = stable_threshold
+        self.stable_count = 0
+        self.is_centered = False
+
+    @property
+    def buffer_size(self):
+        return self.buffer.size
+
+    def reset(self):
+        """Buffer ve kararlılık sayacını sıfırla"""
+        self.buffer.clear()
+        self.stable_count = 0
+        self.is_centered = False
+
+    def update(self, x, y, z):
+        """Ölçümü ekle; ortalama (x, y, z) döndür ve merkez durumunu güncelle"""
+        self.buffer.append(x, y, z)
+        avg_x, avg_y, avg_z = self.buffer.mean()
+
+        # Merkez kontrolü (X ve Y koordinatları)
+        if math.hypot(avg_x, avg_y) < self.center_threshold:
+            self.stable_count += 1
+            if self.stable_count >= self.stable_threshold:
+                self.is_centered = True
+        else:
+            self.stable_count = 0
+            self.is_centered = False
+
+        return avg_x, avg_y, avg_z
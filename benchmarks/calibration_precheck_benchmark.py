@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Live calibration detection benchmark: full-resolution findChessboardCorners on
+every frame (old capture loop) vs AutoCameraCalibration.detect_pattern
+(CALIB_CB_FAST_CHECK or a checkerboard corner count on a downscaled image,
+full detection only on a hit).
+Frames: bundled calibration images (board visible), blurred noise and
+cropped/zoomed board parts (no complete board), all 640x480 gray.
+
+Usage:
+    python3 benchmarks/calibration_precheck_benchmark.py --repeat 10
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+import cv2
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.auto_camera_calibration import AutoCameraCalibration
+
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "aruco_mission", "calibration_images")
+
+
+def make_frames() -> dict[str, list]:
+    boards = [cv2.imread(path, cv2.IMREAD_GRAYSCALE) for path in sorted(glob.glob(os.path.join(IMAGE_DIR, "*.jpg")))]
+    rng = np.random.default_rng(0)
+    noise = [cv2.GaussianBlur(rng.integers(0, 255, (480, 640), dtype=np.uint8), (7, 7), 0) for _ in range(5)]
+    crops = [cv2.resize(board[:240, :320], (640, 480)) for board in boards[:5]]
+    return {"board": boards, "no board (noise)": noise, "no board (crop)": crops}
+
+
+def run(detect, frames: list, repeat: int) -> tuple[float, int]:
+    found = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for gray in frames:
+            found += detect(gray) is not None
+    return (time.perf_counter() - start) / (repeat * len(frames)) * 1000.0, found // repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibration fast-check benchmark")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    calibrator = AutoCameraCalibration()
+
+    def old(gray):
+        found, corners = cv2.findChessboardCorners(gray, calibrator.chessboard_size, None)
+        return corners if found else None
+
+    def new(gray):
+        return calibrator.detect_pattern(gray)[0]
+
+    print(f"\n{'frames':<20}{'old ms':>10}{'new ms':>10}{'old found':>11}{'new found':>11}")
+    for name, frames in make_frames().items():
+        old_ms, old_found = run(old, frames, args.repeat)
+        new_ms, new_found = run(new, frames, args.repeat)
+        print(f"{name:<20}{old_ms:>10.1f}{new_ms:>10.1f}{old_found:>8}/{len(frames):<2}{new_found:>8}/{len(frames):<2}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Detection throughput benchmark suite.
+Replays recorded frames through MarkerDetectionEngine at max speed or at
+real-time pace and reports frames/s, per-stage p50/p95/p99 latency and
+detection rate. Runs on any Linux box (no camera needed).
+
+Sources:
+    default   aruco_mission/calibration_images + generated target_marker_id_*.png
+    --images  directory of images
+    --video   video file
+    --yuv     raw I420 dump recorded from the libcamera FIFO
+              (LibcameraFifoSource(record_path=...))
+
+Usage:
+    python3 benchmarks/detection_benchmark.py --frames 500
+    python3 benchmarks/detection_benchmark.py --yuv flight.yuv --pace 30
+    python3 benchmarks/detection_benchmark.py --json run.json --baseline main.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_source import FrameSource, create_frame_source
+from aruco_mission.marker_detection import MarkerDetectionEngine
+from aruco_mission.marker_tracker import SEARCH_PHASE, LANDING_PHASE
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARUCO_DIR = os.path.join(ROOT, "aruco_mission")
+STAGES = ("read", "detect", "pose", "total")
+
+
+def build_source(args: argparse.Namespace) -> FrameSource:
+    """
+    Create the replay source selected on the command line (looping, so --frames sets the run length).
+    """
+    if args.yuv:
+        return create_frame_source("yuv", path=args.yuv, width=args.width, height=args.height, loop=True)
+    if args.video:
+        return create_frame_source("video", path=args.video, loop=True)
+    if args.images:
+        return create_frame_source("images", directory=args.images, loop=True)
+    return create_frame_source(
+        "images",
+        directory=[os.path.join(ARUCO_DIR, "calibration_images"), ARUCO_DIR],
+        patterns=("*.jpg", "target_marker_id_*.png"),
+        loop=True
+    )
+
+
+def percentiles(samples: list[float]) -> dict:
+    """
+    p50/p95/p99 and mean of a latency list, in milliseconds.
+    """
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0}
+    values = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "mean": float(values.mean())}
+
+
+def run_benchmark(engine: MarkerDetectionEngine, source: FrameSource, max_frames: int,
+                  pace_fps: float = 0.0) -> dict:
+    """
+    Replay up to max_frames frames through the engine.
+    pace_fps > 0 releases frames on a real-time schedule; 0 runs at max speed.
+    Returns: dict with fps, detection_rate, late_frames and per-stage percentiles.
+    """
+    if not source.open():
+        raise RuntimeError("Frame source could not be opened")
+
+    stage_samples = {stage: [] for stage in STAGES}
+    detect_samples = stage_samples["detect"]
+
+    # Time the detection stage inside process_frame without touching the engine code
+    detect_markers = engine.detect_markers
+
+    def timed_detect_markers(gray):
+        detect_start = time.perf_counter()
+        result = detect_markers(gray)
+        detect_samples.append(time.perf_counter() - detect_start)
+        return result
+
+    engine.detect_markers = timed_detect_markers
+    engine.frame_count = 0
+    engine.detection_count = 0
+    engine.reset_position_tracking()
+
+    frames = 0
+    late_frames = 0
+    frame_period = 1.0 / pace_fps if pace_fps > 0 else 0.0
+    run_start = time.perf_counter()
+    try:
+        while frames < max_frames:
+            if frame_period:
+                release_time = run_start + frames * frame_period
+                wait = release_time - time.perf_counter()
+                if wait > 0:
+                    time.sleep(wait)
+                elif -wait > frame_period:
+                    late_frames += 1
+
+            read_start = time.perf_counter()
+            frame = source.read()
+            read_end = time.perf_counter()
+            if frame is None:
+                if source.finished:
+                    break
+                continue
+
+            engine.process_frame(frame.gray, read_end)
+            process_end = time.perf_counter()
+
+            stage_samples["read"].append(read_end - read_start)
+            stage_samples["pose"].append((process_end - read_end) - detect_samples[-1])
+            stage_samples["total"].append(process_end - read_start)
+            frames += 1
+    finally:
+        elapsed = time.perf_counter() - run_start
+        engine.detect_markers = detect_markers
+        source.close()
+
+    return {
+        "frames": frames,
+        "pace_fps": pace_fps,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "detection_rate": engine.detection_count / frames if frames else 0.0,
+        "late_frames": late_frames,
+        "stages": {stage: percentiles(samples) for stage, samples in stage_samples.items()},
+    }
+
+
+def print_report(result: dict) -> None:
+    print(f"Frames: {result['frames']}  FPS: {result['fps']:.1f}  "
+          f"Detection rate: {result['detection_rate'] * 100:.1f}%  Late frames: {result['late_frames']}")
+    print(f"{'stage':<10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+    for stage in STAGES:
+        s = result["stages"][stage]
+        print(f"{stage:<10}{s['p50']:>10.2f}{s['p95']:>10.2f}{s['p99']:>10.2f}{s['mean']:>10.2f}")
+
+
+def find_regressions(result: dict, baseline: dict, tolerance: float, min_delta_ms: float = 0.1) -> list[str]:
+    """
+    Compare against a saved run: FPS/detection rate must not drop and p95 latency must not grow beyond tolerance.
+    FPS is only compared between max-speed runs; p95 changes below min_delta_ms are treated as noise.
+    """
+    regressions = []
+    max_speed = not result.get("pace_fps") and not baseline.get("pace_fps")
+    if max_speed and result["fps"] < baseline["fps"] * (1.0 - tolerance):
+        regressions.append(f"fps {result['fps']:.1f} < baseline {baseline['fps']:.1f}")
+    if result["detection_rate"] < baseline["detection_rate"] - tolerance:
+        regressions.append(f"detection rate {result['detection_rate']:.3f} < baseline {baseline['detection_rate']:.3f}")
+    for stage in STAGES:
+        current = result["stages"][stage]["p95"]
+        previous = baseline["stages"][stage]["p95"]
+        if current > previous * (1.0 + tolerance) and current - previous > min_delta_ms:
+            regressions.append(f"{stage} p95 {current:.2f} ms > baseline {previous:.2f} ms")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ArUco detection throughput benchmark")
+    parser.add_argument("--images", help="directory of images to replay")
+    parser.add_argument("--video", help="video file to replay")
+    parser.add_argument("--yuv", help="raw I420 dump recorded from the camera FIFO")
+    parser.add_argument("--width", type=int, default=640, help="raw YUV frame width")
+    parser.add_argument("--height", type=int, default=480, help="raw YUV frame height")
+    parser.add_argument("--frames", type=int, default=300, help="number of frames to process")
+    parser.add_argument("--pace", type=float, default=0.0, help="real-time pace in fps (0 = max speed)")
+    parser.add_argument("--target", type=int, default=42, help="target marker id")
+    parser.add_argument("--phase", choices=(SEARCH_PHASE, LANDING_PHASE), default=LANDING_PHASE)
+    parser.add_argument("--no-roi", action="store_true", help="disable ROI tracking")
+    parser.add_argument("--json", help="write the result to this JSON file")
+    parser.add_argument("--baseline", help="JSON result of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression")
+    args = parser.parse_args()
+
+    source = build_source(args)
+    engine = MarkerDetectionEngine(source, target_marker_id=args.target, roi_tracking=not args.no_roi)
+    engine.set_detection_phase(args.phase)
+
+    result = run_benchmark(engine, source, args.frames, args.pace)
+    print_report(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"Result saved: {args.json}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(result, baseline, args.tolerance)
+        if regressions:
+            print("REGRESSION:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("No regression against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Swarm distance benchmark: scalar CalculateDistance loop (one GeographicLib
+Inverse per pair) vs the vectorized batch API. Points are scattered over a
+mission-sized area; the pairwise matrix is only timed where the scalar loop
+finishes in reasonable time (N^2 / 2 Inverse calls).
+
+Usage:
+    python3 benchmarks/distance_batch_benchmark.py --sizes 10 100 10000 --matrix-sizes 10 100
+    python3 benchmarks/distance_batch_benchmark.py --matrix-sizes 1000   # scalar loop takes ~45 s
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.distance_calculation import CalculateDistance
+
+ORIGIN = (41.0151, 28.9795)
+
+
+def make_points(count: int, radius_deg: float = 0.005, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return ORIGIN[0] + rng.uniform(-radius_deg, radius_deg, count), ORIGIN[1] + rng.uniform(-radius_deg, radius_deg, count)
+
+
+def best_of(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scalar_distances(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    return np.array([CalculateDistance.get_lat_lon_distance(ORIGIN[0], ORIGIN[1], lat, lon)[2]
+                     for lat, lon in zip(lats.tolist(), lons.tolist())])
+
+
+def scalar_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    lats, lons = lats.tolist(), lons.tolist()
+    matrix = np.zeros((len(lats), len(lats)))
+    for i in range(len(lats)):
+        for j in range(i + 1, len(lats)):
+            matrix[i, j] = matrix[j, i] = CalculateDistance.get_lat_lon_distance(lats[i], lons[i], lats[j], lons[j])[2]
+    return matrix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CalculateDistance batch benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 10000])
+    parser.add_argument("--matrix-sizes", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("Distance from origin to N points")
+    print(f"{'N':>8}{'scalar ms':>12}{'batch ms':>12}{'speed-up':>10}{'max err mm':>12}")
+    for count in args.sizes:
+        lats, lons = make_points(count)
+        expected = scalar_distances(lats, lons)
+        batch = CalculateDistance.get_lat_lon_distance_batch(ORIGIN[0], ORIGIN[1], lats, lons)[2]
+        scalar_time = best_of(lambda: scalar_distances(lats, lons), args.repeat)
+        batch_time = best_of(lambda: CalculateDistance.get_lat_lon_distance_batch(ORIGIN[0], ORIGIN[1], lats, lons),
+                             args.repeat)
+        print(f"{count:>8}{scalar_time * 1e3:>12.2f}{batch_time * 1e3:>12.2f}{scalar_time / batch_time:>9.0f}x"
+              f"{np.abs(batch - expected).max() * 1e3:>12.5f}")
+
+    print("\nN x N distance matrix")
+    print(f"{'N':>8}{'scalar ms':>12}{'batch ms':>12}{'speed-up':>10}{'max err mm':>12}")
+    for count in args.matrix_sizes:
+        lats, lons = make_points(count, seed=1)
+        start = time.perf_counter()
+        expected = scalar_matrix(lats, lons)
+        scalar_time = time.perf_counter() - start
+        matrix = CalculateDistance.distance_matrix(lats, lons)
+        batch_time = best_of(lambda: CalculateDistance.distance_matrix(lats, lons), args.repeat)
+        print(f"{count:>8}{scalar_time * 1e3:>12.2f}{batch_time * 1e3:>12.2f}{scalar_time / batch_time:>9.0f}x"
+              f"{np.abs(matrix - expected).max() * 1e3:>12.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Headless vs overlay, ROI tracking and coarse search detection throughput benchmark.
+Feeds synthetic I420 frames (target marker moving over a noisy floor)
+through the MarkerDetectionEngine and reports frames/s for each display mode.
+
+Usage: python3 benchmarks/headless_detection_benchmark.py [--frames 300]
+"""
+import argparse
+import os
+import sys
+import time
+import cv2
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.realtime_camera_viewer import RealtimeCameraViewer
+from aruco_mission.frame_source import Frame
+from aruco_mission.marker_tracker import SEARCH_PHASE, LANDING_PHASE
+
+WIDTH, HEIGHT = 640, 480
+
+
+def make_yuv_frames(count: int, marker_id: int = 42, marker_px: int = 120,
+                    with_marker: bool = True) -> list[np.ndarray]:
+    """
+    Build I420 frames with the target marker sliding across a textured background.
+    """
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+    marker = cv2.aruco.generateImageMarker(aruco_dict, marker_id, marker_px)
+    marker = cv2.copyMakeBorder(marker, 20, 20, 20, 20, cv2.BORDER_CONSTANT, value=255)
+    marker_bgr = cv2.cvtColor(marker, cv2.COLOR_GRAY2BGR)
+    rng = np.random.default_rng(0)
+    background = rng.integers(60, 200, size=(HEIGHT, WIDTH, 3), dtype=np.uint8)
+    background = cv2.GaussianBlur(background, (7, 7), 0)
+    size = marker_bgr.shape[0]
+    frames = []
+    for i in range(count):
+        bgr = background.copy()
+        x = int((WIDTH - size) * (0.5 + 0.4 * np.sin(i / 25.0)))
+        y = int((HEIGHT - size) * (0.5 + 0.4 * np.cos(i / 30.0)))
+        if with_marker:
+            bgr[y:y + size, x:x + size] = marker_bgr
+        frames.append(cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV_I420))
+    return frames
+
+
+def run_mode(viewer: RealtimeCameraViewer, frames: list[np.ndarray], headless: bool,
+             overlay_fps: float | None, roi_tracking: bool = False, phase: str = LANDING_PHASE,
+             source_fps: float = 30.0) -> dict:
+    """
+    Run the detection loop body over all frames without a live camera.
+    Frame timestamps advance at source_fps so the overlay rate limit behaves as in flight.
+    """
+    viewer.roi_tracking = roi_tracking
+    viewer.set_detection_phase(phase)
+    viewer.reset_position_tracking()
+    viewer.frame_count = 0
+    viewer.detection_count = 0
+    viewer.start_time = 0.0
+    overlay_interval = 1.0 / overlay_fps if overlay_fps else 0.0
+    last_overlay_time = -overlay_interval
+    overlays = 0
+    bgr_buffer = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    start = time.perf_counter()
+    for i, yuv_frame in enumerate(frames):
+        frame_time = i / source_fps
+        frame = Frame(yuv_frame[:HEIGHT], yuv=yuv_frame, bgr_buffer=bgr_buffer)
+        detection = viewer.process_frame(frame.gray, frame_time)
+        if headless or frame_time - last_overlay_time < overlay_interval:
+            continue
+        last_overlay_time = frame_time
+        viewer.draw_overlay(frame.to_bgr(), detection, frame_time)
+        overlays += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "fps": len(frames) / elapsed,
+        "ms_per_frame": 1000.0 * elapsed / len(frames),
+        "overlays": overlays,
+        "detections": viewer.detection_count
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless detection FPS benchmark")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    viewer = RealtimeCameraViewer(target_marker_id=42)
+    frames = make_yuv_frames(args.frames)
+
+    modes = [
+        ("overlay every frame", False, None, False),
+        ("overlay @15 fps", False, 15, False),
+        ("headless", True, None, False),
+        ("headless + ROI", True, None, True),
+    ]
+    results = {}
+    print(f"{'mode':<22}{'fps':>10}{'ms/frame':>12}{'overlays':>10}{'detected':>10}")
+    for name, headless, overlay_fps, roi_tracking in modes:
+        run_mode(viewer, frames[:20], headless, overlay_fps, roi_tracking)  # warm-up
+        results[name] = run_mode(viewer, frames, headless, overlay_fps, roi_tracking)
+        r = results[name]
+        print(f"{name:<22}{r['fps']:>10.1f}{r['ms_per_frame']:>12.2f}{r['overlays']:>10}{r['detections']:>10}")
+    gain = results["headless"]["fps"] / results["overlay every frame"]["fps"]
+    print(f"Headless speed-up vs overlay every frame: x{gain:.2f} (imshow/waitKey cost not included)")
+    roi_gain = results["headless + ROI"]["fps"] / results["headless"]["fps"]
+    tracker = viewer.roi_tracker
+    print(f"ROI tracking speed-up vs full-frame headless: x{roi_gain:.2f} "
+          f"(ROI hits={tracker.roi_hits}, misses={tracker.roi_misses})")
+
+    # Search sweep: most frames have no marker, so tracking never kicks in
+    sweep = make_yuv_frames(args.frames, with_marker=False)
+    full = run_mode(viewer, sweep, True, None, True, LANDING_PHASE)
+    coarse = run_mode(viewer, sweep, True, None, True, SEARCH_PHASE)
+    print(f"Search sweep (no marker): full-res {full['fps']:.1f} fps, "
+          f"coarse {coarse['fps']:.1f} fps -> x{coarse['fps'] / full['fps']:.2f}")
+    coarse_hit = run_mode(viewer, frames, True, None, True, SEARCH_PHASE)
+    print(f"Search phase with marker in view: {coarse_hit['detections']}/{len(frames)} frames detected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Flight-loop distance benchmark: CalculateDistance.get_lat_lon_distance
+(GeographicLib WGS84 Inverse, old go_forward_by_meter path) vs LocalFrame
+(precomputed polynomial around a fixed origin). Points are spread over a
+mission-sized area so both paths see the same inputs.
+
+Usage:
+    python3 benchmarks/local_frame_benchmark.py --points 20000 --radius 500
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from geographiclib.geodesic import Geodesic
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.distance_calculation import CalculateDistance
+from optimization.local_frame import LocalFrame
+
+ORIGIN = (41.0151, 28.9795)
+
+
+def make_points(count: int, radius: float, seed: int = 0) -> list[tuple[float, float]]:
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        g = Geodesic.WGS84.Direct(*ORIGIN, rng.uniform(0, 360), radius * math.sqrt(rng.random()))
+        points.append((g['lat2'], g['lon2']))
+    return points
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LocalFrame vs GeographicLib distance benchmark")
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--radius", type=float, default=500.0, help="Mission radius around the origin (m)")
+    args = parser.parse_args()
+
+    points = make_points(args.points, args.radius)
+    start_lat, start_lon = points[0]
+
+    begin = time.perf_counter()
+    expected = [CalculateDistance.get_lat_lon_distance(start_lat, start_lon, lat, lon)[2] for lat, lon in points]
+    geodesic_time = time.perf_counter() - begin
+
+    frame = LocalFrame(*ORIGIN)
+    begin = time.perf_counter()
+    start_north, start_east = frame.to_north_east(start_lat, start_lon)
+    local = []
+    for lat, lon in points:
+        north, east = frame.to_north_east(lat, lon)
+        local.append(math.hypot(north - start_north, east - start_east))
+    local_time = time.perf_counter() - begin
+
+    errors = [abs(a - b) for a, b in zip(local, expected)]
+    print(f"{'path':<28}{'us/call':>10}")
+    print(f"{'GeographicLib Inverse':<28}{geodesic_time / args.points * 1e6:>10.2f}")
+    print(f"{'LocalFrame':<28}{local_time / args.points * 1e6:>10.2f}")
+    print(f"Speed-up: {geodesic_time / local_time:.0f}x, max distance error {max(errors) * 1000:.4f} mm "
+          f"(radius {args.radius:.0f} m)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Setpoint loop jitter: detection thread vs detection process.
+Runs a 10 Hz asyncio loop (stand-in for the MAVSDK offboard setpoint loop)
+while detection runs either as a thread in the same process or in
+ProcessDetectionEngine, and reports how late each tick fires.
+
+Usage:
+    python3 benchmarks/setpoint_jitter_benchmark.py --seconds 10
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_source import create_frame_source
+from aruco_mission.marker_detection import MarkerDetectionEngine
+from aruco_mission.detection_worker import ProcessDetectionEngine
+
+ARUCO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "aruco_mission")
+SOURCE_KWARGS = {
+    "directory": [os.path.join(ARUCO_DIR, "calibration_images"), ARUCO_DIR],
+    "patterns": ("*.jpg", "target_marker_id_*.png"),
+    "loop": True,
+}
+
+
+async def setpoint_loop(seconds: float, rate_hz: float = 10.0) -> np.ndarray:
+    """
+    Tick at rate_hz and return the lateness of each tick in milliseconds.
+    """
+    period = 1.0 / rate_hz
+    lateness = []
+    start = time.monotonic()
+    tick = 1
+    while time.monotonic() - start < seconds:
+        target = start + tick * period
+        await asyncio.sleep(max(0.0, target - time.monotonic()))
+        lateness.append((time.monotonic() - target) * 1000.0)
+        tick += 1
+    return np.asarray(lateness)
+
+
+def run_mode(engine, seconds: float) -> tuple[np.ndarray, int]:
+    thread = threading.Thread(target=engine.show_camera_with_detection, kwargs={"headless": True})
+    thread.start()
+    time.sleep(1.0)  # warm-up (process spawn, first frames)
+    frames_before = engine.frame_count
+    try:
+        lateness = asyncio.run(setpoint_loop(seconds))
+    finally:
+        frames = engine.frame_count - frames_before
+        engine.stop_camera()
+        thread.join()
+    return lateness, frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Setpoint loop jitter benchmark")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    modes = {
+        "thread": MarkerDetectionEngine(create_frame_source("images", **SOURCE_KWARGS)),
+        "process": ProcessDetectionEngine("images", SOURCE_KWARGS),
+    }
+    print(f"{'mode':<10}{'frames/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, engine in modes.items():
+        lateness, frames = run_mode(engine, args.seconds)
+        p50, p95, p99 = np.percentile(lateness, [50, 95, 99])
+        print(f"{name:<10}{frames / args.seconds:>10.1f}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}{lateness.max():>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
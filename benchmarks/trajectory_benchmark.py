@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Survey timing benchmark: square_oscillation_by_meters as stop-and-hold legs
+(go_forward_by_meter + hold_mode(1.0)) vs one continuous Trajectory with
+curvature-limited turns. Both run the same 10 Hz command logic as the flight
+code against a simple multicopter model (first-order velocity response with
+an acceleration limit).
+
+Usage:
+    python3 benchmarks/trajectory_benchmark.py --long 30 --short 5 --velocity 2 --cycles 10
+"""
+import argparse
+import os
+import sys
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.distance_calculation import CalculateDistance
+from optimization.trajectory import Trajectory, TrajectoryFollower
+
+COMMAND_PERIOD = 0.1  # Flight loops sleep 0.1 s between set_velocity_ned calls
+STEP = 0.01
+
+
+class Vehicle:
+    """Horizontal velocity follows the command with a time constant and an acceleration limit"""
+
+    def __init__(self, time_constant: float, max_accel: float):
+        self.time_constant = time_constant
+        self.max_accel = max_accel
+        self.position = np.zeros(2)
+        self.velocity = np.zeros(2)
+        self.time = 0.0
+        self.track = [self.position.copy()]
+        self.speeds = [0.0]
+
+    def run(self, command: tuple[float, float], duration: float = COMMAND_PERIOD) -> None:
+        target = np.asarray(command, dtype=float)
+        for _ in range(int(round(duration / STEP))):
+            accel = (target - self.velocity) / self.time_constant
+            norm = np.linalg.norm(accel)
+            if norm > self.max_accel:
+                accel *= self.max_accel / norm
+            self.velocity += accel * STEP
+            self.position += self.velocity * STEP
+            self.time += STEP
+        self.track.append(self.position.copy())
+        self.speeds.append(float(np.linalg.norm(self.velocity)))
+
+
+def pattern_legs(long_distance: float, short_distance: float, cycles: int) -> list[tuple[float, float]]:
+    legs = [(long_distance, 0.0), (short_distance, 90.0), (long_distance, 180.0), (short_distance, 90.0)] * cycles
+    return legs + [(long_distance, 0.0)]
+
+
+def fly_stop_and_hold(vehicle: Vehicle, legs: list, velocity: float) -> None:
+    """go_forward_by_meter (30% speed in the last `velocity` metres, stop 1 m early) + hold_mode(1.0)"""
+    for distance, yaw in legs:
+        start = vehicle.position.copy()
+        while True:
+            remaining = distance - float(np.linalg.norm(vehicle.position - start))
+            if remaining <= 1.0:
+                vehicle.run((0.0, 0.0))
+                break
+            speed = velocity * 0.3 if remaining <= velocity else velocity
+            vehicle.run(CalculateDistance.find_vectors(speed, yaw))
+        vehicle.run((0.0, 0.0), 1.0)
+
+
+def fly_continuous(vehicle: Vehicle, trajectory: Trajectory) -> None:
+    """OffboardControl.follow_trajectory loop"""
+    follower = TrajectoryFollower(trajectory)
+    while True:
+        velocity_north, velocity_east, _, done = follower.update(*vehicle.position)
+        if done:
+            vehicle.run((0.0, 0.0))
+            break
+        vehicle.run((velocity_north, velocity_east))
+
+
+def deviation(track: list, waypoints: list) -> float:
+    """Largest distance of the flown track from the nominal polyline"""
+    points = np.asarray(track)
+    best = np.full(len(points), np.inf)
+    for a, b in zip(waypoints, waypoints[1:]):
+        a, b = np.asarray(a), np.asarray(b)
+        t = np.clip((points - a) @ (b - a) / np.dot(b - a, b - a), 0.0, 1.0)
+        best = np.minimum(best, np.linalg.norm(points - (a + t[:, None] * (b - a)), axis=1))
+    return float(best.max())
+
+
+def stops(speeds: list, threshold: float = 0.1) -> int:
+    """Times the vehicle came to rest after moving, excluding the stop at the end of the survey"""
+    moving = np.asarray(speeds) > threshold
+    return int(np.sum(moving[:-1] & ~moving[1:])) - 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stop-and-hold vs continuous trajectory survey timing")
+    parser.add_argument("--long", type=float, default=30.0, help="Long leg (m)")
+    parser.add_argument("--short", type=float, default=5.0, help="Lane spacing leg (m)")
+    parser.add_argument("--velocity", type=float, default=2.0, help="Survey speed (m/s)")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--lateral-accel", type=float, default=1.0, help="Trajectory turn limit (m/s^2)")
+    parser.add_argument("--time-constant", type=float, default=0.3, help="Vehicle velocity response (s)")
+    parser.add_argument("--max-accel", type=float, default=3.0, help="Vehicle acceleration limit (m/s^2)")
+    args = parser.parse_args()
+
+    legs = pattern_legs(args.long, args.short, args.cycles)
+    waypoints = [(0.0, 0.0)]
+    for distance, yaw in legs:
+        north, east = CalculateDistance.find_vectors(distance, yaw)
+        waypoints.append((waypoints[-1][0] + north, waypoints[-1][1] + east))
+    trajectory = Trajectory(waypoints, args.velocity, max_lateral_accel=args.lateral_accel)
+
+    old = Vehicle(args.time_constant, args.max_accel)
+    fly_stop_and_hold(old, legs, args.velocity)
+    new = Vehicle(args.time_constant, args.max_accel)
+    fly_continuous(new, trajectory)
+    times = {"stop-and-hold": old.time, "continuous": new.time}
+    # Settle after the final command so the end-of-survey stop is recorded for both
+    for vehicle in (old, new):
+        vehicle.run((0.0, 0.0), 1.0)
+
+    print(f"{args.cycles} cycles, {args.long:.0f} x {args.short:.0f} m legs at {args.velocity:.1f} m/s, "
+          f"turn radius limit {trajectory.turn_radius:.1f} m")
+    print(f"{'pattern':<20}{'time s':>10}{'stops':>8}{'max dev m':>11}")
+    for name, vehicle in (("stop-and-hold", old), ("continuous", new)):
+        print(f"{name:<20}{times[name]:>10.1f}{stops(vehicle.speeds):>8}{deviation(vehicle.track, waypoints):>11.2f}")
+    saved = times["stop-and-hold"] - times["continuous"]
+    print(f"Trajectory profile estimate {trajectory.duration:.1f} s; "
+          f"saved {saved:.1f} s ({saved / times['stop-and-hold'] * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
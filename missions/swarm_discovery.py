@@ -1,12 +1,21 @@
 import asyncio
+import time
 import sys
 import os
 # Add parent directory to sys.path for module imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.offboard_control import OffboardControl
 from optimization.drone_vision_calculator import DroneVisionCalculator
-from aruco_mission.realtime_camera_viewer import RealtimeCameraViewer
-from aruco_mission.computer_camera_test import ComputerCameraTest
+from optimization.coverage_planner import CoveragePlanner
+from optimization.area_partitioner import AreaPartitioner
+from optimization.distance_calculation import CalculateDistance
+from optimization.local_frame import LocalFrame
+from optimization.trajectory import Trajectory
+from aruco_mission.frame_source import FrameSource, create_frame_source
+from aruco_mission.marker_detection import MarkerDetectionEngine
+from aruco_mission.detection_worker import ProcessDetectionEngine
+from aruco_mission.marker_tracker import SEARCH_PHASE, LANDING_PHASE
+from aruco_mission.landing_pad import LandingPad
 import threading
 from mavsdk.offboard import VelocityNedYaw
 from services.xbee_service import XbeeService
@@ -15,11 +24,29 @@ class SwarmDiscovery(OffboardControl):
     """
     SwarmDiscovery mission: square oscillation flight and ArUco-based precision landing.
     """
-    def __init__(self, xbee_port: str = None, use_computer_camera: bool = False):
+    def __init__(self, xbee_port: str = None, use_computer_camera: bool = False, headless_camera: bool | None = None,
+                 frame_source: FrameSource | str | None = None, detection_process: bool = False,
+                 landing_pad: LandingPad | None = None):
         super().__init__()
-        self.pi_cam = RealtimeCameraViewer() if not use_computer_camera else ComputerCameraTest()
+        # Frame kaynağı: FrameSource nesnesi, isim ("libcamera", "webcam", "video", "images") veya varsayılan
+        if frame_source is None:
+            frame_source = "webcam" if use_computer_camera else "libcamera"
+        if detection_process:
+            # Yakalama + tespit ayrı süreçte: setpoint döngüsü GIL için tespitle yarışmaz
+            if not isinstance(frame_source, str):
+                raise ValueError("detection_process requires the frame source as a name, e.g. 'libcamera'")
+            self.pi_cam = ProcessDetectionEngine(frame_source, landing_pad=landing_pad)
+        else:
+            if isinstance(frame_source, str):
+                frame_source = create_frame_source(frame_source)
+            self.pi_cam = MarkerDetectionEngine(frame_source, landing_pad=landing_pad)
+        # None: ekran yoksa (uçuş bilgisayarı) overlay/imshow olmadan sadece tespit yap
+        self.headless_camera = headless_camera if headless_camera is not None else not os.environ.get("DISPLAY")
         self.mission_completed = False
         self.landing_command_received = False  # Command 1 için flag
+        # Command 1'i polling yerine await etmek için (XBee thread'inden loop'a iletilir)
+        self.landing_command_event = asyncio.Event()
+        self.mission_loop = None
         self.feedback_received = False  # Feedback alındı mı flag'i
         self.THRESHOLD = 0.01  # 1 cm = normal hassasiyet (class seviyesinde)
         self.xbee_service = XbeeService(
@@ -61,6 +88,8 @@ class SwarmDiscovery(OffboardControl):
                     self.send_feedback_message(lat, lon, alt)
                     # Landing flag set et
                     self.landing_command_received = True
+                    if self.mission_loop is not None:
+                        self.mission_loop.call_soon_threadsafe(self.landing_command_event.set)
                     
                 elif command == 2:
                     print("Feedback received - message confirmed!")
@@ -101,7 +130,21 @@ class SwarmDiscovery(OffboardControl):
         except Exception as e:
             print(f"Feedback message error: {e}")
 
-    async def square_oscillation_by_meters(self, long_distance: float, short_distance: float, velocity: float, repeat_count: int):
+    def save_latency_report(self) -> None:
+        """
+        Print the camera-to-setpoint latency summary and save the full report for post-flight analysis.
+        """
+        report_path = f"latency_report_{int(time.time())}.json"
+        print("Vision latency (capture -> setpoint):")
+        print(self.pi_cam.latency.format_summary())
+        try:
+            self.pi_cam.latency.save(report_path)
+            print(f"Latency report saved: {report_path}")
+        except Exception as e:
+            print(f"Latency report could not be saved: {e}")
+
+    async def square_oscillation_by_meters(self, long_distance: float, short_distance: float, velocity: float, repeat_count: int,
+                                           continuous: bool = False):
         """
         Square oscillation pattern flight.
         Args:
@@ -109,9 +152,27 @@ class SwarmDiscovery(OffboardControl):
             short_distance: side movement (meters)
             velocity: movement speed (m/s)
             repeat_count: number of cycles
+            continuous: fly the pattern as one trajectory with rounded turns instead of stop-and-hold legs
         """
         print("Square Oscillation started...")
         current_yaw = self.home_position["yaw"]
+        if continuous:
+            # Aynı bacaklar tek yol olarak: köşelerde durma ve hold yok
+            legs = [(long_distance, current_yaw), (short_distance, current_yaw + 90.0),
+                    (long_distance, current_yaw + 180.0), (short_distance, current_yaw + 90.0)] * repeat_count
+            legs.append((long_distance, current_yaw))
+            frame = self.local_frame or LocalFrame(self.current_position.latitude_deg,
+                                                   self.current_position.longitude_deg)
+            north, east = frame.to_north_east(self.current_position.latitude_deg,
+                                              self.current_position.longitude_deg)
+            points = [(north, east)]
+            for distance, yaw in legs:
+                north_step, east_step = CalculateDistance.find_vectors(distance, yaw)
+                north, east = north + north_step, east + east_step
+                points.append((north, east))
+            await self.follow_trajectory(Trajectory(points, velocity), frame)
+            print("Square Oscillation finished!")
+            return
         for cycle in range(repeat_count):
             await self.go_forward_by_meter(long_distance, velocity, current_yaw)
             await self.hold_mode(1.0, current_yaw)
@@ -135,10 +196,27 @@ class SwarmDiscovery(OffboardControl):
         camera_fov_horizontal: float,
         camera_fov_vertical: float,
         image_width: int,
-        image_height: int
+        image_height: int,
+        search_polygon: list[tuple[float, float]] | None = None,
+        coverage_overlap: float = 0.2,
+        swarm_starts: list[tuple[float, float]] | None = None,
+        swarm_speeds: list[float] | None = None,
+        drone_index: int = 0,
+        continuous_motion: bool = True
     ):
         """
         Square oscillation flight based on camera FOV and ArUco detection.
+        Args:
+            search_polygon: Search area corners [(lat, lon)], any convex or concave polygon.
+                If given, a boustrophedon coverage path replaces the fixed oscillation pattern
+                (e.g. self.area_polygon() for the set_lat_lon_yaw corners).
+            coverage_overlap: Overlap between neighbouring coverage lanes (0-1)
+            swarm_starts: Start positions [(lat, lon)] of every drone searching search_polygon.
+                The area is split by workload and this drone covers only its own part.
+            swarm_speeds: Search speed of every drone (m/s), defaults to velocity for all
+            drone_index: This drone's index in swarm_starts
+            continuous_motion: Fly through the turns on curvature-limited arcs without stopping;
+                False keeps the stop-and-hold legs
         """
         drone_vision_calculator = DroneVisionCalculator(
             camera_fov_horizontal=camera_fov_horizontal,
@@ -147,35 +225,86 @@ class SwarmDiscovery(OffboardControl):
             image_height=image_height
         )
         
+        # Kamera ve XBee thread'leri olayları bu loop'a iletir
+        self.mission_loop = asyncio.get_running_loop()
+        self.pi_cam.events.bind(self.mission_loop)
+        if self.landing_command_received:
+            self.landing_command_event.set()
+        
+        # Tarama sırasında sadece hedefin görüşte olup olmadığı gerekli: küçük çözünürlükte ara
+        self.pi_cam.set_detection_phase(SEARCH_PHASE)
+        
         # Camera thread'ini daemon olarak başlat ve referansını sakla
         camera_thread = threading.Thread(
             target=self.pi_cam.show_camera_with_detection, 
+            kwargs={"headless": self.headless_camera},
             daemon=True
         )
         camera_thread.start()
         
         ground_coverage = drone_vision_calculator.calculate_ground_coverage(self.target_altitude)
-        short_distance = ground_coverage["width_m"] / 2
-        repeat_count = int(distance2 / short_distance / 2)
+        # Şerit aralığı: pedin en büyük marker'ının çözülebildiği şerit (iç içe pedde dış marker)
+        pad_marker_size = self.pi_cam.landing_pad.outer.size
+        swath = drone_vision_calculator.detectable_swath_width(self.target_altitude, pad_marker_size)
+        if swath <= 0:
+            swath = ground_coverage["width_m"]
+            print(f"⚠️ {pad_marker_size * 100:.0f} cm marker {self.target_altitude} m'den çözülemez - "
+                  f"iç içe ped veya daha alçak irtifa kullanın")
         
-        # Square oscillation task'ını oluştur
-        sqosc_task = asyncio.create_task(
-            self.square_oscillation_by_meters(
-                long_distance=distance1,
-                short_distance=short_distance,
-                repeat_count=repeat_count,
-                velocity=velocity
+        if search_polygon is not None:
+            sweep_angle = None
+            if swarm_starts is not None:
+                # Her drone aynı girdilerle aynı bölmeyi hesaplar ve kendi alt alanını alır
+                speeds = swarm_speeds or [velocity] * len(swarm_starts)
+                partitioner = AreaPartitioner(swath, overlap=coverage_overlap)
+                assignment = partitioner.partition_lat_lon(search_polygon, swarm_starts, speeds)[drone_index]
+                if assignment.plan is None:
+                    # Şeritten fazla drone: bu drone'a alan düşmedi, diğerleri tüm alanı tarar
+                    print(f"⚠️ Alt alan {drone_index + 1}/{len(swarm_starts)}: taranacak şerit kalmadı - "
+                          f"tarama yapılmadan bitiriliyor")
+                    self.pi_cam.stop_camera()
+                    return
+                print(f"-- Alt alan {drone_index + 1}/{len(swarm_starts)}: pay %{assignment.share * 100:.0f}, "
+                      f"tahmini {assignment.plan.flight_time:.0f} s")
+                search_polygon = assignment.polygon
+                sweep_angle = assignment.plan.sweep_angle
+            
+            # Herhangi bir çokgen: en kısa süreli yönde biçerdöver rotası
+            planner = CoveragePlanner(swath, overlap=coverage_overlap, velocity=velocity)
+            plan = planner.plan_lat_lon(search_polygon, start=(self.current_position.latitude_deg,
+                                                               self.current_position.longitude_deg),
+                                        sweep_angle=sweep_angle)
+            print(f"-- Kapsama planı: {plan.lanes} şerit, yön {plan.sweep_angle:.1f}°, aralık {plan.lane_spacing:.2f} m, "
+                  f"{plan.length:.0f} m, tahmini {plan.flight_time:.0f} s")
+            sqosc_task = asyncio.create_task(self.fly_waypoints(plan.waypoints, velocity, continuous_motion))
+        else:
+            short_distance = swath / 2
+            print(f"-- Tarama şerit aralığı: {short_distance:.2f} m (kapsama genişliği {ground_coverage['width_m']:.2f} m)")
+            repeat_count = int(distance2 / short_distance / 2)
+            
+            # Square oscillation task'ını oluştur
+            sqosc_task = asyncio.create_task(
+                self.square_oscillation_by_meters(
+                    long_distance=distance1,
+                    short_distance=short_distance,
+                    repeat_count=repeat_count,
+                    velocity=velocity,
+                    continuous=continuous_motion
+                )
             )
-        )
         
-        # ArUco bulunana kadar veya task tamamlanana kadar bekle
-        while not sqosc_task.done() and not self.pi_cam.is_found:
-            # Command 1 geldi mi real-time kontrol et
-            if self.landing_command_received:
-                print("Landing command received during search - starting normal landing immediately!")
-                await self.end_mission()
-                return
-            await asyncio.sleep(0.01)  # Daha hızlı kontrol
+        # ArUco bulunana, task tamamlanana veya command 1 gelene kadar bekle (kamera thread'i uyandırır)
+        found_task = asyncio.create_task(self.pi_cam.wait_found())
+        landing_task = asyncio.create_task(self.landing_command_event.wait())
+        await asyncio.wait({sqosc_task, found_task, landing_task}, return_when=asyncio.FIRST_COMPLETED)
+        for task in (found_task, landing_task):
+            if not task.done():
+                task.cancel()
+        
+        if self.landing_command_received and not self.pi_cam.is_found:
+            print("Landing command received during search - starting normal landing immediately!")
+            await self.end_mission()
+            return
         
         # ArUco bulunduktan sonra command 1 geldi mi kontrol et
         if self.landing_command_received:
@@ -184,6 +313,9 @@ class SwarmDiscovery(OffboardControl):
             return
             
         if self.pi_cam.is_found:
+            # Hassas iniş için tam çözünürlük
+            self.pi_cam.set_detection_phase(LANDING_PHASE)
+            
             # Square oscillation task'ını güvenli şekilde iptal et
             if not sqosc_task.done():
                 sqosc_task.cancel()
@@ -205,7 +337,17 @@ class SwarmDiscovery(OffboardControl):
                     print("Landing command received during precision landing - stopping and landing immediately!")
                     break
                 
-                x, y, z = self.pi_cam.get_averaged_position()
+                # Kalman: gecikme telafili anlık tahmin (10 frame ortalamasının ~150 ms gecikmesi yok)
+                position = self.pi_cam.get_predicted_position()
+                if position is None:
+                    # Marker kayıp: eski tahminle sürme, dur ve tekrar görünmesini bekle
+                    print("ArUco lost - holding until it is found again")
+                    await self.drone.offboard.set_velocity_ned(
+                        VelocityNedYaw(0.0, 0.0, 0.0, self.current_attitude.yaw_deg if self.current_attitude else 0.0)
+                    )
+                    await self.pi_cam.wait_found(timeout=0.5)
+                    continue
+                x, y, z = position
                 print(f"DEBUG: ArUco position - X={x:.4f}, Y={y:.4f}")
                 # Threshold kontrolü - OR operatörü kullan (daha esnek)
                 if abs(x) > self.THRESHOLD or abs(y) > self.THRESHOLD:  # Class seviyesindeki threshold
@@ -213,15 +355,20 @@ class SwarmDiscovery(OffboardControl):
                     correction_speed = 0.5
                     move_x = x * correction_speed
                     move_y = y * correction_speed
+                    # Tahmin gecikmesiz olduğu için pose geldikçe komutlar arasında durmaya gerek yok
                     await self.drone.offboard.set_velocity_ned(
                         VelocityNedYaw(move_x, move_y, 0.0, self.current_attitude.yaw_deg if self.current_attitude else 0.0)
                     )
-                    await asyncio.sleep(0.1)  # Daha hızlı
+                    self.pi_cam.record_setpoint("landing")
+                    # Yeni pose gelince hemen düzelt; 0.1 s içinde gelmezse aynı düzeltmeyi sürdürme, dur
+                    if await self.pi_cam.next_pose(timeout=0.1) is None:
+                        await self.drone.offboard.set_velocity_ned(
+                            VelocityNedYaw(0.0, 0.0, 0.0, self.current_attitude.yaw_deg if self.current_attitude else 0.0)
+                        )
+                else:
                     await self.drone.offboard.set_velocity_ned(
                         VelocityNedYaw(0.0, 0.0, 0.0, self.current_attitude.yaw_deg if self.current_attitude else 0.0)
                     )
-                    await asyncio.sleep(0.1)  # Daha hızlı
-                else:
                     print(f"ArUco centered! Position: X={x:.4f} Y={y:.4f}")
                     break
             
@@ -263,7 +410,18 @@ class SwarmDiscovery(OffboardControl):
                                     break
                                 
                                 # ArUco pozisyonunu sürekli kontrol et ve ortala
-                                x, y, z = self.pi_cam.get_averaged_position()
+                                position = self.pi_cam.get_predicted_position()
+                                if position is None:
+                                    # Marker kayıp: dur, tekrar görünmesini bekle
+                                    await self.drone.offboard.set_velocity_ned(
+                                        VelocityNedYaw(0.0, 0.0, 0.0, self.current_attitude.yaw_deg if self.current_attitude else 0.0)
+                                    )
+                                    if self.landing_command_received:
+                                        print("Landing command received during feedback wait - starting normal landing!")
+                                        break
+                                    await self.pi_cam.wait_found(timeout=0.5)
+                                    continue
+                                x, y, z = position
                                 print(f"DEBUG: Feedback wait - ArUco position: X={x:.4f}, Y={y:.4f}")
                                 
                                 if abs(x) > self.THRESHOLD or abs(y) > self.THRESHOLD:  # Class seviyesindeki threshold
@@ -274,6 +432,7 @@ class SwarmDiscovery(OffboardControl):
                                     await self.drone.offboard.set_velocity_ned(
                                         VelocityNedYaw(move_x, move_y, 0.0, self.current_attitude.yaw_deg if self.current_attitude else 0.0)
                                     )
+                                    self.pi_cam.record_setpoint("feedback_hold")
                                     await asyncio.sleep(0.1)
                                     await self.drone.offboard.set_velocity_ned(
                                         VelocityNedYaw(0.0, 0.0, 0.0, self.current_attitude.yaw_deg if self.current_attitude else 0.0)
@@ -287,7 +446,8 @@ class SwarmDiscovery(OffboardControl):
                                     print("Landing command received during feedback wait - starting normal landing!")
                                     break
                                 
-                                await asyncio.sleep(0.1)
+                                # Sonraki pose'u bekle (marker görünmüyorsa 0.1 s)
+                                await self.pi_cam.next_pose(timeout=0.1)
                             
                             if self.feedback_received:
                                 print("Feedback received! Starting landing sequence...")
@@ -323,6 +483,8 @@ class SwarmDiscovery(OffboardControl):
         else:
             print("Mission failed - ArUco not found or not centered.")
         
+        self.save_latency_report()
+        
         # Cleanup: Camera thread'ini kontrol et
         if camera_thread.is_alive():
             print("Camera thread cleanup...")
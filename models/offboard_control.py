@@ -9,6 +9,8 @@ import math
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.connect import DroneConnection
 from optimization.distance_calculation import CalculateDistance
+from optimization.local_frame import LocalFrame
+from optimization.trajectory import Trajectory, TrajectoryFollower
 
 class OffboardControl(DroneConnection):
     """
@@ -21,6 +23,8 @@ class OffboardControl(DroneConnection):
         self.right_down_corner: tuple[float, float] | None = None
         self.right_up_corner: tuple[float, float] | None = None
         self.mission_ending = False  # Mission sonlandırma flag'i
+        # Uçuş döngülerinde mesafe için yerel kuzey/doğu düzlemi (alan köşesi veya home orijinli)
+        self.local_frame: LocalFrame | None = None
 
     def set_lat_lon_yaw(self, left_down: tuple[float, float], left_up: tuple[float, float], 
                               right_down: tuple[float, float], right_up: tuple[float, float]) -> None:
@@ -28,20 +32,30 @@ class OffboardControl(DroneConnection):
         self.left_up_corner = left_up
         self.right_down_corner = right_down
         self.right_up_corner = right_up
+        self.local_frame = LocalFrame(*left_down)
+
+    def area_polygon(self) -> list[tuple[float, float]] | None:
+        """
+        Search area corners in polygon order (left_down, left_up, right_up, right_down), None if not set.
+        """
+        corners = [self.left_down_corner, self.left_up_corner, self.right_up_corner, self.right_down_corner]
+        if any(corner is None for corner in corners):
+            return None
+        return corners
         
     async def goto_location(self, lat: float, lon: float, target_alt: float, goto_yaw: float) -> None:
         await self.drone.action.goto_location(lat, lon, target_alt, goto_yaw)
         await self.drone.action.set_current_speed(1.5)
+        target_frame = LocalFrame(lat, lon)
         for _ in range(30):
             async for position in self.drone.telemetry.position():
                 current_lat = position.latitude_deg
                 current_lon = position.longitude_deg
                 home_abs_alt = position.absolute_altitude_m
-                lat_diff = abs(current_lat - lat)
-                lon_diff = abs(current_lon - lon)
+                distance = target_frame.distance_from_origin(current_lat, current_lon)
                 alt_diff = abs(home_abs_alt - target_alt)
-                print(f"Distance to target: lat={lat_diff}, lon={lon_diff}, alt={alt_diff}")
-                if lat_diff < 0.00001 and lon_diff < 0.00001:
+                print(f"Distance to target: {distance:.2f}m, alt={alt_diff:.2f}m")
+                if distance < 1.0:
                     print("Drone reached target location.")
                     break
             await asyncio.sleep(0.5)
@@ -62,6 +76,8 @@ class OffboardControl(DroneConnection):
             "yaw": self.current_attitude.yaw_deg if self.current_attitude else 0.0
         }
         print(f"Home: Alt={self.home_position['alt']:.1f}m, Yaw={self.home_position['yaw']:.1f}°")
+        if self.local_frame is None:
+            self.local_frame = LocalFrame(self.home_position["lat"], self.home_position["lon"])
         print(f"Takeoff to {target_altitude}m...")
         await self.drone.action.set_takeoff_altitude(target_altitude)
         await self.drone.action.takeoff()
@@ -75,7 +91,10 @@ class OffboardControl(DroneConnection):
             await asyncio.sleep(0.5)
         print("Hold mode...")
         print("hata buradan kaynaklanabilir:",self.left_down_corner, self.left_up_corner, self.right_down_corner, self.right_up_corner)
-        if drone_purpose != "middle":
+        if drone_purpose == "partition":
+            # Alt alan kapsama planı bulunduğu konumdan başlar (fly_waypoints): köşeye gidilmez
+            print("Partitioned search - starting from current position.")
+        elif drone_purpose != "middle":
             goto_yaw = CalculateDistance.get_turn_angle(self.left_down_corner[0], self.left_down_corner[1], 
                                                                     self.left_up_corner[0], self.left_up_corner[1])
             
@@ -192,39 +211,44 @@ class OffboardControl(DroneConnection):
             velocity, 
             yaw
         )
-        current_altitude = self.current_position.absolute_altitude_m
-        target_altitude_abs = self.home_position["alt"] + self.target_altitude
-        altitude_error = target_altitude_abs - current_altitude
-        max_vertical_speed = 2.0
-        altitude_gain = 0.8
-        vertical_velocity = altitude_error * altitude_gain
-        vertical_velocity = max(-max_vertical_speed, min(max_vertical_speed, vertical_velocity))
-        vertical_velocity_ned = -vertical_velocity
         await self.drone.offboard.set_velocity_ned(
             VelocityNedYaw(
                 velocity_north_vector,
                 velocity_east_vector,
-                vertical_velocity_ned,
+                self.altitude_hold_velocity(),
                 yaw
             )
         )
 
+    def altitude_hold_velocity(self) -> float:
+        """
+        Down velocity (NED) that keeps the target altitude while moving horizontally.
+        """
+        current_altitude = self.current_position.absolute_altitude_m
+        target_altitude_abs = self.home_position["alt"] + self.target_altitude
+        altitude_error = target_altitude_abs - current_altitude
+        max_vertical_speed = 2.0
+        altitude_gain = 0.8
+        vertical_velocity = altitude_error * altitude_gain
+        vertical_velocity = max(-max_vertical_speed, min(max_vertical_speed, vertical_velocity))
+        return -vertical_velocity
+
     async def go_forward_by_meter(self, forward_distance: float, velocity: float, yaw: float) -> None:
         """
-        Move forward by a given distance (GPS-based).
+        Move forward by a given distance (GPS-based, local north/east frame).
         Args:
             forward_distance: distance to move (meters)
             velocity: max speed (m/s)
             yaw: movement direction (degrees)
         """
-        start_lat = self.current_position.latitude_deg
-        start_lon = self.current_position.longitude_deg
+        frame = self.local_frame or LocalFrame(self.current_position.latitude_deg,
+                                               self.current_position.longitude_deg)
+        start_north, start_east = frame.to_north_east(self.current_position.latitude_deg,
+                                                      self.current_position.longitude_deg)
         while True:
-            current_distance = CalculateDistance.get_lat_lon_distance(
-                start_lat, start_lon,
-                self.current_position.latitude_deg,
-                self.current_position.longitude_deg
-            )[2]
+            north, east = frame.to_north_east(self.current_position.latitude_deg,
+                                              self.current_position.longitude_deg)
+            current_distance = math.hypot(north - start_north, east - start_east)
             remaining_distance = forward_distance - current_distance
             if remaining_distance <= 1.0:
                 await self.drone.offboard.set_velocity_ned(
@@ -238,3 +262,53 @@ class OffboardControl(DroneConnection):
             await self.go_forward(velocity=current_velocity, yaw=yaw)
             await asyncio.sleep(0.1)
 
+    async def follow_trajectory(self, trajectory: Trajectory, frame: LocalFrame) -> None:
+        """
+        Fly a continuous trajectory without stopping at its corners (10 Hz velocity commands).
+        Args:
+            trajectory: path in frame's (north, east) metres, starting near the current position
+            frame: local frame of the trajectory
+        """
+        follower = TrajectoryFollower(trajectory)
+        while True:
+            north, east = frame.to_north_east(self.current_position.latitude_deg,
+                                              self.current_position.longitude_deg)
+            velocity_north, velocity_east, yaw, done = follower.update(north, east)
+            if done:
+                await self.drone.offboard.set_velocity_ned(VelocityNedYaw(0.0, 0.0, 0.0, yaw))
+                break
+            await self.drone.offboard.set_velocity_ned(
+                VelocityNedYaw(velocity_north, velocity_east, self.altitude_hold_velocity(), yaw)
+            )
+            await asyncio.sleep(0.1)
+
+    async def fly_waypoints(self, waypoints: list[tuple[float, float]], velocity: float,
+                            continuous: bool = False) -> None:
+        """
+        Fly straight legs through GPS waypoints (e.g. a CoveragePlan).
+        Each leg's heading and length are taken from the current position, so drift does not accumulate.
+        Args:
+            waypoints: [(lat, lon)]
+            velocity: max speed (m/s)
+            continuous: Blend the legs with curvature-limited turns instead of stopping and holding at each waypoint
+        """
+        if continuous:
+            frame = self.local_frame or LocalFrame(*waypoints[0])
+            points = [frame.to_north_east(self.current_position.latitude_deg, self.current_position.longitude_deg)]
+            points += [frame.to_north_east(lat, lon) for lat, lon in waypoints]
+            if max(math.dist(points[0], point) for point in points[1:]) <= 1.0:
+                return
+            await self.follow_trajectory(Trajectory(points, velocity), frame)
+            return
+        for lat, lon in waypoints:
+            frame = self.local_frame or LocalFrame(lat, lon)
+            target_north, target_east = frame.to_north_east(lat, lon)
+            north, east = frame.to_north_east(self.current_position.latitude_deg,
+                                              self.current_position.longitude_deg)
+            distance = math.hypot(target_north - north, target_east - east)
+            # go_forward_by_meter 1 m kala durur: daha kısa bacak yok sayılır
+            if distance <= 1.0:
+                continue
+            yaw = math.degrees(math.atan2(target_east - east, target_north - north))
+            await self.go_forward_by_meter(distance, velocity, yaw)
+            await self.hold_mode(1.0, yaw)
@@ -0,0 +1,186 @@
+import math
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.coverage_planner import CoveragePlanner
+from optimization.local_frame import LocalFrame
+
+
+class AreaAssignment:
+    """
+    Bir drone'a düşen alt alan ve onun kapsama planı
+    """
+
+    def __init__(self, drone_index: int, polygon: list, plan, share: float):
+        self.drone_index = drone_index
+        self.polygon = polygon  # Alt alan köşeleri (girdi ile aynı koordinat türünde), alan düşmediyse boş
+        self.plan = plan  # CoveragePlan (başlangıçtan geçiş dahil), alan düşmediyse None
+        self.share = share  # Alanın bu drone'a düşen oranı
+
+
+class AreaPartitioner:
+    """
+    Çoklu drone için arama alanı bölücü
+    - Alanı şerit yönüne dik kesimlerle N şeride böler: her alt alan tam şeritlerden oluşur
+    - Şeritler başlangıç konumlarının sırasına göre atanır (drone'lar birbirinin yolunu kesmez)
+    - Paylar hıza göre başlar, sonra tahmini bitiş süreleri (geçiş + tarama) eşitlenene kadar düzeltilir
+    - Şeritten fazla drone varsa en hızlılar tarar, kalanlara alan düşmez (plan None)
+    """
+
+    def __init__(self, swath_width: float, overlap: float = 0.2, turn_time: float = 3.0,
+                 angle_step: float = 5.0, iterations: int = 12):
+        """
+        Args:
+            swath_width: Kameranın yerde taradığı şerit genişliği (metre)
+            overlap: Komşu şeritlerin örtüşme oranı (0-1)
+            turn_time: Her yön değişiminin ek süresi (saniye)
+            angle_step: Şerit yönü arama adımı (derece)
+            iterations: Pay düzeltme turu sayısı
+        """
+        self.swath_width = swath_width
+        self.overlap = overlap
+        self.turn_time = turn_time
+        self.angle_step = angle_step
+        self.iterations = iterations
+
+    def planner(self, velocity: float) -> CoveragePlanner:
+        return CoveragePlanner(self.swath_width, overlap=self.overlap, velocity=velocity,
+                               turn_time=self.turn_time, angle_step=self.angle_step)
+
+    def partition(self, polygon: list[tuple[float, float]], starts: list[tuple[float, float]],
+                  speeds: list[float] | None = None) -> list[AreaAssignment]:
+        """
+        Yerel düzlemde bölme.
+        Args:
+            polygon: Arama alanı köşeleri [(north, east)] metre
+            starts: Her drone'un başlangıç konumu [(north, east)]
+            speeds: Her drone'un tarama hızı (m/s), None ise hepsi 1.0
+        Returns:
+            Drone sırasıyla AreaAssignment listesi
+        """
+        count = len(starts)
+        if count == 0:
+            raise ValueError("at least one drone is required")
+        speeds = list(speeds) if speeds is not None else [1.0] * count
+        if len(speeds) != count or min(speeds) <= 0:
+            raise ValueError("speeds must be positive, one per drone")
+
+        # Tek drone için en iyi şerit yönü: kesimler bu yöne paralel, her alt alan tam şeritler
+        single = self.planner(1.0).plan(polygon)
+        if count > single.lanes:
+            # Her drone'a en az bir şerit: en hızlı drone'lar bölüşür, kalanlar aynı şeridi tekrar taramaz
+            active = sorted(sorted(range(count), key=lambda i: -speeds[i])[:single.lanes])
+            assignments = [AreaAssignment(i, [], None, 0.0) for i in range(count)]
+            for i, assignment in zip(active, self.partition(polygon, [starts[i] for i in active],
+                                                            [speeds[i] for i in active])):
+                assignment.drone_index = i
+                assignments[i] = assignment
+            return assignments
+        angle = single.sweep_angle
+        theta = math.radians(angle)
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+
+        def cross(point):
+            return -point[0] * sin_t + point[1] * cos_t
+
+        # Başlangıç konumları kesim eksenindeki sıraya göre şeritlerle eşleşir
+        order = sorted(range(count), key=lambda i: cross(starts[i]))
+        shares = [speeds[i] for i in order]
+        total_area = polygon_area(polygon)
+
+        best = None
+        for _ in range(self.iterations):
+            total = sum(shares)
+            shares = [share / total for share in shares]
+            cuts = self.cut_positions(polygon, cos_t, sin_t, shares, total_area)
+            strips = [clip_slab(polygon, cos_t, sin_t, low, high) for low, high in zip(cuts, cuts[1:])]
+            plans = [self.planner(speeds[i]).plan(strip, starts[i], angle) if len(strip) >= 3 else None
+                     for i, strip in zip(order, strips)]
+            times = [plan.flight_time if plan is not None else 0.0 for plan in plans]
+            if best is None or max(times) < best[0]:
+                best = (max(times), shares, strips, plans)
+            # Yavaş kalanın payı azalır; sönümlü güncelleme salınımı önler
+            target = sum(times) / count
+            shares = [share * math.sqrt(target / time) if time > 0 else share * 1.5
+                      for share, time in zip(shares, times)]
+
+        _, shares, strips, plans = best
+        assignments = [None] * count
+        for i, share, strip, plan in zip(order, shares, strips, plans):
+            assignments[i] = AreaAssignment(i, strip, plan, share)
+        return assignments
+
+    def partition_lat_lon(self, polygon: list[tuple[float, float]], starts: list[tuple[float, float]],
+                          speeds: list[float] | None = None) -> list[AreaAssignment]:
+        """
+        GPS köşeleri ve başlangıçlarıyla bölme; alt alanlar ve waypoint'ler (lat, lon) döner.
+        """
+        frame = LocalFrame(*polygon[0])
+        assignments = self.partition([frame.to_north_east(*point) for point in polygon],
+                                     [frame.to_north_east(*point) for point in starts], speeds)
+        for assignment in assignments:
+            assignment.polygon = [frame.to_lat_lon(*point) for point in assignment.polygon]
+            if assignment.plan is not None:
+                assignment.plan.waypoints = [frame.to_lat_lon(*point) for point in assignment.plan.waypoints]
+        return assignments
+
+    @staticmethod
+    def cut_positions(polygon: list, cos_t: float, sin_t: float, shares: list[float],
+                      total_area: float) -> list[float]:
+        """
+        Kesim eksenindeki (şeritlere dik) konumlar: ardışık kesimler arası alan payla orantılı.
+        """
+        values = [-n * sin_t + e * cos_t for n, e in polygon]
+        low, high = min(values), max(values)
+        cuts = [low]
+        cumulative = 0.0
+        for share in shares[:-1]:
+            cumulative += share
+            target = cumulative * total_area
+            a, b = cuts[-1], high
+            # Alan kesim konumuyla monoton artar: ikiye bölme
+            for _ in range(50):
+                middle = (a + b) / 2
+                if polygon_area(clip_slab(polygon, cos_t, sin_t, low, middle)) < target:
+                    a = middle
+                else:
+                    b = middle
+            cuts.append((a + b) / 2)
+        cuts.append(high)
+        return cuts
+
+
+def polygon_area(polygon: list[tuple[float, float]]) -> float:
+    """
+    Shoelace alanı (mutlak değer).
+    """
+    area = 0.0
+    for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+        area += x1 * y2 - x2 * y1
+    return abs(area) / 2
+
+
+def clip_slab(polygon: list, cos_t: float, sin_t: float, low: float, high: float) -> list[tuple[float, float]]:
+    """
+    Çokgenin low <= cross <= high bandında kalan kısmı (Sutherland-Hodgman, iki yarı düzlem).
+    İçbükey alanda parçalar sınır üzerindeki sıfır genişlikli köprülerle tek çokgen olarak döner.
+    """
+    def cross(point):
+        return -point[0] * sin_t + point[1] * cos_t
+
+    def clip(points, keep):
+        result = []
+        for current, following in zip(points, points[1:] + points[:1]):
+            current_value, following_value = keep(cross(current)), keep(cross(following))
+            if current_value >= 0:
+                result.append(current)
+            if (current_value >= 0) != (following_value >= 0):
+                t = current_value / (current_value - following_value)
+                result.append((current[0] + t * (following[0] - current[0]),
+                               current[1] + t * (following[1] - current[1])))
+        return result
+
+    points = clip(list(polygon), lambda value: value - low)
+    if points:
+        points = clip(points, lambda value: high - value)
+    return points
@@ -0,0 +1,240 @@
+import math
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.local_frame import LocalFrame
+
+
+class CoveragePlan:
+    """
+    Kapsama planı sonucu: yerel (north, east) veya (lat, lon) waypoint listesi ve maliyeti
+    """
+
+    def __init__(self, waypoints: list, sweep_angle: float, lane_spacing: float, lanes: int,
+                 length: float, turns: int, flight_time: float):
+        self.waypoints = waypoints
+        self.sweep_angle = sweep_angle  # Şerit yönü (derece, kuzeyden saat yönünde, 0-180)
+        self.lane_spacing = lane_spacing  # Gerçek şerit aralığı (metre, istenenden küçük veya eşit)
+        self.lanes = lanes
+        self.length = length  # Başlangıçtan itibaren toplam yol (metre)
+        self.turns = turns
+        self.flight_time = flight_time  # Tahmini süre (saniye)
+
+
+class CoveragePlanner:
+    """
+    Boustrophedon (biçerdöver) kapsama planlayıcı
+    - Dışbükey veya içbükey çokgen alanı paralel şeritlerle tarar
+    - İçbükey alan şerit kesişimlerine göre hücrelere bölünür, hücreler sırayla taranır
+    - Şerit yönü tahmini uçuş süresini (yol / hız + dönüş sayısı * dönüş süresi) en aza indirecek şekilde seçilir
+    """
+
+    def __init__(self, swath_width: float, overlap: float = 0.2, velocity: float = 1.0,
+                 turn_time: float = 3.0, angle_step: float = 5.0):
+        """
+        Args:
+            swath_width: Kameranın yerde taradığı şerit genişliği (metre)
+            overlap: Komşu şeritlerin örtüşme oranı (0-1)
+            velocity: Şerit hızı (m/s)
+            turn_time: Her yön değişiminin ek süresi (yavaşlama, hold, hızlanma; saniye)
+            angle_step: Kenar yönlerine ek olarak denenen yön aralığı (derece)
+        """
+        if swath_width <= 0:
+            raise ValueError("swath_width must be positive")
+        if not 0 <= overlap < 1:
+            raise ValueError("overlap must be in [0, 1)")
+        self.swath_width = swath_width
+        self.overlap = overlap
+        self.velocity = velocity
+        self.turn_time = turn_time
+        self.angle_step = angle_step
+
+    @classmethod
+    def from_camera(cls, vision_calculator, altitude: float, marker_size: float | None = None, **kwargs):
+        """
+        Şerit genişliği kameradan: yer kapsaması veya (marker_size verilirse) marker'ın çözülebildiği şerit.
+        """
+        if marker_size is None:
+            swath_width = vision_calculator.calculate_ground_coverage(altitude)["width_m"]
+        else:
+            swath_width = vision_calculator.detectable_swath_width(altitude, marker_size)
+            if swath_width <= 0:
+                raise ValueError(f"{marker_size} m marker is not resolvable from {altitude} m")
+        return cls(swath_width, **kwargs)
+
+    @property
+    def lane_spacing(self) -> float:
+        return self.swath_width * (1 - self.overlap)
+
+    def plan(self, polygon: list[tuple[float, float]], start: tuple[float, float] | None = None,
+             sweep_angle: float | None = None) -> CoveragePlan:
+        """
+        Yerel düzlemde plan.
+        Args:
+            polygon: Köşeler [(north, east)] metre, sıralı (saat yönü veya tersi)
+            start: Drone'un başlangıç konumu (None: ilk köşe)
+            sweep_angle: Sabit şerit yönü (derece); None ise en kısa süreli yön seçilir
+        Returns:
+            CoveragePlan (waypoints: [(north, east)])
+        """
+        if len(polygon) < 3:
+            raise ValueError("polygon needs at least 3 vertices")
+        start = start if start is not None else polygon[0]
+        angles = [sweep_angle] if sweep_angle is not None else self.candidate_angles(polygon)
+        best = None
+        for angle in angles:
+            plan = self.plan_direction(polygon, start, angle)
+            if best is None or plan.flight_time < best.flight_time:
+                best = plan
+        return best
+
+    def plan_lat_lon(self, polygon: list[tuple[float, float]], start: tuple[float, float] | None = None,
+                     sweep_angle: float | None = None) -> CoveragePlan:
+        """
+        GPS köşeleriyle plan (ör. set_lat_lon_yaw köşeleri); waypoint'ler (lat, lon) döner.
+        """
+        frame = LocalFrame(*polygon[0])
+        local = [frame.to_north_east(lat, lon) for lat, lon in polygon]
+        local_start = frame.to_north_east(*start) if start is not None else None
+        plan = self.plan(local, local_start, sweep_angle)
+        plan.waypoints = [frame.to_lat_lon(north, east) for north, east in plan.waypoints]
+        return plan
+
+    def candidate_angles(self, polygon: list[tuple[float, float]]) -> list[float]:
+        """
+        Kenar yönleri (dışbükey alanda en az şeridi verenler bunlar arasında) ve sabit adımlı yönler.
+        """
+        angles = {round(k * self.angle_step, 6) % 180.0 for k in range(int(math.ceil(180.0 / self.angle_step)))}
+        for (n1, e1), (n2, e2) in zip(polygon, polygon[1:] + polygon[:1]):
+            if (n1, e1) != (n2, e2):
+                angles.add(round(math.degrees(math.atan2(e2 - e1, n2 - n1)), 6) % 180.0)
+        return sorted(angles)
+
+    def plan_direction(self, polygon: list[tuple[float, float]], start: tuple[float, float],
+                       angle: float) -> CoveragePlan:
+        """
+        Verilen şerit yönü için plan.
+        """
+        theta = math.radians(angle)
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+        # u: şerit boyunca, v: şeritlere dik
+        rotated = [(n * cos_t + e * sin_t, -n * sin_t + e * cos_t) for n, e in polygon]
+
+        v_min = min(v for _, v in rotated)
+        v_max = max(v for _, v in rotated)
+        lane_count = max(1, math.ceil((v_max - v_min) / self.lane_spacing - 1e-9))
+        spacing = (v_max - v_min) / lane_count
+
+        lanes = []
+        for k in range(lane_count):
+            v = v_min + (k + 0.5) * spacing
+            lanes.append((v, slab_intervals(rotated, v, spacing / 2)))
+
+        cells = decompose_cells(lanes)
+        start_uv = (start[0] * cos_t + start[1] * sin_t, -start[0] * sin_t + start[1] * cos_t)
+        path = order_cells(cells, start_uv)
+
+        waypoints = [(u * cos_t - v * sin_t, u * sin_t + v * cos_t) for u, v in path]
+        length = 0.0
+        previous = start
+        for point in waypoints:
+            length += math.dist(previous, point)
+            previous = point
+        turns = max(0, len(waypoints) - 2)
+        flight_time = length / self.velocity + turns * self.turn_time
+        return CoveragePlan(waypoints, angle, spacing, sum(len(cell) for cell in cells),
+                            length, turns, flight_time)
+
+
+def scanline_intervals(polygon: list[tuple[float, float]], v: float) -> list[tuple[float, float]]:
+    """
+    v sabit doğrusunun çokgen içinde kalan [u0, u1] parçaları (çift-tek kuralı).
+    """
+    crossings = []
+    for (u1, v1), (u2, v2) in zip(polygon, polygon[1:] + polygon[:1]):
+        # Yarı açık kural: köşeden geçen doğru iki kez sayılmaz
+        if (v1 <= v < v2) or (v2 <= v < v1):
+            crossings.append(u1 + (v - v1) * (u2 - u1) / (v2 - v1))
+    crossings.sort()
+    return [(crossings[i], crossings[i + 1]) for i in range(0, len(crossings) - 1, 2)]
+
+
+def slab_intervals(polygon: list[tuple[float, float]], v: float, half_width: float) -> list[tuple[float, float]]:
+    """
+    Şeridin sorumlu olduğu [v - half_width, v + half_width] bandındaki alanın şerit boyunca izdüşümü.
+    Kesit uçları köşeler arasında doğrusal değiştiği için bant kenarları ve banttaki köşeler örneklenir.
+    """
+    low, high = v - half_width, v + half_width
+    v_values = [pv for _, pv in polygon]
+    # Bant kenarı tam alan sınırındaysa yarı açık kural kesit vermez: içeri doğru çok az kaydır
+    eps = 1e-9 * max(1.0, half_width)
+    samples = [max(low, min(v_values) + eps), v, min(high, max(v_values) - eps)]
+    samples += [pv for pv in v_values if low < pv < high]
+    intervals = sorted(interval for sample in samples for interval in scanline_intervals(polygon, sample))
+
+    merged = []
+    for u0, u1 in intervals:
+        if merged and u0 <= merged[-1][1] + 1e-6:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], u1))
+        else:
+            merged.append((u0, u1))
+    return merged
+
+
+def decompose_cells(lanes: list) -> list[list[tuple[float, float, float]]]:
+    """
+    Boustrophedon hücre ayrıştırması: şerit parçası sayısı değişince (bölünme/birleşme) yeni hücre.
+    Returns:
+        Hücreler; her hücre ardışık şeritlerin (v, u0, u1) listesi
+    """
+    def overlaps(a, b):
+        return a[0] <= b[1] and b[0] <= a[1]
+
+    cells = []
+    open_cells = []  # (hücre, son parça)
+    for v, intervals in lanes:
+        next_open = []
+        for interval in intervals:
+            parents = [cell for cell in open_cells if overlaps(cell[1], interval)]
+            if len(parents) == 1:
+                siblings = [other for other in intervals if overlaps(parents[0][1], other)]
+                if len(siblings) == 1:
+                    parents[0][0].append((v, *interval))
+                    next_open.append((parents[0][0], interval))
+                    continue
+            cell = [(v, *interval)]
+            cells.append(cell)
+            next_open.append((cell, interval))
+        open_cells = next_open
+    return cells
+
+
+def order_cells(cells: list, start: tuple[float, float]) -> list[tuple[float, float]]:
+    """
+    Hücreleri açgözlü sırala: her adımda en yakın hücre girişine (ilk/son şerit, sol/sağ uç) geç.
+    Returns:
+        (u, v) waypoint listesi
+    """
+    remaining = list(cells)
+    position = start
+    path = []
+    while remaining:
+        best = None
+        for cell in remaining:
+            for lanes in (cell, cell[::-1]):
+                for from_left in (True, False):
+                    v, u0, u1 = lanes[0]
+                    entry = (u0, v) if from_left else (u1, v)
+                    distance = math.dist(position, entry)
+                    if best is None or distance < best[0]:
+                        best = (distance, cell, lanes, from_left)
+        _, cell, lanes, from_left = best
+        remaining.remove(cell)
+        for v, u0, u1 in lanes:
+            lane = [(u0, v), (u1, v)] if from_left else [(u1, v), (u0, v)]
+            for point in lane:
+                if not path or math.dist(path[-1], point) > 1e-6:
+                    path.append(point)
+            from_left = not from_left
+        position = path[-1]
+    return path
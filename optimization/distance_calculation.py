@@ -1,5 +1,11 @@
 from geographiclib.geodesic import Geodesic
 import math
+import numpy as np
+
+# WGS84 elipsoidi (Vincenty batch çözümü için)
+WGS84_A = Geodesic.WGS84.a
+WGS84_F = Geodesic.WGS84.f
+WGS84_B = WGS84_A * (1 - WGS84_F)
 
 class CalculateDistance:
     """
@@ -58,4 +64,107 @@ class CalculateDistance:
         mid_lat = (lat1 + lat2) / 2
         mid_lon = (lon1 + lon2) / 2
         return mid_lat, mid_lon
-    
\ No newline at end of file
+
+    @staticmethod
+    def get_lat_lon_distance_batch(lat1, lon1, lat2, lon2) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized get_lat_lon_distance: arrays (or scalars) broadcast against each other.
+        Vincenty inverse on WGS84: matches GeographicLib to micrometres at mission scale and
+        about 1 mm worldwide; near-antipodal pairs where it does not converge fall back to GeographicLib.
+        Returns: (north_distance, east_distance, total_distance, azimuth_deg) arrays
+        """
+        lat1, lon1, lat2, lon2 = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (lat1, lon1, lat2, lon2)))
+        distance, azimuth, converged = _vincenty_inverse(lat1, lon1, lat2, lon2)
+        if not converged.all():
+            for index in zip(*np.nonzero(~converged)):
+                g = Geodesic.WGS84.Inverse(lat1[index], lon1[index], lat2[index], lon2[index])
+                distance[index], azimuth[index] = g['s12'], math.radians(g['azi1'])
+        return distance * np.cos(azimuth), distance * np.sin(azimuth), distance, np.degrees(azimuth)
+
+    @staticmethod
+    def get_turn_angle_batch(lat1, lon1, lat2, lon2) -> np.ndarray:
+        """
+        Vectorized get_turn_angle: heading angles (radians) from start to target coordinates.
+        """
+        return np.radians(CalculateDistance.get_lat_lon_distance_batch(lat1, lon1, lat2, lon2)[3])
+
+    @staticmethod
+    def find_vectors_batch(meters, angle_deg) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized find_vectors.
+        Returns: (north_m, east_m) arrays
+        """
+        angle_rad = np.radians(angle_deg)
+        meters = np.asarray(meters, dtype=np.float64)
+        return meters * np.cos(angle_rad), meters * np.sin(angle_rad)
+
+    @staticmethod
+    def find_middle_of_two_points_batch(lat1, lon1, lat2, lon2) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized find_middle_of_two_points.
+        Returns: (mid_lat, mid_lon) arrays
+        """
+        return (np.asarray(lat1) + np.asarray(lat2)) / 2, (np.asarray(lon1) + np.asarray(lon2)) / 2
+
+    @staticmethod
+    def distance_matrix(lats, lons, block_size: int = 512) -> np.ndarray:
+        """
+        Pairwise distance (meters) between N coordinates, e.g. separation between drones.
+        Only the upper triangle is solved, in row blocks to bound memory (block_size x N).
+        Returns: N x N symmetric array with zero diagonal
+        """
+        lats = np.asarray(lats, dtype=np.float64).reshape(-1)
+        lons = np.asarray(lons, dtype=np.float64).reshape(-1)
+        count = len(lats)
+        matrix = np.zeros((count, count))
+        for start in range(0, count, block_size):
+            stop = min(start + block_size, count)
+            distance = CalculateDistance.get_lat_lon_distance_batch(
+                lats[start:stop, None], lons[start:stop, None], lats[None, start:], lons[None, start:]
+            )[2]
+            # Blok içindeki alt üçgen de hesaplandı: sadece üst üçgen (köşegen hariç) tutulur
+            matrix[start:stop, start:] = np.triu(distance, k=1)
+        return matrix + matrix.T
+
+
+def _vincenty_inverse(lat1, lon1, lat2, lon2, max_iterations: int = 200, tolerance: float = 1e-12):
+    """
+    Vincenty inverse formula on arrays.
+    Returns: (distance_m, azimuth1_rad, converged) arrays
+    """
+    lon_diff = np.radians((lon2 - lon1 + 180.0) % 360.0 - 180.0)
+    u1 = np.arctan((1 - WGS84_F) * np.tan(np.radians(lat1)))
+    u2 = np.arctan((1 - WGS84_F) * np.tan(np.radians(lat2)))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+
+    lam = lon_diff.copy()
+    converged = np.zeros(lam.shape, dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            # Çakışık noktalar: sin_sigma = 0
+            sin_alpha = np.where(sin_sigma > 0, cos_u1 * cos_u2 * sin_lam / sin_sigma, 0.0)
+            cos2_alpha = 1 - sin_alpha ** 2
+            # Ekvator üzerindeki çizgi: cos2_alpha = 0
+            cos_2sigma_m = np.where(cos2_alpha > 0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha, 0.0)
+            c = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+            previous = lam
+            lam = lon_diff + (1 - c) * WGS84_F * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)))
+            converged = np.abs(lam - previous) < tolerance
+            if converged.all():
+                break
+
+    u_sq = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = big_b * sin_sigma * (cos_2sigma_m + big_b / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m ** 2)
+        - big_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sigma_m ** 2)))
+    distance = WGS84_B * big_a * (sigma - delta_sigma)
+    azimuth = np.arctan2(cos_u2 * np.sin(lam), cos_u1 * sin_u2 - sin_u1 * cos_u2 * np.cos(lam))
+    return distance, azimuth, converged & np.isfinite(distance)
@@ -32,6 +32,23 @@ class DroneVisionCalculator:
             'meters_per_pixel_v': meters_per_pixel_v
         }
 
+    def detectable_swath_width(self, altitude: float, marker_size: float, min_marker_px: float = 20) -> float:
+        """
+        Width of the ground strip in which a marker still spans min_marker_px pixels.
+        Apparent size falls with slant range, so the strip can be narrower than the footprint.
+        Args:
+            altitude: Flight altitude above the marker (m)
+            marker_size: Marker side length (m)
+            min_marker_px: Smallest marker side the detector decodes reliably (pixels)
+        Returns: Strip width in meters, clipped to the footprint width; 0 if unresolvable even at nadir
+        """
+        focal_px = self.image_width / 2 / math.tan(self.fov_h / 2)
+        max_range = focal_px * marker_size / min_marker_px
+        if max_range <= altitude:
+            return 0.0
+        max_offset = math.sqrt(max_range ** 2 - altitude ** 2)
+        return 2 * min(max_offset, altitude * math.tan(self.fov_h / 2))
+
     def print_coverage_info(self, altitude: float) -> dict:
         """
         Print ground coverage info for given altitude.
@@ -0,0 +1,86 @@
+import math
+
+# WGS84 elipsoidi
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+
+# |mesafe - GeographicLib Inverse s12| üst sınırı (metre), iki nokta da orijinden 1 km içinde, enlem ≤ 70°
+# Ölçülen en kötü: 300 m'de 0.002 mm, 1 km'de 0.06 mm, 3 km'de 1.4 mm (test/local_frame_test.py)
+# Hata ikinci derece açılımın kalanı: mesafenin kübüyle büyür
+MAX_ERROR_1KM = 1e-4
+
+
+class LocalFrame:
+    """
+    Sabit orijinli yerel kuzey/doğu düzlemi (ör. home pozisyonu veya alan köşesi)
+    - Enlem/boylamı katsayıları önceden hesaplanmış polinomla metreye çevirir (trigonometri yok)
+    - Birkaç yüz metrelik misyonlarda GeographicLib Inverse yerine uçuş döngülerinde kullanılır
+    - Hata: orijinden 1 km içinde MAX_ERROR_1KM (0.1 mm), GPS gürültüsünün çok altında
+    """
+
+    def __init__(self, origin_lat: float, origin_lon: float):
+        self.origin_lat = origin_lat
+        self.origin_lon = origin_lon
+
+        phi = math.radians(origin_lat)
+        sin_phi, cos_phi = math.sin(phi), math.cos(phi)
+        w2 = 1 - WGS84_E2 * sin_phi ** 2
+        meridian_radius = WGS84_A * (1 - WGS84_E2) / w2 ** 1.5  # M: meridyen eğrilik yarıçapı
+        normal_radius = WGS84_A / math.sqrt(w2)  # N: dik eğrilik yarıçapı
+        deg = math.radians(1.0)
+
+        # Teğet düzleme ikinci derece açılım (derece cinsinden dlat, dlon):
+        # north = dlat * (north_k0 + north_k1 * dlat) + north_k2 * dlon^2  (paraleller kutba doğru kıvrılır)
+        # east = dlon * (east_k0 + east_k1 * dlat)  (paralel yarıçapı N*cos(phi), türevi -M*sin(phi))
+        self.north_k0 = meridian_radius * deg
+        self.north_k1 = 0.5 * 3 * meridian_radius * WGS84_E2 * sin_phi * cos_phi / w2 * deg * deg
+        self.north_k2 = 0.5 * normal_radius * sin_phi * cos_phi * deg * deg
+        self.east_k0 = normal_radius * cos_phi * deg
+        self.east_k1 = -meridian_radius * sin_phi * deg * deg
+
+    def to_north_east(self, lat: float, lon: float) -> tuple[float, float]:
+        """
+        GPS koordinatının orijine göre konumu.
+        Args:
+            lat, lon: Derece
+        Returns:
+            (north_m, east_m)
+        """
+        dlat = lat - self.origin_lat
+        dlon = (lon - self.origin_lon + 180.0) % 360.0 - 180.0  # Tarih değiştirme çizgisi
+        north = dlat * (self.north_k0 + self.north_k1 * dlat) + self.north_k2 * dlon * dlon
+        east = dlon * (self.east_k0 + self.east_k1 * dlat)
+        return north, east
+
+    def to_lat_lon(self, north: float, east: float) -> tuple[float, float]:
+        """
+        Yerel konumdan GPS koordinatı (to_north_east'in tersi).
+        Returns:
+            (lat, lon) derece
+        """
+        # Polinomun tersi sabit nokta iterasyonuyla: her adım karesel terimlerin hatasını küçültür
+        dlat = north / self.north_k0
+        dlon = east / (self.east_k0 + self.east_k1 * dlat)
+        for _ in range(2):
+            dlat = (north - self.north_k1 * dlat * dlat - self.north_k2 * dlon * dlon) / self.north_k0
+            dlon = east / (self.east_k0 + self.east_k1 * dlat)
+        return self.origin_lat + dlat, self.origin_lon + dlon
+
+    def distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> tuple[float, float, float]:
+        """
+        İki GPS noktası arası kuzey/doğu/toplam mesafe (CalculateDistance.get_lat_lon_distance ile aynı sıra).
+        Returns:
+            (north_distance, east_distance, total_distance)
+        """
+        north1, east1 = self.to_north_east(lat1, lon1)
+        north2, east2 = self.to_north_east(lat2, lon2)
+        north, east = north2 - north1, east2 - east1
+        return north, east, math.hypot(north, east)
+
+    def distance_from_origin(self, lat: float, lon: float) -> float:
+        """
+        Orijine yatay mesafe (metre).
+        """
+        north, east = self.to_north_east(lat, lon)
+        return math.hypot(north, east)
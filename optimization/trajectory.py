@@ -0,0 +1,198 @@
+import math
+import numpy as np
+
+
+class Trajectory:
+    """
+    Waypoint'lerden sürekli hareket yolu
+    - Köşeler yanal ivme sınırından gelen yarıçaplı yaylarla yuvarlanır (dur-kalk yok)
+    - Hız profili: düzlükte seyir hızı, yayda sqrt(a_yanal * r), ivmelenme/yavaşlama sınırlı
+    - Yol sık örneklenir (sample_step); takip ve süre hesabı örnekler üzerinden yapılır
+    """
+
+    def __init__(self, waypoints: list[tuple[float, float]], speed: float, max_lateral_accel: float = 1.0,
+                 max_accel: float = 1.0, start_speed: float = 0.0, sample_step: float = 0.1):
+        """
+        Args:
+            waypoints: [(north, east)] metre, ilk nokta başlangıç konumu
+            speed: Seyir hızı (m/s)
+            max_lateral_accel: Dönüşte izin verilen yanal ivme (m/s^2), yay yarıçapı = speed^2 / bu değer
+            max_accel: Hızlanma ve yavaşlama sınırı (m/s^2)
+            start_speed: Başlangıç hızı (m/s)
+            sample_step: Örnekleme aralığı (metre)
+        """
+        points = [tuple(map(float, waypoints[0]))]
+        for point in waypoints[1:]:
+            if math.dist(points[-1], point) > 1e-6:
+                points.append(tuple(map(float, point)))
+        if len(points) < 2:
+            raise ValueError("trajectory needs at least two distinct waypoints")
+
+        self.speed = speed
+        self.max_lateral_accel = max_lateral_accel
+        self.max_accel = max_accel
+        self.turn_radius = speed ** 2 / max_lateral_accel
+
+        pieces = self.build_pieces(points)
+        self.points, self.tangents, self.limits = self.sample(pieces, sample_step)
+        steps = np.linalg.norm(np.diff(self.points, axis=0), axis=1)
+        self.distances = np.concatenate(([0.0], np.cumsum(steps)))
+        self.length = float(self.distances[-1])
+        self.speeds = self.speed_profile(steps, start_speed)
+
+    def build_pieces(self, points: list) -> list:
+        """
+        Düz parçalar ve köşe yayları: [("line", a, b)] / [("arc", merkez, r, başlangıç açısı, süpürme)]
+        """
+        points = np.asarray(points)
+        directions = np.diff(points, axis=0)
+        lengths = np.linalg.norm(directions, axis=1)
+        directions = directions / lengths[:, None]
+
+        # Her köşenin yay için kullanabileceği teğet uzunluğu: komşu parçanın yarısı (uç parçalarda tamamı)
+        corners = []
+        for i in range(1, len(points) - 1):
+            d1, d2 = directions[i - 1], directions[i]
+            deflection = math.acos(float(np.clip(np.dot(d1, d2), -1.0, 1.0)))
+            if deflection < 1e-6:
+                corners.append(None)
+                continue
+            available = min(lengths[i - 1] / (1 if i == 1 else 2), lengths[i] / (1 if i == len(points) - 2 else 2))
+            radius = min(self.turn_radius, available / math.tan(deflection / 2)) if deflection < math.pi - 1e-6 else 0.0
+            corners.append((deflection, radius))
+
+        pieces = []
+        cursor = points[0]
+        for i in range(1, len(points) - 1):
+            corner = corners[i - 1]
+            if corner is None or corner[1] <= 1e-6:
+                pieces.append(("line", cursor, points[i]))
+                cursor = points[i]
+                continue
+            deflection, radius = corner
+            d1, d2 = directions[i - 1], directions[i]
+            tangent_length = radius * math.tan(deflection / 2)
+            arc_start = points[i] - d1 * tangent_length
+            arc_end = points[i] + d2 * tangent_length
+            pieces.append(("line", cursor, arc_start))
+            # Dönüş yönü: d1 x d2 işareti; merkez dönüş tarafındaki normalde
+            side = 1.0 if d1[0] * d2[1] - d1[1] * d2[0] > 0 else -1.0
+            center = arc_start + side * radius * np.array([-d1[1], d1[0]])
+            start_angle = math.atan2(arc_start[1] - center[1], arc_start[0] - center[0])
+            pieces.append(("arc", center, radius, start_angle, side * deflection))
+            cursor = arc_end
+        pieces.append(("line", cursor, points[-1]))
+        return pieces
+
+    def sample(self, pieces: list, step: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Parçaları örnekle: (noktalar Nx2, birim teğetler Nx2, hız sınırları N)
+        """
+        points, tangents, limits = [], [], []
+        arc_speed = lambda radius: min(self.speed, math.sqrt(self.max_lateral_accel * radius))
+        for piece in pieces:
+            if piece[0] == "line":
+                _, a, b = piece
+                length = float(np.linalg.norm(b - a))
+                if length < 1e-9:
+                    continue
+                count = max(1, int(math.ceil(length / step)))
+                t = np.arange(count) / count
+                points.append(a + t[:, None] * (b - a))
+                tangents.append(np.repeat(((b - a) / length)[None, :], count, axis=0))
+                limits.append(np.full(count, self.speed))
+            else:
+                _, center, radius, start_angle, sweep = piece
+                count = max(1, int(math.ceil(abs(sweep) * radius / step)))
+                angles = start_angle + sweep * np.arange(count) / count
+                points.append(center + radius * np.stack((np.cos(angles), np.sin(angles)), axis=1))
+                sign = 1.0 if sweep > 0 else -1.0
+                tangents.append(sign * np.stack((-np.sin(angles), np.cos(angles)), axis=1))
+                limits.append(np.full(count, arc_speed(radius)))
+        # Son nokta
+        last = pieces[-1]
+        points.append(np.asarray(last[2])[None, :])
+        tangents.append(tangents[-1][-1:])
+        limits.append(np.array([0.0]))
+        return np.concatenate(points), np.concatenate(tangents), np.concatenate(limits)
+
+    def speed_profile(self, steps: np.ndarray, start_speed: float) -> np.ndarray:
+        """
+        İleri (hızlanma) ve geri (yavaşlama, sonda durma) geçişle hız sınırlarına uyan profil.
+        """
+        speeds = self.limits.copy()
+        speeds[0] = min(speeds[0], start_speed)
+        for k in range(1, len(speeds)):
+            speeds[k] = min(speeds[k], math.sqrt(speeds[k - 1] ** 2 + 2 * self.max_accel * steps[k - 1]))
+        for k in range(len(speeds) - 2, -1, -1):
+            speeds[k] = min(speeds[k], math.sqrt(speeds[k + 1] ** 2 + 2 * self.max_accel * steps[k]))
+        return speeds
+
+    @property
+    def duration(self) -> float:
+        """
+        Profil takip edilirse tahmini süre (saniye).
+        """
+        steps = np.diff(self.distances)
+        average = (self.speeds[1:] + self.speeds[:-1]) / 2
+        moving = average > 1e-9
+        return float(np.sum(steps[moving] / average[moving]))
+
+
+class TrajectoryFollower:
+    """
+    Trajectory için hız komutu üretici (VelocityNedYaw north/east + yaw)
+    - Hız yol teğeti boyunca profilden, yoldan sapma oransal düzeltmeyle giderilir
+    - İlerleme sadece ileri doğru aranır: yakın komşu şeride atlamaz
+    """
+
+    def __init__(self, trajectory: Trajectory, cross_track_gain: float = 0.8, max_correction: float = 1.0,
+                 lookahead: float = 1.0, search_window: float = 20.0, goal_tolerance: float = 0.5):
+        """
+        Args:
+            cross_track_gain: Yoldan sapma (m) başına düzeltme hızı (m/s)
+            max_correction: Düzeltme hızı üst sınırı (m/s)
+            lookahead: Hız profilinin ileriden de okunduğu mesafe (m, duruştan kalkış için)
+            search_window: En yakın noktanın aranacağı ileri mesafe (m)
+            goal_tolerance: Bitişe bu kadar kalınca tamamlandı sayılır (m)
+        """
+        self.trajectory = trajectory
+        self.cross_track_gain = cross_track_gain
+        self.max_correction = max_correction
+        self.lookahead = lookahead
+        self.search_window = search_window
+        self.goal_tolerance = goal_tolerance
+        self.index = 0
+
+    @property
+    def progress(self) -> float:
+        return float(self.trajectory.distances[self.index])
+
+    def update(self, north: float, east: float) -> tuple[float, float, float, bool]:
+        """
+        Mevcut konum için komut.
+        Returns:
+            (velocity_north, velocity_east, yaw_deg, done)
+        """
+        trajectory = self.trajectory
+        distances = trajectory.distances
+        position = np.array([north, east])
+
+        stop = int(np.searchsorted(distances, distances[self.index] + self.search_window, side="right"))
+        window = trajectory.points[self.index:max(stop, self.index + 1)]
+        self.index += int(np.argmin(np.sum((window - position) ** 2, axis=1)))
+
+        tangent = trajectory.tangents[self.index]
+        yaw = math.degrees(math.atan2(tangent[1], tangent[0]))
+        if trajectory.length - distances[self.index] <= self.goal_tolerance:
+            return 0.0, 0.0, yaw, True
+
+        ahead = int(np.searchsorted(distances, distances[self.index] + self.lookahead))
+        # Başta profil 0: ileriki hız kalkışı sağlar; sonda ileriki 0 olduğundan mevcut hız kullanılır
+        speed = max(float(trajectory.speeds[self.index]), float(trajectory.speeds[min(ahead, len(distances) - 1)]))
+        correction = (trajectory.points[self.index] - position) * self.cross_track_gain
+        norm = float(np.linalg.norm(correction))
+        if norm > self.max_correction:
+            correction *= self.max_correction / norm
+        velocity = speed * tangent + correction
+        return float(velocity[0]), float(velocity[1]), yaw, False
@@ -0,0 +1,62 @@
+import asyncio
+import sys
+import os
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from missions.swarm_discovery import SwarmDiscovery
+
+# Every drone runs this script with the same area and swarm configuration and its own index:
+#     python3 rpi_execute/partitioned.py 0
+#     python3 rpi_execute/partitioned.py 1
+SEARCH_AREA = [
+    (40.7445114, 30.3380595),  # left_down
+    (40.7445943, 30.3386202),  # left_up
+    (40.7440583, 30.3381680),  # right_down
+    (40.7441384, 30.3387387),  # right_up
+]
+# Launch spot and search speed (m/s) of each drone, in drone index order
+SWARM_STARTS = [
+    (40.7444800, 30.3379900),
+    (40.7440300, 30.3381000),
+]
+SWARM_SPEEDS = [1.0, 1.0]
+
+
+async def run_drone(drone_index: int, system_address: str, xbee_port: str, use_computer_camera: bool = False) -> None:
+    """
+    Single drone of a partitioned search: covers only its own share of the area.
+    Args:
+        drone_index: Index in SWARM_STARTS / SWARM_SPEEDS.
+        system_address: MAVSDK address (e.g., serial:///dev/ttyACM0:57600).
+        xbee_port: XBee serial port.
+    """
+    try:
+        print(f"Starting drone {drone_index + 1}/{len(SWARM_STARTS)}...")
+        swarm_drone = SwarmDiscovery(xbee_port=xbee_port, use_computer_camera=use_computer_camera)
+        await swarm_drone.connect(system_address=system_address)
+        swarm_drone.set_lat_lon_yaw(*SEARCH_AREA)
+
+        await swarm_drone.initialize_mission(target_altitude=8.0, drone_purpose="partition")
+        await swarm_drone.hold_mode(1.0, swarm_drone.home_position["yaw"])
+        await swarm_drone.square_oscillation_by_cam_fov(
+            distance1=0.0,
+            distance2=0.0,
+            velocity=SWARM_SPEEDS[drone_index],
+            camera_fov_horizontal=62,
+            camera_fov_vertical=49,
+            image_width=800,
+            image_height=600,
+            search_polygon=swarm_drone.area_polygon(),
+            swarm_starts=SWARM_STARTS,
+            swarm_speeds=SWARM_SPEEDS,
+            drone_index=drone_index
+        )
+        await swarm_drone.end_mission()
+    except Exception as e:
+        print(f"Drone {drone_index + 1} ERROR: {e}")
+
+
+if __name__ == "__main__":
+    index = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    asyncio.run(run_drone(index, system_address="serial:///dev/ttyACM0:57600", xbee_port="/dev/ttyUSB0"))
+    print("Test completed.")
@@ -0,0 +1,77 @@
+import math
+import os
+import sys
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.area_partitioner import AreaPartitioner, polygon_area
+from optimization.coverage_planner import CoveragePlanner
+from geometry_helpers import U_SHAPE, inside, path_distance
+
+FIELD = [(0, 0), (0, 300), (200, 300), (200, 0)]
+
+
+def test_search_time_scales_with_swarm_size():
+    partitioner = AreaPartitioner(10.0, overlap=0.2)
+    single = CoveragePlanner(10.0, overlap=0.2, velocity=2.0).plan(FIELD, (-5, 0)).flight_time
+    for count in (2, 4):
+        starts = [(-5, 300 * i / count) for i in range(count)]
+        assignments = partitioner.partition(FIELD, starts, [2.0] * count)
+        assert np.isclose(sum(a.share for a in assignments), 1.0)
+        assert np.isclose(sum(polygon_area(a.polygon) for a in assignments), polygon_area(FIELD))
+        # Within 20 % of ideal 1/N (lanes are discrete, each drone also flies to its strip)
+        assert max(a.plan.flight_time for a in assignments) < 1.2 * single / count
+
+
+def test_faster_drone_gets_larger_share():
+    assignments = AreaPartitioner(10.0).partition(FIELD, [(-5, 0), (-5, 300)], [1.0, 2.0])
+    slow, fast = assignments
+    assert fast.share > 1.6 * slow.share
+    times = [a.plan.flight_time for a in assignments]
+    assert max(times) / min(times) < 1.15
+
+
+def test_strips_follow_start_positions():
+    # Lanes run along the long east-west side, so the field is cut into north and south strips.
+    # Drone 0 launches at the north end: it gets the north strip
+    starts = [(205, 150), (-5, 150)]
+    assignments = AreaPartitioner(10.0).partition(FIELD, starts, [2.0, 2.0])
+    assert assignments[0].plan.sweep_angle == 90.0
+    north_edges = [max(n for n, _ in a.polygon) for a in assignments]
+    assert north_edges[0] > north_edges[1]
+    # The first leg only reaches the strip, it does not cross the other drone's area
+    for a, start in zip(assignments, starts):
+        assert math.dist(start, a.plan.waypoints[0]) < 160.0
+        assert abs(start[0] - a.plan.waypoints[0][0]) < 15.0
+
+
+def test_concave_area_is_fully_covered():
+    assignments = AreaPartitioner(6.0, overlap=0.1).partition(U_SHAPE, [(-5, 0), (-5, 60), (45, 30)], [1.0] * 3)
+    for n in np.arange(0.5, 40, 1.0):
+        for e in np.arange(0.5, 60, 1.0):
+            if inside((n, e), U_SHAPE):
+                assert any(path_distance((n, e), a.plan.waypoints) <= 3.0 + 1e-6 for a in assignments), (n, e)
+
+
+def test_more_drones_than_lanes():
+    # 12 m wide field: 2 lanes of 10 m swath for 5 drones
+    field = [(0, 0), (0, 100), (12, 100), (12, 0)]
+    lanes = CoveragePlanner(10.0, overlap=0.2).plan(field).lanes
+    starts = [(-5, 100 * i / 5) for i in range(5)]
+    assignments = AreaPartitioner(10.0, overlap=0.2).partition(field, starts, [2.0, 2.0, 3.0, 2.0, 2.0])
+    active = [a for a in assignments if a.plan is not None]
+    # Fastest drones share the lanes, the rest get no area instead of re-flying a lane
+    assert len(active) == lanes < len(starts) and assignments[2] in active
+    assert [a.drone_index for a in assignments] == list(range(5))
+    assert all(a.polygon == [] and a.share == 0.0 for a in assignments if a.plan is None)
+    assert np.isclose(sum(a.share for a in active), 1.0)
+    assert np.isclose(sum(polygon_area(a.polygon) for a in active), polygon_area(field))
+
+
+if __name__ == "__main__":
+    test_search_time_scales_with_swarm_size()
+    test_faster_drone_gets_larger_share()
+    test_strips_follow_start_positions()
+    test_concave_area_is_fully_covered()
+    test_more_drones_than_lanes()
+    print("Area partitioner tests passed.")
@@ -0,0 +1,97 @@
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import cv2
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.calibration_corners import (extract_corners, extract_charuco_corners, charuco_board,
+                                               charuco_object_points, chessboard_precheck, CORNER_CACHE_FILE)
+
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "aruco_mission", "calibration_images")
+CHESSBOARD_SIZE = (9, 6)
+CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
+
+
+def test_pool_matches_serial():
+    paths = sorted(glob.glob(os.path.join(IMAGE_DIR, "*.jpg")))[:6]
+    serial, _ = extract_corners(paths, CHESSBOARD_SIZE, CRITERIA, workers=1)
+    pooled, processed = extract_corners(paths, CHESSBOARD_SIZE, CRITERIA, workers=2)
+    assert processed == len(paths)
+    for (path_a, corners_a, size_a), (path_b, corners_b, size_b) in zip(serial, pooled):
+        assert path_a == path_b and size_a == size_b == (640, 480)
+        assert np.array_equal(corners_a, corners_b)
+
+
+def test_cache_only_processes_new_images():
+    with tempfile.TemporaryDirectory() as directory:
+        sources = sorted(glob.glob(os.path.join(IMAGE_DIR, "*.jpg")))[:4]
+        for source in sources[:3]:
+            shutil.copy(source, directory)
+        cache_path = os.path.join(directory, CORNER_CACHE_FILE)
+
+        paths = sorted(glob.glob(os.path.join(directory, "*.jpg")))
+        first, processed = extract_corners(paths, CHESSBOARD_SIZE, CRITERIA, workers=1, cache_path=cache_path)
+        assert processed == 3
+        cached, processed = extract_corners(paths, CHESSBOARD_SIZE, CRITERIA, workers=1, cache_path=cache_path)
+        assert processed == 0
+        assert all(np.allclose(a[1], b[1]) for a, b in zip(first, cached))
+
+        shutil.copy(sources[3], directory)
+        paths = sorted(glob.glob(os.path.join(directory, "*.jpg")))
+        _, processed = extract_corners(paths, CHESSBOARD_SIZE, CRITERIA, workers=1, cache_path=cache_path)
+        assert processed == 1
+
+
+def test_charuco_accepts_partial_board():
+    # 7x5 board, 100 px squares: keep the left four columns only
+    board_image = charuco_board().generateImage((700, 500), marginSize=0)
+    partial_image = cv2.copyMakeBorder(board_image[:, :400], 40, 40, 40, 40, cv2.BORDER_CONSTANT, value=255)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, "full.png"), os.path.join(directory, "partial.png")]
+        cv2.imwrite(paths[0], cv2.copyMakeBorder(board_image, 40, 40, 40, 40, cv2.BORDER_CONSTANT, value=255))
+        cv2.imwrite(paths[1], partial_image)
+        cache_path = os.path.join(directory, CORNER_CACHE_FILE)
+        results, _ = extract_charuco_corners(paths, workers=1, cache_path=cache_path)
+        cached, processed = extract_charuco_corners(paths, workers=1, cache_path=cache_path)
+
+    (_, full_corners, full_ids, _), (_, corners, ids, image_size) = results
+    assert len(full_ids) == 24
+    assert 6 <= len(ids) < 24 and image_size == (480, 580)
+    # Inner corner k sits at ((k % 6) + 1, (k // 6) + 1) squares from the board's top-left corner
+    expected = (charuco_object_points(ids)[:, :2] / 0.03) * 100 + 40
+    assert np.allclose(corners.reshape(-1, 2), expected, atol=1.0)
+    assert processed == 0 and np.array_equal(cached[1][2], ids)
+
+
+def test_precheck_rejects_frames_without_board():
+    board = cv2.imread(sorted(glob.glob(os.path.join(IMAGE_DIR, "*.jpg")))[1], cv2.IMREAD_GRAYSCALE)
+    noise = cv2.GaussianBlur(np.random.default_rng(0).integers(0, 255, (480, 640), dtype=np.uint8), (7, 7), 0)
+    assert chessboard_precheck(board, CHESSBOARD_SIZE)
+    assert not chessboard_precheck(noise, CHESSBOARD_SIZE)
+    assert not chessboard_precheck(cv2.resize(board[:240, :320], (640, 480)), CHESSBOARD_SIZE)
+
+
+def test_precheck_keeps_small_and_blurred_boards():
+    # Every bundled view passes, including the ones CALIB_CB_FAST_CHECK misses
+    boards = [cv2.imread(path, cv2.IMREAD_GRAYSCALE) for path in sorted(glob.glob(os.path.join(IMAGE_DIR, "*.jpg")))]
+    assert all(chessboard_precheck(board, CHESSBOARD_SIZE) for board in boards)
+
+    # Distant board: ~8 px squares at 640x480, ~4 px in the downscaled check
+    chessboard = cv2.imread(os.path.join(os.path.dirname(IMAGE_DIR), "chessboard_9x6.png"), cv2.IMREAD_GRAYSCALE)
+    frame = np.full((480, 640), 120, dtype=np.uint8)
+    frame[300:360, 420:500] = cv2.resize(chessboard, (80, 60), interpolation=cv2.INTER_AREA)
+    assert cv2.findChessboardCorners(frame, CHESSBOARD_SIZE)[0]
+    assert chessboard_precheck(frame, CHESSBOARD_SIZE)
+
+
+if __name__ == "__main__":
+    test_pool_matches_serial()
+    test_cache_only_processes_new_images()
+    test_charuco_accepts_partial_board()
+    test_precheck_rejects_frames_without_board()
+    test_precheck_keeps_small_and_blurred_boards()
+    print("Calibration corner tests passed.")
@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.calibration_store import (CalibrationData, CalibrationStore, save_calibration,
+                                             load_calibration, CALIBRATION_FILE)
+
+CAMERA_MATRIX = np.array([[600.0, 0.0, 319.5], [0.0, 600.0, 239.5], [0.0, 0.0, 1.0]])
+DIST_COEFFS = np.array([[0.05, -0.1, 0.0, 0.0, 0.01]])
+
+
+def test_npz_round_trip():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, CALIBRATION_FILE)
+        save_calibration(path, CalibrationData(CAMERA_MATRIX, DIST_COEFFS, (640, 480), 0.31))
+        loaded = load_calibration(path)
+    assert np.array_equal(loaded.camera_matrix, CAMERA_MATRIX)
+    assert np.array_equal(loaded.dist_coeffs, DIST_COEFFS)
+    assert loaded.image_size == (640, 480) and loaded.calibration_error == 0.31
+
+
+def test_rescale_keeps_principal_point_centered():
+    scaled = CalibrationData(CAMERA_MATRIX, DIST_COEFFS, (640, 480)).scaled_to(1280, 960)
+    assert np.isclose(scaled.camera_matrix[0, 0], 1200.0)
+    assert np.isclose(scaled.camera_matrix[0, 2], 639.5)
+    assert np.isclose(scaled.camera_matrix[1, 2], 479.5)
+    assert np.array_equal(scaled.dist_coeffs, DIST_COEFFS)
+
+
+def test_store_reads_file_once_and_caches_per_resolution():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, CALIBRATION_FILE)
+        save_calibration(path, CalibrationData(CAMERA_MATRIX, DIST_COEFFS, (640, 480)))
+        store = CalibrationStore(search_paths=[path])
+        first = store.get(320, 240)
+        os.remove(path)  # cached: no second read
+        assert store.get(320, 240) is first
+        assert np.isclose(store.get(640, 480).camera_matrix[0, 0], 600.0)
+        assert np.isclose(first.camera_matrix[0, 0], 300.0)
+        store.invalidate()
+        assert store.get(640, 480).is_default
+
+
+if __name__ == "__main__":
+    test_npz_round_trip()
+    test_rescale_keeps_principal_point_centered()
+    test_store_reads_file_once_and_caches_per_resolution()
+    print("Calibration store tests passed.")
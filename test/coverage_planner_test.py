@@ -0,0 +1,90 @@
+import math
+import os
+import sys
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.coverage_planner import CoveragePlanner, decompose_cells, slab_intervals
+from optimization.drone_vision_calculator import DroneVisionCalculator
+from optimization.local_frame import LocalFrame
+from geometry_helpers import U_SHAPE, inside, path_distance
+
+# set_lat_lon_yaw corners from rpi_execute (not a rectangle), in polygon order
+AREA = [(40.7445114, 30.3380595), (40.7445943, 30.3386202), (40.7441384, 30.3387387), (40.7440583, 30.3381680)]
+
+
+def uncovered(plan, polygon, swath_width, step=1.0) -> int:
+    """Points of the area farther than half a swath from every flown segment"""
+    norths, easts = [n for n, _ in polygon], [e for _, e in polygon]
+    missed = 0
+    for n in np.arange(min(norths), max(norths), step):
+        for e in np.arange(min(easts), max(easts), step):
+            if not inside((n, e), polygon):
+                continue
+            distance = path_distance((n, e), plan.waypoints)
+            missed += distance > swath_width / 2 + 1e-6
+    return missed
+
+
+def test_covers_non_rectangular_area_along_long_edge():
+    frame = LocalFrame(*AREA[0])
+    polygon = [frame.to_north_east(lat, lon) for lat, lon in AREA]
+    plan = CoveragePlanner(8.0, overlap=0.2).plan(polygon)
+    assert uncovered(plan, polygon, 8.0) == 0
+    assert plan.lane_spacing <= 8.0 * 0.8
+    # Lanes follow the ~50 m west edge, not the ~50 m x ~35 m bounding box axes
+    (n1, e1), (n2, e2) = polygon[3], polygon[0]
+    edge_angle = math.degrees(math.atan2(e2 - e1, n2 - n1)) % 180.0
+    assert abs(plan.sweep_angle - edge_angle) < 1.0
+
+
+def test_covers_concave_area_in_cells():
+    planner = CoveragePlanner(6.0, overlap=0.1)
+    plan = planner.plan(U_SHAPE, sweep_angle=90.0)
+    assert uncovered(plan, U_SHAPE, 6.0) == 0
+    # Lanes in the prongs are split: base, two prongs
+    rotated = [(e, -n) for n, e in U_SHAPE]
+    v_min, v_max = min(v for _, v in rotated), max(v for _, v in rotated)
+    count = math.ceil((v_max - v_min) / planner.lane_spacing)
+    spacing = (v_max - v_min) / count
+    lanes = [(v_min + (k + 0.5) * spacing, slab_intervals(rotated, v_min + (k + 0.5) * spacing, spacing / 2))
+             for k in range(count)]
+    assert len(decompose_cells(lanes)) == 3
+    assert uncovered(planner.plan(U_SHAPE), U_SHAPE, 6.0) == 0
+
+
+def test_picks_direction_with_fewest_turns():
+    # 200 m x 30 m strip rotated by 30 degrees
+    theta = math.radians(30.0)
+    corners = [(0, 0), (200, 0), (200, 30), (0, 30)]
+    strip = [(u * math.cos(theta) - v * math.sin(theta), u * math.sin(theta) + v * math.cos(theta)) for u, v in corners]
+    planner = CoveragePlanner(10.0, overlap=0.0, velocity=2.0)
+    best = planner.plan(strip)
+    across = planner.plan(strip, sweep_angle=120.0)
+    assert abs(best.sweep_angle - 30.0) < 1e-6
+    assert best.lanes == 3 and best.turns == 4
+    assert best.flight_time < across.flight_time
+
+
+def test_plan_lat_lon_and_camera_swath():
+    calculator = DroneVisionCalculator(camera_fov_horizontal=62, camera_fov_vertical=49, image_width=800, image_height=600)
+    planner = CoveragePlanner.from_camera(calculator, 8.0, overlap=0.2)
+    assert np.isclose(planner.swath_width, calculator.calculate_ground_coverage(8.0)["width_m"])
+    plan = planner.plan_lat_lon(AREA)
+    lats, lons = [p[0] for p in AREA], [p[1] for p in AREA]
+    for lat, lon in plan.waypoints:
+        assert min(lats) - 1e-6 <= lat <= max(lats) + 1e-6 and min(lons) - 1e-6 <= lon <= max(lons) + 1e-6
+    try:
+        CoveragePlanner.from_camera(calculator, 8.0, marker_size=0.05)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("5 cm marker should not be resolvable from 8 m")
+
+
+if __name__ == "__main__":
+    test_covers_non_rectangular_area_along_long_edge()
+    test_covers_concave_area_in_cells()
+    test_picks_direction_with_fewest_turns()
+    test_plan_lat_lon_and_camera_swath()
+    print("Coverage planner tests passed.")
@@ -0,0 +1,94 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import cv2
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.detection_events import DetectionEventBridge, PoseEvent
+from aruco_mission.frame_source import FrameSource
+from aruco_mission.marker_detection import MarkerDetectionEngine
+
+MARKER_IMAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "aruco_mission", "target_marker_id_42.png")
+
+
+def publish_from_thread(bridge: DetectionEventBridge, count: int, delay: float, stamps: list) -> threading.Thread:
+    def run():
+        for frame_id in range(1, count + 1):
+            time.sleep(delay)
+            stamps.append(time.monotonic())
+            bridge.publish(PoseEvent(frame_id, stamps[-1], 0.0, 0.0, 1.0, False))
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_next_pose_wakes_within_a_millisecond():
+    async def run():
+        bridge = DetectionEventBridge()
+        bridge.bind()
+        stamps = []
+        thread = publish_from_thread(bridge, 1, 0.05, stamps)
+        event = await bridge.next_pose(timeout=2.0)
+        woke = time.monotonic()
+        thread.join()
+        assert event.frame_id == 1
+        assert woke - stamps[0] < 0.005  # well under one 10 ms polling tick
+    asyncio.run(run())
+
+
+def test_pose_stream_keeps_latest_and_times_out():
+    async def run():
+        bridge = DetectionEventBridge()
+        bridge.bind()
+        stamps = []
+        thread = publish_from_thread(bridge, 5, 0.0, stamps)
+        thread.join()
+        stream = bridge.poses(timeout=0.05)
+        await asyncio.sleep(0)  # start the stream after the burst: nothing queued yet
+        first = await stream.__anext__()
+        assert first is None  # no pose within timeout
+        bridge.publish(PoseEvent(6, time.monotonic(), 0.0, 0.0, 1.0, True))
+        bridge.publish(PoseEvent(7, time.monotonic(), 0.0, 0.0, 1.0, True))
+        latest = await stream.__anext__()
+        assert latest.frame_id == 7
+        await stream.aclose()
+        assert not bridge.queues
+    asyncio.run(run())
+
+
+def test_next_pose_timeout_returns_none():
+    async def run():
+        bridge = DetectionEventBridge()
+        assert await bridge.next_pose(timeout=0.01) is None
+        assert not bridge.waiters
+    asyncio.run(run())
+
+
+def test_wait_found_ignores_pose_from_before_loss():
+    async def run():
+        engine = MarkerDetectionEngine(FrameSource(640, 480), roi_tracking=False)
+        engine.events.bind()
+        marker = cv2.resize(cv2.imread(MARKER_IMAGE, cv2.IMREAD_GRAYSCALE), (480, 480))
+        gray = np.full((480, 640), 255, dtype=np.uint8)
+        gray[:, 80:560] = marker
+        engine.process_frame(gray, time.time())
+        assert (await engine.wait_found(timeout=0.05)) is engine.events.latest is not None
+
+        # Marker lost, then found again before the new pose is published
+        engine.process_frame(np.full((480, 640), 255, dtype=np.uint8), time.time())
+        assert engine.events.latest is None
+        engine.is_found = True
+        assert await engine.wait_found(timeout=0.05) is None
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_next_pose_wakes_within_a_millisecond()
+    test_pose_stream_keeps_latest_and_times_out()
+    test_next_pose_timeout_returns_none()
+    test_wait_found_ignores_pose_from_before_loss()
+    print("Detection event tests passed.")
@@ -0,0 +1,99 @@
+import os
+import queue
+import sys
+import threading
+import time
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.detection_worker import DetectionResult, SharedFrameRing, ProcessDetectionEngine
+
+ARUCO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "aruco_mission")
+
+
+def test_shared_ring_detects_overwritten_slots():
+    ring = SharedFrameRing(64, 48, slots=2)
+    reader = SharedFrameRing(64, 48, slots=2, name=ring.name)
+    try:
+        slot = ring.write(3, np.full((48, 64), 7, dtype=np.uint8))
+        assert reader.read(slot, 3)[0, 0] == 7
+        ring.write(5, np.zeros((48, 64), dtype=np.uint8))  # same slot, newer frame
+        assert reader.read(slot, 3) is None
+        assert ring.write(6, np.zeros((10, 10), dtype=np.uint8)) == -1
+    finally:
+        reader.close()
+        ring.close()
+
+
+def test_worker_process_feeds_filters_in_parent():
+    engine = ProcessDetectionEngine(
+        "images",
+        {"directory": ARUCO_DIR, "patterns": ("target_marker_id_42.png",), "loop": True}
+    )
+    thread = threading.Thread(target=engine.show_camera_with_detection, kwargs={"headless": True})
+    thread.start()
+    try:
+        deadline = time.monotonic() + 20.0
+        while engine.detection_count < 20 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        engine.stop_camera()
+        thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert engine.detection_count >= 20 and engine.is_found
+    assert engine.latency.histograms["vision"].total >= 20
+    assert engine.kalman.initialized
+
+
+def test_concurrent_stop_camera_stops_once():
+    engine = ProcessDetectionEngine(
+        "images",
+        {"directory": ARUCO_DIR, "patterns": ("target_marker_id_42.png",), "loop": True}
+    )
+    thread = threading.Thread(target=engine.show_camera_with_detection, kwargs={"headless": True})
+    thread.start()
+    deadline = time.monotonic() + 20.0
+    while engine.frame_count < 5 and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    # Mission cleanup from several threads while the consumer's finally also stops the worker
+    errors = []
+
+    def stop():
+        try:
+            engine.stop_camera()
+        except Exception as error:
+            errors.append(error)
+    stoppers = [threading.Thread(target=stop) for _ in range(4)]
+    for stopper in stoppers:
+        stopper.start()
+    for stopper in stoppers:
+        stopper.join(timeout=15)
+    thread.join(timeout=10)
+    assert not errors, errors
+    assert not thread.is_alive()
+    assert engine.process is None and engine.ring is None
+
+
+def test_consumer_skips_to_latest_result():
+    results = queue.Queue()
+    stale = [DetectionResult(frame_id, -1, float(frame_id), 0.0, 0.0) for frame_id in range(5)]
+    for result in stale[1:]:
+        results.put(result)
+    # A consumer that fell behind applies only the newest pose, not the backlog
+    latest, skipped, status = ProcessDetectionEngine.latest_result(results, stale[0])
+    assert latest is stale[-1] and skipped == 4 and status is None
+    assert results.empty()
+
+    results.put(stale[1])
+    results.put("finished")
+    latest, skipped, status = ProcessDetectionEngine.latest_result(results, stale[0])
+    assert latest is stale[1] and skipped == 1 and status == "finished"
+
+
+if __name__ == "__main__":
+    test_shared_ring_detects_overwritten_slots()
+    test_worker_process_feeds_filters_in_parent()
+    test_concurrent_stop_camera_stops_once()
+    test_consumer_skips_to_latest_result()
+    print("Detection worker tests passed.")
@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import cv2
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.detector_profile import (DEFAULT_PROFILE, create_detector_parameters, load_detector_profile,
+                                            save_detector_profile, threshold_windows)
+from aruco_mission.detector_tuner import bootstrap_labels, candidate_profiles, pareto_front, tune
+
+
+def make_frames(count=6) -> list:
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+    rng = np.random.default_rng(0)
+    background = cv2.GaussianBlur(rng.integers(60, 200, (240, 320), dtype=np.uint8), (7, 7), 0)
+    frames = []
+    for i in range(count):
+        gray = background.copy()
+        if i % 3:
+            marker = cv2.copyMakeBorder(cv2.aruco.generateImageMarker(aruco_dict, 42, 60), 10, 10, 10, 10,
+                                        cv2.BORDER_CONSTANT, value=255)
+            gray[20 * i:20 * i + 80, 30 * i:30 * i + 80] = marker
+        frames.append(gray)
+    return frames
+
+
+def test_profile_round_trip():
+    profile = dict(DEFAULT_PROFILE, adaptiveThreshWinSizeMax=13)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "detector_profile.json")
+        save_detector_profile(path, profile, {"ms_per_frame": 1.0})
+        loaded = load_detector_profile(path)
+    assert loaded == profile
+    assert threshold_windows(loaded) == [3, 13]
+    assert create_detector_parameters(loaded).adaptiveThreshWinSizeMax == 13
+
+
+def test_candidates_skip_duplicate_windows():
+    space = {"adaptiveThreshWinSizeMin": (3,), "adaptiveThreshWinSizeMax": (3, 5, 6), "adaptiveThreshWinSizeStep": (4,)}
+    windows = [tuple(threshold_windows(profile)) for profile in candidate_profiles(space)]
+    assert windows == [(3,)]  # 5 and 6 add no window with step 4
+
+
+def test_pareto_front_keeps_only_undominated():
+    results = [{"ms_per_frame": ms, "detection_rate": rate} for ms, rate in
+               ((1.0, 0.80), (2.0, 0.95), (2.5, 0.90), (3.0, 0.95), (4.0, 1.0))]
+    front = pareto_front(results)
+    assert [(r["ms_per_frame"], r["detection_rate"]) for r in front] == [(1.0, 0.80), (2.0, 0.95), (4.0, 1.0)]
+
+
+def test_tune_never_picks_lower_rate_than_current_profile():
+    frames = make_frames()
+    labels = bootstrap_labels(frames)
+    assert [bool(ids) for ids in labels] == [False, True, True, False, True, True]
+    space = {"adaptiveThreshWinSizeMin": (3,), "adaptiveThreshWinSizeMax": (3, 23), "adaptiveThreshWinSizeStep": (10,)}
+    baseline, results, front, chosen = tune(frames, labels, search_space=space, repeat=1)
+    assert len(results) == 2
+    assert chosen["detection_rate"] >= baseline["detection_rate"] == 1.0
+    assert chosen in front
+
+
+if __name__ == "__main__":
+    test_profile_round_trip()
+    test_candidates_skip_duplicate_windows()
+    test_pareto_front_keeps_only_undominated()
+    test_tune_never_picks_lower_rate_than_current_profile()
+    print("Detector tuner tests passed.")
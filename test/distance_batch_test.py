@@ -0,0 +1,60 @@
+import os
+import sys
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.distance_calculation import CalculateDistance
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    lat1, lon1 = rng.uniform(-80, 80, 300), rng.uniform(-180, 180, 300)
+    lat2, lon2 = rng.uniform(-80, 80, 300), rng.uniform(-180, 180, 300)
+    # Mission-scale pairs, a coincident pair and a near-antipodal pair (scalar fallback)
+    lat2[:100] = lat1[:100] + rng.normal(0, 0.003, 100)
+    lon2[:100] = lon1[:100] + rng.normal(0, 0.003, 100)
+    lat2[100], lon2[100] = lat1[100], lon1[100]
+    lat1[101], lon1[101], lat2[101], lon2[101] = 10.0, 20.0, -10.0, -159.9
+    north, east, distance, azimuth = CalculateDistance.get_lat_lon_distance_batch(lat1, lon1, lat2, lon2)
+    expected = np.array([CalculateDistance.get_lat_lon_distance(*args) for args in zip(lat1, lon1, lat2, lon2)])
+    assert np.abs(distance[:100] - expected[:100, 2]).max() < 1e-6
+    assert np.abs(north - expected[:, 0]).max() < 2e-3
+    assert np.abs(east - expected[:, 1]).max() < 2e-3
+    assert np.abs(distance - expected[:, 2]).max() < 2e-3
+    assert distance[100] == 0.0
+    turn = np.array([CalculateDistance.get_turn_angle(*args) for args in zip(lat1[:100], lon1[:100], lat2[:100], lon2[:100])])
+    assert np.allclose(np.radians(azimuth[:100]), turn, atol=1e-8)
+
+
+def test_batch_broadcasts_scalar_origin():
+    lats = np.array([41.0, 41.001, 41.002])
+    lons = np.array([29.0, 29.0, 29.001])
+    north, east, distance, _ = CalculateDistance.get_lat_lon_distance_batch(41.0, 29.0, lats, lons)
+    assert distance.shape == (3,)
+    assert distance[0] == 0.0
+    assert np.isclose(distance[1], CalculateDistance.get_lat_lon_distance(41.0, 29.0, 41.001, 29.0)[2])
+
+
+def test_distance_matrix():
+    rng = np.random.default_rng(1)
+    lats, lons = rng.uniform(41.0, 41.01, 40), rng.uniform(29.0, 29.01, 40)
+    matrix = CalculateDistance.distance_matrix(lats, lons, block_size=16)
+    assert matrix.shape == (40, 40)
+    assert np.array_equal(matrix, matrix.T)
+    assert not matrix.diagonal().any()
+    for i, j in ((0, 39), (17, 3), (20, 21)):
+        assert np.isclose(matrix[i, j], CalculateDistance.get_lat_lon_distance(lats[i], lons[i], lats[j], lons[j])[2],
+                          rtol=0, atol=1e-6)
+
+
+def test_vectors_batch():
+    north, east = CalculateDistance.find_vectors_batch([10.0, 5.0], [90.0, 0.0])
+    assert np.allclose(north, (0.0, 5.0)) and np.allclose(east, (10.0, 0.0))
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_batch_broadcasts_scalar_origin()
+    test_distance_matrix()
+    test_vectors_batch()
+    print("Distance batch tests passed.")
@@ -0,0 +1,154 @@
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_reader import YUVFrameRing
+from aruco_mission.frame_source import LibcameraFifoSource
+
+
+WIDTH, HEIGHT = 640, 480
+
+
+class ChunkedPipe(io.RawIOBase):
+    """
+    In-memory FIFO stand-in that returns short reads like a real pipe.
+    """
+    def __init__(self, data: bytes, chunk_size: int = 65536):
+        self.stream = io.BytesIO(data)
+        self.chunk_size = chunk_size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        with memoryview(buffer) as view:
+            return self.stream.readinto(view[:self.chunk_size])
+
+
+def make_frames(count: int) -> bytes:
+    frame_size = WIDTH * HEIGHT * 3 // 2
+    return b"".join(bytes([i % 256]) * frame_size for i in range(count))
+
+
+def test_frames_are_read_into_ring_slots():
+    ring = YUVFrameRing(WIDTH, HEIGHT, slots=3)
+    pipe = ChunkedPipe(make_frames(5))
+    frames = [ring.read_frame(pipe) for _ in range(5)]
+    assert all(frame.shape == (HEIGHT * 3 // 2, WIDTH) for frame in frames)
+    assert frames[0] is frames[3] and frames[1] is frames[4]
+    assert frames[4][0, 0] == 4
+    assert ring.read_frame(pipe) is None
+    assert ring.frame_count == 5
+
+
+def test_partial_trailing_frame_is_dropped():
+    ring = YUVFrameRing(WIDTH, HEIGHT, slots=2)
+    data = make_frames(1)
+    pipe = ChunkedPipe(data + data[:1000])
+    assert ring.read_frame(pipe) is not None
+    assert ring.read_frame(pipe) is None
+
+
+def test_steady_state_reads_allocate_no_frames():
+    ring = YUVFrameRing(WIDTH, HEIGHT, slots=4)
+    pipe = ChunkedPipe(make_frames(64))
+    for _ in range(8):  # warm-up
+        ring.read_frame(pipe)
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(56):
+            frame = ring.read_frame(pipe)
+            assert isinstance(frame, np.ndarray)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Only short-lived memoryview slices are created, never a frame buffer
+    frame_size = WIDTH * HEIGHT * 3 // 2
+    assert peak - baseline < 4096 < frame_size
+    assert current - baseline < 4096
+    assert ring.allocations == 4
+
+
+def test_managed_ring_never_writes_held_slots():
+    ring = YUVFrameRing(WIDTH, HEIGHT, slots=2, managed=True)
+    pipe = ChunkedPipe(make_frames(3))
+    first, second = ring.read_frame(pipe), ring.read_frame(pipe)
+    ring.release(first)
+    third = ring.read_frame(pipe)
+    assert third is first and second[0, 0] == 1 and third[0, 0] == 2
+
+
+def test_slow_consumer_frames_are_not_overwritten():
+    frame_count = 60
+    with tempfile.TemporaryDirectory() as directory:
+        pipe_path = os.path.join(directory, "camera_pipe")
+        os.mkfifo(pipe_path)
+        source = LibcameraFifoSource(WIDTH, HEIGHT, pipe_path=pipe_path, queue_size=2)
+        source.running = True
+        reader = threading.Thread(target=source.read_frames_thread, args=(pipe_path,), daemon=True)
+        reader.start()
+
+        def write_frames():
+            # Camera keeps streaming while the consumer is busy
+            with open(pipe_path, "wb") as pipe:
+                for i in range(frame_count):
+                    pipe.write(bytes([i % 256]) * (WIDTH * HEIGHT * 3 // 2))
+        writer = threading.Thread(target=write_frames, daemon=True)
+        writer.start()
+
+        received = []
+        while writer.is_alive() or not source.frame_queue.empty():
+            frame = source.read(timeout=0.5)
+            if frame is None:
+                continue
+            value = int(frame.yuv[0, 0])
+            time.sleep(0.02)  # Detection/recording slower than the camera
+            # Whole handed-out frame still holds what was captured
+            assert np.all(frame.yuv == value) and np.all(frame.gray == value)
+            received.append(value)
+        writer.join()
+        source.running = False
+        reader.join(timeout=2)
+
+    # Frames were dropped from the queue, never overwritten in the consumer's hands
+    assert received == sorted(received) and received[-1] == frame_count - 1
+    assert len(received) < frame_count
+
+
+def test_close_returns_every_slot_to_the_ring():
+    with tempfile.TemporaryDirectory() as directory:
+        pipe_path = os.path.join(directory, "camera_pipe")
+        os.mkfifo(pipe_path)
+        source = LibcameraFifoSource(WIDTH, HEIGHT, pipe_path=pipe_path, queue_size=2)
+        source.running = True
+        reader = threading.Thread(target=source.read_frames_thread, args=(pipe_path,), daemon=True)
+        reader.start()
+        with open(pipe_path, "wb") as pipe:
+            for i in range(6):
+                pipe.write(bytes([i]) * (WIDTH * HEIGHT * 3 // 2))
+        reader.join(timeout=2)
+        assert source.read(timeout=0.5) is not None  # Held by the consumer
+        assert not source.frame_queue.empty()
+
+        source.close()
+        # Queued and held frames are released: nothing stays blocked or lost on reopen
+        assert source.frame_ring.free_slots.qsize() == source.frame_ring_slots
+        assert source.consumer_frame is None
+
+
+if __name__ == "__main__":
+    test_frames_are_read_into_ring_slots()
+    test_partial_trailing_frame_is_dropped()
+    test_steady_state_reads_allocate_no_frames()
+    test_managed_ring_never_writes_held_slots()
+    test_slow_consumer_frames_are_not_overwritten()
+    test_close_returns_every_slot_to_the_ring()
+    print("Frame reader tests passed.")
@@ -0,0 +1,30 @@
+"""
+Shared geometry checks for the coverage planner and area partitioner tests (local north/east metres).
+"""
+import numpy as np
+
+U_SHAPE = [(0, 0), (0, 60), (40, 60), (40, 45), (10, 45), (10, 15), (40, 15), (40, 0)]
+
+
+def inside(point, polygon) -> bool:
+    """Even-odd point-in-polygon test"""
+    n, e = point
+    result = False
+    for (n1, e1), (n2, e2) in zip(polygon, polygon[1:] + polygon[:1]):
+        if (e1 <= e < e2) or (e2 <= e < e1):
+            if n < n1 + (e - e1) * (n2 - n1) / (e2 - e1):
+                result = not result
+    return result
+
+
+def segment_distance(point, a, b) -> float:
+    """Distance from point to the segment a-b"""
+    p, a, b = np.asarray(point, float), np.asarray(a, float), np.asarray(b, float)
+    ab = b - a
+    t = 0.0 if not ab.any() else np.clip(np.dot(p - a, ab) / np.dot(ab, ab), 0.0, 1.0)
+    return float(np.linalg.norm(p - (a + t * ab)))
+
+
+def path_distance(point, waypoints) -> float:
+    """Distance from point to the nearest segment of the waypoint path"""
+    return min(segment_distance(point, a, b) for a, b in zip(waypoints, waypoints[1:]))
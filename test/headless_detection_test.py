@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import time
+import cv2
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_source import ImageDirectorySource
+from aruco_mission.marker_detection import MarkerDetectionEngine
+
+ARUCO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "aruco_mission")
+WINDOW_CALLS = ("namedWindow", "imshow", "waitKey", "destroyAllWindows")
+
+
+class WindowSpy:
+    """Replaces the OpenCV window functions and counts their calls"""
+
+    def __enter__(self):
+        self.calls = {name: 0 for name in WINDOW_CALLS}
+        self.originals = {name: getattr(cv2, name) for name in WINDOW_CALLS}
+        for name in WINDOW_CALLS:
+            setattr(cv2, name, self.recorder(name))
+        return self
+
+    def recorder(self, name):
+        def record(*args, **kwargs):
+            self.calls[name] += 1
+            return -1  # waitKey: no key pressed
+        return record
+
+    def __exit__(self, *exc):
+        for name, function in self.originals.items():
+            setattr(cv2, name, function)
+
+
+def create_engine() -> tuple[MarkerDetectionEngine, list]:
+    source = ImageDirectorySource(ARUCO_DIR, patterns=("target_marker_id_42.png",), loop=True)
+    engine = MarkerDetectionEngine(source, roi_tracking=False)
+    overlays = []
+    draw_overlay = engine.draw_overlay
+
+    def counting_overlay(*args):
+        overlays.append(time.monotonic())
+        return draw_overlay(*args)
+    engine.draw_overlay = counting_overlay
+    return engine, overlays
+
+
+def run_for(engine: MarkerDetectionEngine, duration: float, **kwargs) -> float:
+    """Run the detection loop in a thread for duration seconds; returns the measured run time"""
+    thread = threading.Thread(target=engine.show_camera_with_detection, kwargs=kwargs)
+    start = time.monotonic()
+    thread.start()
+    time.sleep(duration)
+    engine.stop_camera()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    return time.monotonic() - start
+
+
+def test_headless_never_touches_windows():
+    engine, overlays = create_engine()
+    with WindowSpy() as spy:
+        run_for(engine, 0.5, headless=True)
+    assert engine.frame_count > 5 and engine.detection_count == engine.frame_count
+    assert spy.calls == {name: 0 for name in WINDOW_CALLS}
+    assert not overlays
+
+
+def test_overlay_rate_is_capped():
+    engine, overlays = create_engine()
+    overlay_fps = 5
+    with WindowSpy() as spy:
+        elapsed = run_for(engine, 1.0, headless=False, overlay_fps=overlay_fps)
+    # Detection runs on every frame, drawing and imshow at most overlay_fps times per second
+    assert len(overlays) <= overlay_fps * elapsed + 1
+    assert engine.frame_count > 2 * len(overlays)
+    assert spy.calls["imshow"] == spy.calls["waitKey"] == len(overlays) > 0
+    assert all(later - earlier >= 1.0 / overlay_fps - 0.01 for earlier, later in zip(overlays, overlays[1:]))
+
+
+if __name__ == "__main__":
+    test_headless_never_touches_windows()
+    test_overlay_rate_is_capped()
+    print("Headless detection tests passed.")
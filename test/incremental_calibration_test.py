@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import cv2
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission import auto_camera_calibration
+from aruco_mission.calibration_store import load_calibration
+from aruco_mission.incremental_calibration import IncrementalCalibrator
+
+CAMERA_MATRIX = np.array([[600.0, 0.0, 320.0], [0.0, 600.0, 240.0], [0.0, 0.0, 1.0]])
+DIST_COEFFS = np.array([0.05, -0.1, 0.0, 0.0, 0.0])
+OBJECT_POINTS = np.zeros((54, 3), np.float32)
+OBJECT_POINTS[:, :2] = np.mgrid[0:9, 0:6].T.reshape(-1, 2) * 0.025
+
+
+def synthetic_views(count, noise_px=0.1, seed=0) -> list:
+    """Tilted board views spread over the image, projected with a known camera"""
+    rng = np.random.default_rng(seed)
+    views = []
+    for _ in range(count):
+        rvec = rng.uniform(-0.5, 0.5, 3)
+        tvec = np.array([rng.uniform(-0.15, 0.0), rng.uniform(-0.1, 0.0), rng.uniform(0.4, 0.7)])
+        points, _ = cv2.projectPoints(OBJECT_POINTS, rvec, tvec, CAMERA_MATRIX, DIST_COEFFS)
+        views.append((points + rng.normal(0.0, noise_px, points.shape)).astype(np.float32))
+    return views
+
+
+def test_outlier_view_is_culled():
+    views = synthetic_views(12)
+    rng = np.random.default_rng(1)
+    views[5] = views[5] + rng.normal(0.0, 4.0, views[5].shape).astype(np.float32)  # blurred/misdetected board
+
+    calibrator = IncrementalCalibrator(OBJECT_POINTS, (640, 480), min_views=10)
+    for i, view in enumerate(views):
+        calibrator.add_view(view, key=i, recalibrate=False)
+    rms, camera_matrix, _ = calibrator.calibrate()
+
+    assert [key for key, _ in calibrator.rejected] == [5]
+    assert rms < 0.2
+    assert abs(camera_matrix[0, 0] - 600.0) < 6.0
+    assert set(calibrator.view_errors) == set(range(12)) - {5}
+
+
+def test_stops_once_intrinsics_converge():
+    calibrator = IncrementalCalibrator(OBJECT_POINTS, (640, 480), min_views=10)
+    used = 0
+    for view in synthetic_views(40, seed=2):
+        calibrator.add_view(view)
+        used += 1
+        if calibrator.converged:
+            break
+    assert calibrator.converged
+    assert used < 40
+    assert abs(calibrator.camera_matrix[1, 1] - 600.0) < 6.0
+
+
+def test_converged_session_is_saved_without_recalibrating():
+    calibrator = IncrementalCalibrator(OBJECT_POINTS, (640, 480), min_views=10)
+    for i, view in enumerate(synthetic_views(40, seed=2)):
+        calibrator.add_view(view, key=f"calibration_{i:02d}.jpg")
+        if calibrator.converged:
+            break
+    calibration_count = calibrator.calibration_count
+
+    original_file = auto_camera_calibration.CALIBRATION_FILE
+    original_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        auto_camera_calibration.CALIBRATION_FILE = os.path.join(directory, "camera_calibration.npz")
+        # AutoCameraCalibration creates calibration_images/ in the working directory
+        os.chdir(directory)
+        try:
+            camera_matrix, dist_coeffs = auto_camera_calibration.AutoCameraCalibration().save_calibrator_result(calibrator)
+            saved = load_calibration(auto_camera_calibration.CALIBRATION_FILE)
+        finally:
+            os.chdir(original_directory)
+            auto_camera_calibration.CALIBRATION_FILE = original_file
+
+    # The accepted result is written as is: no extra calibrateCamera run
+    assert calibrator.calibration_count == calibration_count
+    assert camera_matrix is calibrator.camera_matrix and dist_coeffs is calibrator.dist_coeffs
+    assert np.allclose(saved.camera_matrix, calibrator.camera_matrix)
+    assert np.allclose(saved.dist_coeffs, calibrator.dist_coeffs.reshape(1, -1))
+    assert saved.calibration_error == calibrator.rms and saved.image_size == (640, 480)
+
+
+if __name__ == "__main__":
+    test_outlier_view_is_culled()
+    test_stops_once_intrinsics_converge()
+    test_converged_session_is_saved_without_recalibrating()
+    print("Incremental calibration tests passed.")
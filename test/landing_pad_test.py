@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+import cv2
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.frame_source import FrameSource
+from aruco_mission.landing_pad import LandingPad, PadMarker, NESTED_LANDING_PAD, marker_side_px
+from aruco_mission.marker_detection import MarkerDetectionEngine
+from optimization.drone_vision_calculator import DroneVisionCalculator
+
+DICTIONARY = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+PAD_IMAGE = NESTED_LANDING_PAD.create_image(DICTIONARY, pixels_per_meter=1000)
+
+
+def render(outer_px, width=640, height=480) -> np.ndarray:
+    """Pad centred in a grey frame with its outer marker outer_px pixels wide (cropped if larger)"""
+    scale = outer_px / (NESTED_LANDING_PAD.outer.size * 1000)
+    pad = cv2.resize(PAD_IMAGE, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    frame = np.full((height, width), 128, dtype=np.uint8)
+    # Overlap of the pad and the frame, both centred
+    h, w = min(height, pad.shape[0]), min(width, pad.shape[1])
+    py, px = (pad.shape[0] - h) // 2, (pad.shape[1] - w) // 2
+    fy, fx = (height - h) // 2, (width - w) // 2
+    frame[fy:fy + h, fx:fx + w] = pad[py:py + h, px:px + w]
+    return frame
+
+
+def create_engine() -> MarkerDetectionEngine:
+    return MarkerDetectionEngine(FrameSource(640, 480), roi_tracking=False, landing_pad=NESTED_LANDING_PAD)
+
+
+def test_switches_to_inner_marker_while_descending():
+    engine = create_engine()
+    selected = {}
+    for outer_px in (100, 200, 600, 1500):
+        detection = engine.process_frame(render(outer_px), time.time())
+        selected[outer_px] = detection['marker_id']
+        marker = NESTED_LANDING_PAD.by_id[detection['marker_id']]
+        # Both markers give the same pad depth: f * size / side
+        expected_z = engine.camera_matrix[0, 0] * marker.size / marker_side_px(detection['corners'][0])
+        assert abs(detection['position'][2] - expected_z) / expected_z < 0.05
+    # Inner marker is 10-20 px (below min_side_px) in the first two frames; outer is cropped later
+    assert selected == {100: 43, 200: 43, 600: 42, 1500: 42}
+    assert engine.active_marker_id == 42
+
+
+def test_reveals_outer_marker_hidden_by_inner():
+    engine = create_engine()
+    gray = render(250)
+    _, ids, _ = engine.detector.detectMarkers(gray)
+    # OpenCV drops the outer marker once it decodes the one nested inside it
+    assert set(ids.reshape(-1)) == {42}
+    assert engine.process_frame(gray, time.time())['marker_id'] == 43
+
+
+def test_single_marker_pad_keeps_old_behaviour():
+    engine = MarkerDetectionEngine(FrameSource(640, 480), roi_tracking=False)
+    assert engine.landing_pad.ids == (42,)
+    engine.update_marker_size(0.1)
+    assert engine.landing_pad.outer.size == 0.1
+
+
+def test_pad_position_applies_marker_offset():
+    pad = LandingPad([PadMarker(43, 0.5), PadMarker(7, 0.05, offset=(0.1, 0.0))])
+    marker = pad.by_id[7]
+    rvec = np.array([0.0, 0.0, np.pi / 2])  # Marker x axis along camera y
+    position = pad.pad_position(marker, rvec, np.array([0.0, 0.0, 2.0]))
+    assert np.allclose(position, (0.0, -0.1, 2.0))
+    assert pad.pad_position(pad.outer, rvec, (0.0, 0.0, 2.0)) == (0.0, 0.0, 2.0)
+
+
+def test_detectable_swath_width():
+    calculator = DroneVisionCalculator(camera_fov_horizontal=90, image_width=1920)
+    # f = 960 px: a 5 cm marker is under 20 px beyond 2.4 m
+    assert calculator.detectable_swath_width(10, 0.05) == 0.0
+    # 50 cm marker is resolvable across the whole 20 m footprint at 10 m
+    assert np.isclose(calculator.detectable_swath_width(10, 0.5), 20.0)
+    # Slant range limit: sqrt(24^2 - 20^2) on each side at 20 m
+    assert np.isclose(calculator.detectable_swath_width(20, 0.5), 2 * np.sqrt(24 ** 2 - 20 ** 2))
+
+
+def test_overlay_labels_marker_id_zero():
+    engine = MarkerDetectionEngine(FrameSource(640, 480), roi_tracking=False,
+                                   landing_pad=LandingPad([PadMarker(43, 0.5), PadMarker(0, 0.05)]))
+    corners = np.array([[[300, 220], [340, 220], [340, 260], [300, 260]]], dtype=np.float32)
+    detection = {'marker_id': 0, 'ids': np.array([[0]]), 'corners': [corners], 'rvecs': None, 'tvecs': None}
+    drawn = []
+    draw_markers = cv2.aruco.drawDetectedMarkers
+    cv2.aruco.drawDetectedMarkers = lambda image, corners, ids: drawn.append(ids.copy())
+    try:
+        engine.draw_overlay(np.zeros((480, 640, 3), dtype=np.uint8), detection, time.time())
+    finally:
+        cv2.aruco.drawDetectedMarkers = draw_markers
+    assert drawn[0].tolist() == [[0]]
+
+
+if __name__ == "__main__":
+    test_switches_to_inner_marker_while_descending()
+    test_reveals_outer_marker_hidden_by_inner()
+    test_single_marker_pad_keeps_old_behaviour()
+    test_pad_position_applies_marker_offset()
+    test_detectable_swath_width()
+    test_overlay_labels_marker_id_zero()
+    print("Landing pad tests passed.")
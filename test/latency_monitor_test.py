@@ -0,0 +1,59 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.latency_monitor import LatencyHistogram, LatencyMonitor, print_report
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram(bin_ms=1.0, max_ms=100.0)
+    for ms in range(1, 101):
+        histogram.add((ms - 0.5) / 1000.0)
+    assert histogram.percentile(50) == 50.0
+    assert histogram.percentile(95) == 95.0
+    histogram.add(2.0)  # 2 s -> overflow bin
+    assert histogram.counts[-1] == 1
+    assert histogram.percentile(100) == 2000.0
+
+
+def test_frame_and_command_are_correlated_and_saved():
+    monitor = LatencyMonitor()
+    # capture 10.000, detect 10.020-10.030, pose ready 10.032, setpoint 10.050
+    monitor.record_frame(7, 10.000, 10.020, 10.030, 10.032)
+    monitor.record_command(7, 10.000, 10.032, 10.050, "landing")
+    summary = monitor.summary()
+    assert summary["queue"]["count"] == 1 and summary["end_to_end"]["count"] == 1
+    assert 49.0 < summary["end_to_end"]["mean"] < 51.0
+    assert 31.0 < summary["vision"]["mean"] < 33.0
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "latency.json")
+        monitor.save(path)
+        loaded = LatencyMonitor.load(path)
+    assert loaded.summary() == summary
+    assert list(loaded.events) == list(monitor.events)
+
+
+def test_report_rows_are_labelled_in_grouped_ms():
+    monitor = LatencyMonitor()
+    # 16 bins of 3 ms: not a multiple of the 3-bin (9 ms) report group
+    histogram = monitor.histograms["end_to_end"] = LatencyHistogram(bin_ms=3.0, max_ms=50.0)
+    histogram.add(0.047)  # bin 15 -> group 45-54 ms
+    histogram.add(1.0)    # overflow
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        print_report(monitor)
+    rows = [line.split() for line in output.getvalue().split("end_to_end histogram")[1].splitlines() if "#" in line]
+    assert rows[0][0] == "45-54" and rows[0][-1] == "1"
+    assert rows[1][0] == ">50" and rows[1][-1] == "1"
+    assert len(rows) == 2
+
+
+if __name__ == "__main__":
+    test_histogram_percentiles()
+    test_frame_and_command_are_correlated_and_saved()
+    test_report_rows_are_labelled_in_grouped_ms()
+    print("Latency monitor tests passed.")
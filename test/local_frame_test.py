@@ -0,0 +1,59 @@
+import math
+import os
+import random
+import sys
+from geographiclib.geodesic import Geodesic
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.local_frame import LocalFrame, MAX_ERROR_1KM
+
+
+def random_point(frame: LocalFrame, radius: float, rng: random.Random) -> tuple[float, float]:
+    g = Geodesic.WGS84.Direct(frame.origin_lat, frame.origin_lon, rng.uniform(0, 360),
+                              radius * math.sqrt(rng.random()))
+    return g['lat2'], g['lon2']
+
+
+def test_distance_error_bound_against_geographiclib():
+    rng = random.Random(0)
+    worst = 0.0
+    for origin_lat in range(-70, 71, 10):
+        frame = LocalFrame(origin_lat + 0.37, 29.1)
+        for _ in range(100):
+            lat1, lon1 = random_point(frame, 1000, rng)
+            lat2, lon2 = random_point(frame, 1000, rng)
+            expected = Geodesic.WGS84.Inverse(lat1, lon1, lat2, lon2)['s12']
+            worst = max(worst, abs(frame.distance(lat1, lon1, lat2, lon2)[2] - expected))
+    assert worst < MAX_ERROR_1KM, worst
+
+
+def test_north_east_matches_geodesic_azimuth():
+    frame = LocalFrame(41.0151, 28.9795)
+    g = Geodesic.WGS84.Direct(frame.origin_lat, frame.origin_lon, 30.0, 500.0)
+    north, east = frame.to_north_east(g['lat2'], g['lon2'])
+    assert abs(north - 500.0 * math.cos(math.radians(30.0))) < 1e-3
+    assert abs(east - 500.0 * math.sin(math.radians(30.0))) < 1e-3
+
+
+def test_round_trip():
+    frame = LocalFrame(-33.86, 151.21)
+    for north, east in ((0.0, 0.0), (350.0, -120.0), (-800.0, 640.0)):
+        lat, lon = frame.to_lat_lon(north, east)
+        back = frame.to_north_east(lat, lon)
+        assert math.hypot(back[0] - north, back[1] - east) < 1e-6
+
+
+def test_wraps_antimeridian():
+    frame = LocalFrame(-17.7, 179.9995)
+    g = Geodesic.WGS84.Direct(frame.origin_lat, frame.origin_lon, 90.0, 200.0)
+    north, east = frame.to_north_east(g['lat2'], g['lon2'])
+    assert g['lon2'] < 0
+    assert abs(east - 200.0) < 1e-3 and abs(north) < 1e-3
+
+
+if __name__ == "__main__":
+    test_distance_error_bound_against_geographiclib()
+    test_north_east_matches_geodesic_azimuth()
+    test_round_trip()
+    test_wraps_antimeridian()
+    print("Local frame tests passed.")
@@ -0,0 +1,55 @@
+import os
+import sys
+import cv2
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.pose_engine import PoseEngine, marker_object_points
+
+CAMERA_MATRIX = np.array([[500.0, 0.0, 320.0], [0.0, 500.0, 240.0], [0.0, 0.0, 1.0]], dtype=np.float32)
+DIST_COEFFS = np.zeros(5, dtype=np.float32)
+
+
+def project(rvec, tvec, size=0.05) -> np.ndarray:
+    points, _ = cv2.projectPoints(marker_object_points(size), np.asarray(rvec, float), np.asarray(tvec, float),
+                                  CAMERA_MATRIX, DIST_COEFFS)
+    return points.reshape(1, 4, 2).astype(np.float32)
+
+
+def test_matches_estimate_pose_single_markers():
+    corners = [project((0.1, -0.2, 0.3), (0.02, -0.01, 0.6)), project((0.0, 0.1, 1.0), (-0.05, 0.03, 0.4))]
+    old_rvecs, old_tvecs, _ = cv2.aruco.estimatePoseSingleMarkers(corners, 0.05, CAMERA_MATRIX, DIST_COEFFS)
+    rvecs, tvecs = PoseEngine(CAMERA_MATRIX, DIST_COEFFS).estimate_markers(corners, 0.05)
+    assert rvecs.shape == old_rvecs.shape and tvecs.shape == old_tvecs.shape
+    assert np.allclose(tvecs, old_tvecs, atol=1e-4)
+    assert np.allclose(tvecs[1, 0], (-0.05, 0.03, 0.4), atol=1e-4)
+
+
+def test_object_points_are_cached_per_size():
+    assert marker_object_points(0.05) is marker_object_points(0.05)
+    assert np.isclose(marker_object_points(0.2)[1, 0], 0.1)
+
+
+def test_warm_start_keeps_orientation_when_ambiguous():
+    # Far, small marker: IPPE's two mirrored solutions are close in reprojection error
+    true_rvec = np.array([0.25, 0.0, 0.0])
+    flips = {}
+    for warm_start in (False, True):
+        engine = PoseEngine(CAMERA_MATRIX, DIST_COEFFS, warm_start=warm_start)
+        rng = np.random.default_rng(0)
+        flips[warm_start] = 0
+        for _ in range(50):
+            corners = project(true_rvec, (0.0, 0.0, 3.0)) + rng.normal(0.0, 0.3, (1, 4, 2)).astype(np.float32)
+            engine.previous_rvec = true_rvec  # tracked orientation
+            pose = engine.estimate(corners, 0.05)
+            flips[warm_start] += pose.rvec[0] < 0
+    assert flips[False] > 0
+    assert flips[True] == 0
+    assert pose.euler_degrees.shape == (3,)
+
+
+if __name__ == "__main__":
+    test_matches_estimate_pose_single_markers()
+    test_object_points_are_cached_per_size()
+    test_warm_start_keeps_orientation_when_ambiguous()
+    print("Pose engine tests passed.")
@@ -0,0 +1,53 @@
+import os
+import random
+import sys
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aruco_mission.position_filter import PositionRingBuffer, PositionFilter
+
+
+def test_ring_mean_matches_sliding_window():
+    ring = PositionRingBuffer(size=7)
+    window = []
+    rng = random.Random(3)
+    for _ in range(1000):
+        sample = (rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(0.5, 10))
+        ring.append(*sample)
+        window = (window + [sample])[-7:]
+        expected = [sum(axis) / len(window) for axis in zip(*window)]
+        assert all(abs(a - b) < 1e-12 for a, b in zip(ring.mean(), expected))
+    assert len(ring) == 7
+    assert [tuple(row) for row in ring.values()] == window
+
+
+def test_ring_clear_reuses_storage():
+    ring = PositionRingBuffer(size=3)
+    storage = ring.samples
+    for value in range(5):
+        ring.append(value, value, value)
+    ring.clear()
+    assert ring.mean() is None and len(ring) == 0
+    ring.append(1.0, 2.0, 3.0)
+    assert ring.mean() == (1.0, 2.0, 3.0)
+    assert ring.samples is storage
+
+
+def test_centered_after_stable_threshold():
+    position_filter = PositionFilter(buffer_size=4, center_threshold=0.025, stable_threshold=3)
+    position_filter.update(0.5, 0.0, 2.0)
+    assert not position_filter.is_centered
+    for _ in range(20):
+        position_filter.update(0.0, 0.0, 2.0)
+        if position_filter.is_centered:
+            break
+    # Eski 0.5 değeri buffer'dan çıkınca sayım başlar
+    assert position_filter.is_centered
+    position_filter.update(1.0, 1.0, 2.0)
+    assert not position_filter.is_centered and position_filter.stable_count == 0
+
+
+if __name__ == "__main__":
+    test_ring_mean_matches_sliding_window()
+    test_ring_clear_reuses_storage()
+    test_centered_after_stable_threshold()
+    print("Position filter tests passed.")
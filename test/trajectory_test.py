@@ -0,0 +1,89 @@
+import math
+import os
+import sys
+import numpy as np
+# Add parent directory to sys.path for module imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from optimization.trajectory import Trajectory, TrajectoryFollower
+
+# 2 cycles of square_oscillation_by_meters (30 m long, 5 m short legs) heading north
+OSCILLATION = [(0, 0), (30, 0), (30, 5), (0, 5), (0, 10), (30, 10), (30, 15), (0, 15), (0, 20), (30, 20)]
+
+
+def fly(trajectory: Trajectory, period: float = 0.1, steps: int = 10000) -> tuple[np.ndarray, list[float], float]:
+    """Kinematic vehicle that tracks each command exactly; returns track, speeds and time"""
+    follower = TrajectoryFollower(trajectory)
+    position = np.array(trajectory.points[0], dtype=float)
+    track, speeds = [position.copy()], []
+    for step in range(steps):
+        velocity_north, velocity_east, _, done = follower.update(*position)
+        if done:
+            return np.array(track), speeds, step * period
+        position += np.array([velocity_north, velocity_east]) * period
+        track.append(position.copy())
+        speeds.append(math.hypot(velocity_north, velocity_east))
+    raise AssertionError("trajectory not finished")
+
+
+def test_corners_respect_lateral_acceleration():
+    trajectory = Trajectory(OSCILLATION, speed=2.0, max_lateral_accel=1.0)
+    # Curvature from consecutive tangents: a = v^2 * dtheta / ds (chord ds: slightly above the arc value)
+    headings = np.unwrap(np.arctan2(trajectory.tangents[:, 1], trajectory.tangents[:, 0]))
+    curvature = np.abs(np.diff(headings)) / np.maximum(np.diff(trajectory.distances), 1e-9)
+    lateral = trajectory.speeds[:-1] ** 2 * curvature
+    assert lateral.max() <= 1.0 + 1e-3
+    assert trajectory.speeds.max() <= 2.0 + 1e-9
+    # 5 m short legs leave 2.5 m per corner: radius 2.5 m instead of v^2/a = 4 m
+    assert math.isclose(trajectory.limits[trajectory.limits > 0].min(), math.sqrt(2.5), rel_tol=1e-9)
+
+
+def test_never_stops_between_start_and_end():
+    trajectory = Trajectory(OSCILLATION, speed=2.0, max_lateral_accel=1.0, max_accel=1.0)
+    inner = trajectory.speeds[(trajectory.distances > 2.0) & (trajectory.distances < trajectory.length - 2.0)]
+    assert inner.min() >= math.sqrt(2.5) - 1e-9
+    assert trajectory.speeds[0] == 0.0 and trajectory.speeds[-1] == 0.0
+    # Accelerations stay within the limit: v^2 changes by at most 2 * a * ds
+    assert np.all(np.abs(np.diff(trajectory.speeds ** 2)) <= 2 * 1.0 * np.diff(trajectory.distances) + 1e-9)
+
+
+def test_follower_tracks_path_without_stopping():
+    trajectory = Trajectory(OSCILLATION, speed=2.0)
+    track, speeds, elapsed = fly(trajectory)
+    # Ends at the last waypoint, stays within the rounded corners of the polyline
+    assert math.dist(track[-1], OSCILLATION[-1]) < 1.0
+    assert min(speeds[5:-5]) > 1.0
+    assert np.all(track[:, 0] > -1.0) and np.all(track[:, 0] < 31.0)
+    # Close to the profile estimate (lookahead start and goal tolerance shave ~2 s); stop-and-hold needs at least the cruise time plus 9 one-second holds
+    assert abs(elapsed - trajectory.duration) < 3.0
+    assert elapsed < trajectory.length / 2.0 + 9 * 1.0
+
+
+def test_follower_does_not_jump_to_neighbouring_lane():
+    trajectory = Trajectory(OSCILLATION, speed=2.0)
+    follower = TrajectoryFollower(trajectory)
+    follower.update(0.0, 0.0)
+    # Drifted next to the returning lane: progress must stay on the first lane
+    follower.update(10.0, 4.0)
+    assert follower.progress < 15.0
+
+
+def test_straight_line_and_validation():
+    trajectory = Trajectory([(0, 0), (10, 0), (20, 0)], speed=2.0, max_accel=1.0)
+    assert math.isclose(trajectory.length, 20.0)
+    # Accelerate 2 s (2 m), cruise 16 m (8 s), decelerate 2 s (2 m)
+    assert abs(trajectory.duration - 12.0) < 0.1
+    try:
+        Trajectory([(1, 1), (1, 1)], speed=1.0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("degenerate trajectory accepted")
+
+
+if __name__ == "__main__":
+    test_corners_respect_lateral_acceleration()
+    test_never_stops_between_start_and_end()
+    test_follower_tracks_path_without_stopping()
+    test_follower_does_not_jump_to_neighbouring_lane()
+    test_straight_line_and_validation()
+    print("Trajectory tests passed.")